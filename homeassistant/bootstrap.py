@@ -17,10 +17,11 @@ from homeassistant.const import (
     REQUIRED_NEXT_PYTHON_VER,
 )
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.setup import async_setup_component
 from homeassistant.util.logging import AsyncHandler
 from homeassistant.util.package import async_get_user_site, is_virtual_env
-from homeassistant.util.yaml import clear_secret_cache
+from homeassistant.util.yaml import clear_secret_cache, enable_cache
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -141,6 +142,9 @@ async def async_from_config_file(
 
     await hass.async_add_executor_job(conf_util.process_ha_config_upgrade, hass)
 
+    # Unchanged YAML files are not parsed again on restarts and reloads
+    enable_cache(hass.config.path(STORAGE_DIR, conf_util.YAML_CACHE_FILE), config_path)
+
     try:
         config_dict = await hass.async_add_executor_job(
             conf_util.load_yaml_config_file, config_path
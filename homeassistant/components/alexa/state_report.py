@@ -7,6 +7,8 @@ import aiohttp
 import async_timeout
 
 from homeassistant.const import MATCH_ALL, STATE_ON
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
 import homeassistant.util.dt as dt_util
 
 from .const import API_CHANGE, Cause
@@ -16,17 +18,32 @@ from .messages import AlexaResponse
 _LOGGER = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 10
 
+# Seconds to collect state changes before reporting them
+REPORT_STATE_WINDOW = 1
+
 
 async def async_enable_proactive_mode(hass, smart_home_config):
     """Enable the proactive mode.
 
     Proactive mode makes this component report state changes to Alexa.
+    Changes are collected for REPORT_STATE_WINDOW seconds, so an entity
+    that changes multiple times is only reported once.
     """
     # Validate we can get access token.
     await smart_home_config.async_get_access_token()
 
-    async def async_entity_state_listener(changed_entity, old_state, new_state):
+    # The last properties reported for each entity
+    reported = {}
+    # Entities waiting to be reported
+    pending = {}
+    unsub_pending = None
+
+    @callback
+    def async_entity_state_listener(changed_entity, old_state, new_state):
+        nonlocal unsub_pending
+
         if not new_state:
+            reported.pop(changed_entity, None)
             return
 
         if new_state.domain not in ENTITY_ADAPTERS:
@@ -42,23 +59,76 @@ async def async_enable_proactive_mode(hass, smart_home_config):
 
         for interface in alexa_changed_entity.interfaces():
             if interface.properties_proactively_reported():
-                await async_send_changereport_message(
-                    hass, smart_home_config, alexa_changed_entity
-                )
+                properties = _reported_properties(alexa_changed_entity)
+
+                # Only report to Alexa if a reported property has changed
+                if reported.get(changed_entity) == properties:
+                    pending.pop(changed_entity, None)
+                    return
+
+                pending[changed_entity] = (alexa_changed_entity, properties)
+
+                if unsub_pending is None:
+                    unsub_pending = async_call_later(
+                        hass, REPORT_STATE_WINDOW, async_report_pending
+                    )
                 return
             if (
                 interface.name() == "Alexa.DoorbellEventSource"
                 and new_state.state == STATE_ON
             ):
-                await async_send_doorbell_event_message(
-                    hass, smart_home_config, alexa_changed_entity
+                hass.async_create_task(
+                    async_send_doorbell_event_message(
+                        hass, smart_home_config, alexa_changed_entity
+                    )
                 )
                 return
 
-    return hass.helpers.event.async_track_state_change(
+    async def async_report_pending(_now):
+        """Send the collected change reports."""
+        nonlocal unsub_pending
+        unsub_pending = None
+
+        if not pending:
+            return
+
+        entities = list(pending.items())
+        pending.clear()
+
+        for entity_id, (_, properties) in entities:
+            reported[entity_id] = properties
+
+        await asyncio.gather(
+            *(
+                async_send_changereport_message(hass, smart_home_config, alexa_entity)
+                for _, (alexa_entity, _) in entities
+            )
+        )
+
+    unsub_state_change = hass.helpers.event.async_track_state_change(
         MATCH_ALL, async_entity_state_listener
     )
 
+    @callback
+    def unsub():
+        """Stop reporting states."""
+        unsub_state_change()
+
+        if unsub_pending is not None:
+            unsub_pending()
+
+        pending.clear()
+
+    return unsub
+
+
+def _reported_properties(alexa_entity):
+    """Return the properties of an entity that are relevant for a report."""
+    return [
+        (prop["namespace"], prop["name"], prop.get("instance"), prop["value"])
+        for prop in alexa_entity.serialize_properties()
+    ]
+
 
 async def async_send_changereport_message(
     hass, config, alexa_entity, *, invalidate_access_token=True
@@ -1,9 +1,11 @@
 """Rest API for Home Assistant."""
 import asyncio
+from collections import deque
+import hashlib
 import json
 import logging
 
-from aiohttp import web
+from aiohttp import hdrs, web
 from aiohttp.web_exceptions import HTTPBadRequest
 import async_timeout
 import voluptuous as vol
@@ -12,6 +14,7 @@ from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.bootstrap import DATA_LOGGING
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import (
+    CONTENT_TYPE_JSON,
     EVENT_HOMEASSISTANT_STOP,
     EVENT_TIME_CHANGED,
     HTTP_BAD_REQUEST,
@@ -35,7 +38,7 @@ import homeassistant.core as ha
 from homeassistant.exceptions import ServiceNotFound, TemplateError, Unauthorized
 from homeassistant.helpers import template
 from homeassistant.helpers.json import JSONEncoder
-from homeassistant.helpers.service import async_get_all_descriptions
+from homeassistant.helpers.service import async_get_all_descriptions_json
 from homeassistant.helpers.state import AsyncTrackStates
 
 _LOGGER = logging.getLogger(__name__)
@@ -48,12 +51,21 @@ ATTR_VERSION = "version"
 DOMAIN = "api"
 STREAM_PING_PAYLOAD = "ping"
 STREAM_PING_INTERVAL = 50  # seconds
+STREAM_MAX_BACKLOG = 1000
+STREAM_OVERFLOW_DROP_OLDEST = "drop_oldest"
+STREAM_OVERFLOW_DISCONNECT = "disconnect"
+URL_API_STREAM_STATS = "/api/stream/stats"
+
+DATA_EVENT_STREAMS = "api_event_streams"
 
 
 def setup(hass, config):
     """Register the API with the HTTP interface."""
+    hass.data[DATA_EVENT_STREAMS] = EventStreams(hass)
+
     hass.http.register_view(APIStatusView)
     hass.http.register_view(APIEventStream)
+    hass.http.register_view(APIEventStreamStatsView)
     hass.http.register_view(APIConfigView)
     hass.http.register_view(APIDiscoveryView)
     hass.http.register_view(APIStatesView)
@@ -83,6 +95,133 @@ class APIStatusView(HomeAssistantView):
         return self.json_message("API running.")
 
 
+class EventStreamBuffer:
+    """Bounded buffer of encoded events waiting to be written to a stream."""
+
+    def __init__(self, restrict=None, max_backlog=STREAM_MAX_BACKLOG, overflow=None):
+        """Initialize the buffer."""
+        self.restrict = restrict
+        self.max_backlog = max_backlog
+        self.overflow = overflow or STREAM_OVERFLOW_DROP_OLDEST
+        self.closed = False
+        self.overflowed = False
+        self.sent = 0
+        self.dropped = 0
+        self.peak_backlog = 0
+        self._payloads = deque()
+        self._available = asyncio.Event()
+
+    @property
+    def backlog(self):
+        """Return the number of events waiting to be written."""
+        return len(self._payloads)
+
+    def as_dict(self):
+        """Return the metrics of the stream."""
+        return {
+            "restrict": self.restrict,
+            "overflow": self.overflow,
+            "max_backlog": self.max_backlog,
+            "backlog": self.backlog,
+            "peak_backlog": self.peak_backlog,
+            "sent": self.sent,
+            "dropped": self.dropped,
+        }
+
+    @ha.callback
+    def async_wants(self, event_type):
+        """Return if events of this type should be forwarded to the stream."""
+        return not self.restrict or event_type in self.restrict
+
+    @ha.callback
+    def async_put(self, payload):
+        """Queue a payload, applying the overflow policy if the buffer is full."""
+        if self.closed:
+            return
+
+        if len(self._payloads) >= self.max_backlog:
+            if self.overflow == STREAM_OVERFLOW_DISCONNECT:
+                self.dropped += len(self._payloads) + 1
+                self._payloads.clear()
+                self.overflowed = True
+                self.async_close()
+                return
+
+            self._payloads.popleft()
+            self.dropped += 1
+
+        self._payloads.append(payload)
+        self.peak_backlog = max(self.peak_backlog, len(self._payloads))
+        self._available.set()
+
+    @ha.callback
+    def async_close(self):
+        """Close the buffer, queued payloads are still returned."""
+        self.closed = True
+        self._available.set()
+
+    async def async_get(self):
+        """Return the next payload or None once the buffer is closed."""
+        while not self._payloads:
+            if self.closed:
+                return None
+            self._available.clear()
+            await self._available.wait()
+
+        self.sent += 1
+        return self._payloads.popleft()
+
+
+class EventStreams:
+    """Forward events to all open event streams.
+
+    There is a single listener on the event bus for all streams and every
+    event is only encoded once, no matter how many streams receive it.
+    """
+
+    def __init__(self, hass):
+        """Initialize the event streams."""
+        self.hass = hass
+        self.buffers = set()
+        self._unsub = None
+
+    @ha.callback
+    def async_add(self, buffer):
+        """Start forwarding events to a buffer."""
+        if self._unsub is None:
+            self._unsub = self.hass.bus.async_listen(MATCH_ALL, self._async_forward)
+        self.buffers.add(buffer)
+
+    @ha.callback
+    def async_remove(self, buffer):
+        """Stop forwarding events to a buffer."""
+        self.buffers.discard(buffer)
+        if not self.buffers and self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @ha.callback
+    def _async_forward(self, event):
+        """Forward an event to the buffers that want it."""
+        if event.event_type == EVENT_TIME_CHANGED:
+            return
+
+        payload = None
+
+        for buffer in self.buffers:
+            if event.event_type == EVENT_HOMEASSISTANT_STOP:
+                buffer.async_close()
+                continue
+
+            if not buffer.async_wants(event.event_type):
+                continue
+
+            if payload is None:
+                payload = json.dumps(event, cls=JSONEncoder)
+
+            buffer.async_put(payload)
+
+
 class APIEventStream(HomeAssistantView):
     """View to handle EventStream requests."""
 
@@ -94,66 +233,84 @@ class APIEventStream(HomeAssistantView):
         if not request["hass_user"].is_admin:
             raise Unauthorized()
         hass = request.app["hass"]
-        stop_obj = object()
-        to_write = asyncio.Queue()
 
         restrict = request.query.get("restrict")
         if restrict:
-            restrict = restrict.split(",") + [EVENT_HOMEASSISTANT_STOP]
+            restrict = restrict.split(",")
 
-        async def forward_events(event):
-            """Forward events to the open request."""
-            if event.event_type == EVENT_TIME_CHANGED:
-                return
-
-            if restrict and event.event_type not in restrict:
-                return
+        overflow = request.query.get("overflow", STREAM_OVERFLOW_DROP_OLDEST)
+        if overflow not in (STREAM_OVERFLOW_DROP_OLDEST, STREAM_OVERFLOW_DISCONNECT):
+            return self.json_message("Invalid overflow policy.", HTTP_BAD_REQUEST)
 
-            _LOGGER.debug("STREAM %s FORWARDING %s", id(stop_obj), event)
-
-            if event.event_type == EVENT_HOMEASSISTANT_STOP:
-                data = stop_obj
-            else:
-                data = json.dumps(event, cls=JSONEncoder)
+        try:
+            max_backlog = int(request.query.get("max_backlog", STREAM_MAX_BACKLOG))
+        except ValueError:
+            max_backlog = 0
+        if max_backlog < 1:
+            return self.json_message("Invalid max backlog.", HTTP_BAD_REQUEST)
 
-            await to_write.put(data)
+        buffer = EventStreamBuffer(restrict, max_backlog, overflow)
+        stream_id = id(buffer)
+        streams = hass.data[DATA_EVENT_STREAMS]
 
         response = web.StreamResponse()
         response.content_type = "text/event-stream"
         await response.prepare(request)
 
-        unsub_stream = hass.bus.async_listen(MATCH_ALL, forward_events)
+        streams.async_add(buffer)
 
         try:
-            _LOGGER.debug("STREAM %s ATTACHED", id(stop_obj))
+            _LOGGER.debug("STREAM %s ATTACHED", stream_id)
 
             # Fire off one message so browsers fire open event right away
-            await to_write.put(STREAM_PING_PAYLOAD)
+            buffer.async_put(STREAM_PING_PAYLOAD)
 
             while True:
                 try:
                     with async_timeout.timeout(STREAM_PING_INTERVAL):
-                        payload = await to_write.get()
+                        payload = await buffer.async_get()
 
-                    if payload is stop_obj:
+                    if payload is None:
                         break
 
                     msg = f"data: {payload}\n\n"
-                    _LOGGER.debug("STREAM %s WRITING %s", id(stop_obj), msg.strip())
+                    _LOGGER.debug("STREAM %s WRITING %s", stream_id, msg.strip())
                     await response.write(msg.encode("UTF-8"))
                 except asyncio.TimeoutError:
-                    await to_write.put(STREAM_PING_PAYLOAD)
+                    buffer.async_put(STREAM_PING_PAYLOAD)
+
+            if buffer.overflowed:
+                _LOGGER.warning(
+                    "Closing event stream %s, more than %s events were waiting",
+                    stream_id,
+                    max_backlog,
+                )
 
         except asyncio.CancelledError:
-            _LOGGER.debug("STREAM %s ABORT", id(stop_obj))
+            _LOGGER.debug("STREAM %s ABORT", stream_id)
 
         finally:
-            _LOGGER.debug("STREAM %s RESPONSE CLOSED", id(stop_obj))
-            unsub_stream()
+            _LOGGER.debug("STREAM %s RESPONSE CLOSED", stream_id)
+            streams.async_remove(buffer)
 
         return response
 
 
+class APIEventStreamStatsView(HomeAssistantView):
+    """View to handle EventStream metrics requests."""
+
+    url = URL_API_STREAM_STATS
+    name = "api:stream:stats"
+
+    @ha.callback
+    def get(self, request):
+        """Get the metrics of the open event streams."""
+        if not request["hass_user"].is_admin:
+            raise Unauthorized()
+        streams = request.app["hass"].data[DATA_EVENT_STREAMS]
+        return self.json([buffer.as_dict() for buffer in streams.buffers])
+
+
 class APIConfigView(HomeAssistantView):
     """View to handle Configuration requests."""
 
@@ -327,8 +484,17 @@ class APIServicesView(HomeAssistantView):
 
     async def get(self, request):
         """Get registered services."""
-        services = await async_services_json(request.app["hass"])
-        return self.json(services)
+        body, etag = await async_get_all_descriptions_json(
+            request.app["hass"], services_json
+        )
+        if request.headers.get(hdrs.IF_NONE_MATCH) == etag:
+            return web.Response(status=304, headers={hdrs.ETAG: etag})
+
+        response = web.Response(
+            body=body, content_type=CONTENT_TYPE_JSON, headers={hdrs.ETAG: etag}
+        )
+        response.enable_compression()
+        return response
 
 
 class APIDomainServicesView(HomeAssistantView):
@@ -405,10 +571,13 @@ class APIErrorLog(HomeAssistantView):
         return web.FileResponse(request.app["hass"].data[DATA_LOGGING])
 
 
-async def async_services_json(hass):
-    """Generate services data to JSONify."""
-    descriptions = await async_get_all_descriptions(hass)
-    return [{"domain": key, "services": value} for key, value in descriptions.items()]
+def services_json(descriptions):
+    """Return the services JSON body and its ETag for service descriptions."""
+    services = [
+        {"domain": key, "services": value} for key, value in descriptions.items()
+    ]
+    body = json.dumps(services, sort_keys=True, cls=JSONEncoder).encode("UTF-8")
+    return body, '"{}"'.format(hashlib.sha1(body).hexdigest())
 
 
 def async_events_json(hass):
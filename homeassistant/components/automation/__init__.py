@@ -1,5 +1,6 @@
 """Allow to set up simple automation rules via the config file."""
 import asyncio
+import copy
 from functools import partial
 import importlib
 import logging
@@ -169,8 +170,8 @@ async def async_setup(hass, config):
             await asyncio.wait(tasks)
 
     async def reload_service_handler(service_call):
-        """Remove all automations and load new ones from config."""
-        conf = await component.async_prepare_reload()
+        """Reload the automations whose config changed."""
+        conf = await component.async_prepare_reload(skip_reset=True)
         if conf is None:
             return
         await _async_process_config(hass, conf, component)
@@ -217,6 +218,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         async_action,
         hidden,
         initial_state,
+        fingerprint=None,
     ):
         """Initialize an automation entity."""
         self._id = automation_id
@@ -229,6 +231,8 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         self._hidden = hidden
         self._initial_state = initial_state
         self._is_enabled = False
+        # Identifies the automation and its config between reloads
+        self.fingerprint = fingerprint
 
     @property
     def name(self):
@@ -385,8 +389,15 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
 async def _async_process_config(hass, config, component):
     """Process config and add automations.
 
+    Automations that are already loaded with the same config are left
+    untouched, only changed, new and removed automations are processed.
+
     This method is a coroutine.
     """
+    loaded = {}
+    for entity in component.entities:
+        loaded.setdefault(entity.fingerprint[0], []).append(entity)
+    removed = []
     entities = []
 
     for config_key in extract_domain_configs(config, DOMAIN):
@@ -396,6 +407,17 @@ async def _async_process_config(hass, config, component):
             automation_id = config_block.get(CONF_ID)
             name = config_block.get(CONF_ALIAS) or f"{config_key} {list_no}"
 
+            key = automation_id if automation_id is not None else name
+            # Setting up the automation attaches hass to the templates in
+            # config_block, compare a copy of the config as it was validated
+            fingerprint = (key, name, copy.deepcopy(config_block))
+            current = loaded[key].pop(0) if loaded.get(key) else None
+
+            if current is not None:
+                if current.fingerprint == fingerprint:
+                    continue
+                removed.append(current)
+
             hidden = config_block[CONF_HIDE_ENTITY]
             initial_state = config_block.get(CONF_INITIAL_STATE)
 
@@ -427,10 +449,16 @@ async def _async_process_config(hass, config, component):
                 action,
                 hidden,
                 initial_state,
+                fingerprint,
             )
 
             entities.append(entity)
 
+    for unused in loaded.values():
+        removed.extend(unused)
+    for entity in removed:
+        await component.async_remove_entity(entity.entity_id)
+
     if entities:
         await component.async_add_entities(entities)
 
@@ -21,7 +21,11 @@ from homeassistant.components.media_player.const import (
     DOMAIN as DOMAIN_MP,
     SERVICE_PLAY_MEDIA,
 )
-from homeassistant.components.stream import request_stream
+from homeassistant.components.stream import (
+    request_lookback,
+    request_stream,
+    stop_lookback,
+)
 from homeassistant.components.stream.const import (
     CONF_DURATION,
     CONF_LOOKBACK,
@@ -48,6 +52,7 @@ from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.loader import bind_hass
 from homeassistant.setup import async_when_setup
+import homeassistant.util.dt as dt_util
 
 from .const import DATA_CAMERA_PREFS, DOMAIN
 from .prefs import CameraPreferences
@@ -146,7 +151,7 @@ async def async_get_image(hass, entity_id, timeout=10):
 
     with suppress(asyncio.CancelledError, asyncio.TimeoutError):
         async with async_timeout.timeout(timeout):
-            image = await camera.async_camera_image()
+            image = await camera.async_camera_frame()
 
             if image:
                 return Image(camera.content_type, image)
@@ -165,6 +170,28 @@ async def async_get_mjpeg_stream(hass, request, entity_id):
 async def async_get_still_stream(request, image_cb, content_type, interval):
     """Generate an HTTP MJPEG stream from camera images.
 
+    This method must be run in the event loop.
+    """
+    return await _async_write_still_stream(
+        request, _async_poll_images(image_cb, interval), content_type
+    )
+
+
+async def _async_poll_images(image_cb, interval):
+    """Yield camera images every interval until no image is returned."""
+    while True:
+        img_bytes = await image_cb()
+        if not img_bytes:
+            break
+
+        yield img_bytes
+
+        await asyncio.sleep(interval)
+
+
+async def _async_write_still_stream(request, images, content_type):
+    """Write the images of an async iterator as an HTTP MJPEG stream.
+
     This method must be run in the event loop.
     """
     response = web.StreamResponse()
@@ -173,6 +200,8 @@ async def async_get_still_stream(request, image_cb, content_type, interval):
 
     async def write_to_mjpeg_stream(img_bytes):
         """Write image to stream."""
+        # Write the image as a separate chunk, so the bytes can be shared
+        # between all streams of a camera without copying them.
         await response.write(
             bytes(
                 "--frameboundary\r\n"
@@ -180,18 +209,17 @@ async def async_get_still_stream(request, image_cb, content_type, interval):
                 "Content-Length: {}\r\n\r\n".format(content_type, len(img_bytes)),
                 "utf-8",
             )
-            + img_bytes
-            + b"\r\n"
         )
+        await response.write(img_bytes)
+        await response.write(b"\r\n")
 
     last_image = None
 
-    while True:
-        img_bytes = await image_cb()
-        if not img_bytes:
-            break
+    try:
+        async for img_bytes in images:
+            if img_bytes is last_image or img_bytes == last_image:
+                continue
 
-        if img_bytes != last_image:
             await write_to_mjpeg_stream(img_bytes)
 
             # Chrome seems to always ignore first picture,
@@ -199,12 +227,97 @@ async def async_get_still_stream(request, image_cb, content_type, interval):
             if last_image is None:
                 await write_to_mjpeg_stream(img_bytes)
             last_image = img_bytes
-
-        await asyncio.sleep(interval)
+    finally:
+        await images.aclose()
 
     return response
 
 
+class StillStreamBroadcast:
+    """Fetch the images of a camera in a single task for all still streams.
+
+    All subscribers of the broadcast receive the same image bytes.
+    """
+
+    def __init__(self, hass, image_cb, interval, on_idle=None):
+        """Initialize the broadcast."""
+        self.hass = hass
+        self._image_cb = image_cb
+        self._interval = interval
+        self._on_idle = on_idle
+        self._image = None
+        self._new_image = asyncio.Event()
+        self._finished = False
+        self._subscribers = 0
+        self._task = None
+
+    @property
+    def subscribers(self):
+        """Return the number of subscribers."""
+        return self._subscribers
+
+    async def async_images(self):
+        """Yield the images of the camera until the camera stops returning them."""
+        self._subscribers += 1
+
+        if self._task is None or self._task.done():
+            self._finished = False
+            self._task = self.hass.async_create_task(self._async_fetch_images())
+
+        last_image = None
+
+        try:
+            while True:
+                new_image = self._new_image
+
+                if self._image is last_image and not self._finished:
+                    await new_image.wait()
+
+                if self._finished:
+                    break
+
+                last_image = self._image
+                yield last_image
+        finally:
+            self._subscribers -= 1
+
+            if not self._subscribers:
+                self._async_stop()
+
+    @callback
+    def _async_stop(self):
+        """Stop fetching images."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        self._image = None
+
+        if self._on_idle is not None:
+            self._on_idle(self)
+
+    @callback
+    def _async_set_image(self, image):
+        """Hand a new image to all subscribers."""
+        self._image = image
+        self._new_image.set()
+        self._new_image = asyncio.Event()
+
+    async def _async_fetch_images(self):
+        """Fetch images every interval while there are subscribers."""
+        try:
+            async for img_bytes in _async_poll_images(self._image_cb, self._interval):
+                if img_bytes is not self._image and img_bytes != self._image:
+                    self._async_set_image(img_bytes)
+        except asyncio.CancelledError:
+            raise
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error fetching image for still stream")
+        finally:
+            self._finished = True
+            self._new_image.set()
+
+
 def _get_camera_from_entity_id(hass, entity_id):
     """Get camera component from entity_id."""
     component = hass.data.get(DOMAIN)
@@ -247,7 +360,7 @@ async def async_setup(hass, config):
     async def preload_stream(hass, _):
         for camera in component.entities:
             camera_prefs = prefs.get(camera.entity_id)
-            if not camera_prefs.preload_stream:
+            if not camera_prefs.preload_stream and not camera_prefs.lookback:
                 continue
 
             async with async_timeout.timeout(10):
@@ -256,7 +369,11 @@ async def async_setup(hass, config):
             if not source:
                 continue
 
-            request_stream(hass, source, keepalive=True)
+            if camera_prefs.preload_stream:
+                request_stream(hass, source, keepalive=True)
+
+            if camera_prefs.lookback:
+                request_lookback(hass, source, camera_prefs.lookback)
 
     async_when_setup(hass, DOMAIN_STREAM, preload_stream)
 
@@ -315,6 +432,10 @@ class Camera(Entity):
         self.content_type = DEFAULT_CONTENT_TYPE
         self.access_tokens: collections.deque = collections.deque([], 2)
         self.async_update_token()
+        self._frame = None
+        self._frame_expires = None
+        self._frame_fetch = None
+        self._still_streams = {}
 
     @property
     def should_poll(self):
@@ -372,13 +493,54 @@ class Camera(Entity):
         """
         return self.hass.async_add_job(self.camera_image)
 
+    async def async_camera_frame(self):
+        """Return a recent camera image.
+
+        Images are cached for frame_interval seconds and concurrent calls
+        share a single call to async_camera_image.
+        This method must be run in the event loop.
+        """
+        if self._frame is not None and dt_util.utcnow() < self._frame_expires:
+            return self._frame
+
+        if self._frame_fetch is None:
+            self._frame_fetch = self.hass.async_create_task(self._async_fetch_frame())
+
+        return await asyncio.shield(self._frame_fetch)
+
+    async def _async_fetch_frame(self):
+        """Fetch a camera image for the frame cache."""
+        try:
+            image = await self.async_camera_image()
+        finally:
+            self._frame_fetch = None
+
+        if image:
+            self._frame = image
+            self._frame_expires = dt_util.utcnow() + timedelta(
+                seconds=self.frame_interval
+            )
+
+        return image
+
     async def handle_async_still_stream(self, request, interval):
         """Generate an HTTP MJPEG stream from camera images.
 
+        All streams with the same interval share one task fetching the images.
         This method must be run in the event loop.
         """
-        return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
+        broadcast = self._still_streams.get(interval)
+
+        if broadcast is None:
+            broadcast = self._still_streams[interval] = StillStreamBroadcast(
+                self.hass,
+                self.async_camera_frame,
+                interval,
+                lambda _: self._still_streams.pop(interval, None),
+            )
+
+        return await _async_write_still_stream(
+            request, broadcast.async_images(), self.content_type
         )
 
     async def handle_async_mjpeg_stream(self, request):
@@ -509,7 +671,7 @@ class CameraImageView(CameraView):
         """Serve camera image."""
         with suppress(asyncio.CancelledError, asyncio.TimeoutError):
             async with async_timeout.timeout(10):
-                image = await camera.async_camera_image()
+                image = await camera.async_camera_frame()
 
             if image:
                 return web.Response(body=image, content_type=camera.content_type)
@@ -619,6 +781,7 @@ async def websocket_get_prefs(hass, connection, msg):
         vol.Required("type"): "camera/update_prefs",
         vol.Required("entity_id"): cv.entity_id,
         vol.Optional("preload_stream"): bool,
+        vol.Optional("lookback"): vol.All(vol.Coerce(int), vol.Range(min=0)),
     }
 )
 async def websocket_update_prefs(hass, connection, msg):
@@ -631,9 +794,35 @@ async def websocket_update_prefs(hass, connection, msg):
     entity_id = changes.pop("entity_id")
     await prefs.async_update(entity_id, **changes)
 
+    if "lookback" in changes and DOMAIN_STREAM in hass.config.components:
+        try:
+            await _async_update_lookback(hass, entity_id, prefs.get(entity_id))
+        except HomeAssistantError as ex:
+            _LOGGER.error("Error updating lookback buffer: %s", ex)
+        except asyncio.TimeoutError:
+            _LOGGER.error("Timeout getting stream source")
+
     connection.send_result(msg["id"], prefs.get(entity_id).as_dict())
 
 
+async def _async_update_lookback(hass, entity_id, camera_prefs):
+    """Start, resize or stop the lookback buffer of a camera."""
+    camera = hass.data[DOMAIN].get_entity(entity_id)
+    if camera is None:
+        return
+
+    async with async_timeout.timeout(10):
+        source = await camera.stream_source()
+
+    if not source:
+        return
+
+    if camera_prefs.lookback:
+        request_lookback(hass, source, camera_prefs.lookback)
+    else:
+        stop_lookback(hass, source, keepalive=camera_prefs.preload_stream)
+
+
 async def async_handle_snapshot_service(camera, service):
     """Handle snapshot services calls."""
     hass = camera.hass
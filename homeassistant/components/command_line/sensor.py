@@ -20,6 +20,7 @@ from homeassistant.exceptions import TemplateError
 from homeassistant.helpers import template
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import Entity
+from homeassistant.util.shared_fetch import SharedFetches
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,6 +32,9 @@ DEFAULT_TIMEOUT = 15
 
 SCAN_INTERVAL = timedelta(seconds=60)
 
+# Sensors of a hass running the same command share its output
+DATA_SHARED_FETCHES = "command_line_shared_fetches"
+
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
         vol.Required(CONF_COMMAND): cv.string,
@@ -138,6 +142,9 @@ class CommandSensorData:
         self.hass = hass
         self.command = command
         self.timeout = command_timeout
+        self._shared_fetches = hass.data.setdefault(
+            DATA_SHARED_FETCHES, SharedFetches()
+        )
 
     def update(self):
         """Get the latest data with a shell command."""
@@ -173,13 +180,22 @@ class CommandSensorData:
             # Template used. Construct the string used in the shell
             command = str(" ".join([prog] + shlex.split(rendered_args)))
             shell = True
+        value = self._shared_fetches.get(
+            command, self, lambda: self._run(command, shell)
+        )
+        if value is not None:
+            self.value = value
+
+    def _run(self, command, shell):
+        """Run the command and return its output."""
         try:
             _LOGGER.debug("Running command: %s", command)
             return_value = subprocess.check_output(
                 command, shell=shell, timeout=self.timeout
             )
-            self.value = return_value.strip().decode("utf-8")
+            return return_value.strip().decode("utf-8")
         except subprocess.CalledProcessError:
             _LOGGER.error("Command failed: %s", command)
         except subprocess.TimeoutExpired:
             _LOGGER.error("Timeout for command: %s", command)
+        return None
@@ -2,7 +2,8 @@
 import asyncio
 from datetime import timedelta
 import hashlib
-from typing import Any, List, Sequence
+import heapq
+from typing import Any, Dict, List, Sequence, Tuple
 
 import voluptuous as vol
 
@@ -106,6 +107,10 @@ class DeviceTracker:
         self.defaults = defaults
         self.group = None
         self._is_updating = asyncio.Lock()
+        # New devices waiting to be added to the YAML configuration file
+        self._pending_config: Dict[str, Device] = {}
+        # Heap of the times at which tracked devices can become stale
+        self._stale_heap: List[Tuple[dt_util.dt.datetime, str]] = []
 
         for dev in devices:
             if self.devices[dev.dev_id] is not dev:
@@ -190,6 +195,7 @@ class DeviceTracker:
             )
             if device.track:
                 await device.async_update_ha_state()
+            self._async_schedule_stale(device)
             return
 
         # Guard from calling see on entity registry entities.
@@ -229,6 +235,7 @@ class DeviceTracker:
 
         if device.track:
             await device.async_update_ha_state()
+        self._async_schedule_stale(device)
 
         # During init, we ignore the group
         if self.group and self.track_new:
@@ -264,12 +271,18 @@ class DeviceTracker:
     async def async_update_config(self, path, dev_id, device):
         """Add device to YAML configuration file.
 
+        Devices that are added while the file is being written are written
+        together with a single append once the current write finishes.
+
         This method is a coroutine.
         """
+        self._pending_config[dev_id] = device
         async with self._is_updating:
-            await self.hass.async_add_executor_job(
-                update_config, self.hass.config.path(YAML_DEVICES), dev_id, device
-            )
+            if not self._pending_config:
+                return
+            devices = list(self._pending_config.values())
+            self._pending_config = {}
+            await self.hass.async_add_executor_job(update_config_batch, path, devices)
 
     @callback
     def async_setup_group(self):
@@ -292,13 +305,33 @@ class DeviceTracker:
             )
         )
 
+    @callback
+    def _async_schedule_stale(self, device: "Device"):
+        """Remember when a tracked device that was seen can become stale.
+
+        This method must be run in the event loop.
+        """
+        if device.track and device.last_seen is not None:
+            heapq.heappush(
+                self._stale_heap,
+                (device.last_seen + device.consider_home, device.dev_id),
+            )
+
     @callback
     def async_update_stale(self, now: dt_util.dt.datetime):
         """Update stale devices.
 
+        Only devices whose time to become stale has passed are checked.
+        Entries of devices that were seen again in the meantime are skipped,
+        a newer entry was added for them when they were seen.
+
         This method must be run in the event loop.
         """
-        for device in self.devices.values():
+        while self._stale_heap and self._stale_heap[0][0] < now:
+            _, dev_id = heapq.heappop(self._stale_heap)
+            device = self.devices.get(dev_id)
+            if device is None:
+                continue
             if (device.track and device.last_update_home) and device.stale(now):
                 self.hass.async_create_task(device.async_update_ha_state(True))
 
@@ -312,6 +345,7 @@ class DeviceTracker:
             """Init a single device_tracker entity."""
             await dev.async_added_to_hass()
             await dev.async_update_ha_state()
+            self._async_schedule_stale(dev)
 
         tasks = []
         for device in self.devices.values():
@@ -615,19 +649,29 @@ async def async_load_config(
 
 def update_config(path: str, dev_id: str, device: Device):
     """Add device to YAML configuration file."""
-    with open(path, "a") as out:
-        device = {
-            device.dev_id: {
-                ATTR_NAME: device.name,
-                ATTR_MAC: device.mac,
-                ATTR_ICON: device.icon,
-                "picture": device.config_picture,
-                "track": device.track,
-                CONF_AWAY_HIDE: device.away_hide,
+    update_config_batch(path, [device])
+
+
+def update_config_batch(path: str, devices: Sequence[Device]):
+    """Add devices to YAML configuration file with a single write."""
+    content = "".join(
+        "\n"
+        + dump(
+            {
+                device.dev_id: {
+                    ATTR_NAME: device.name,
+                    ATTR_MAC: device.mac,
+                    ATTR_ICON: device.icon,
+                    "picture": device.config_picture,
+                    "track": device.track,
+                    CONF_AWAY_HIDE: device.away_hide,
+                }
             }
-        }
-        out.write("\n")
-        out.write(dump(device))
+        )
+        for device in devices
+    )
+    with open(path, "a") as out:
+        out.write(content)
 
 
 def get_gravatar_for_email(email: str):
@@ -66,7 +66,7 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
     name = config.get(CONF_NAME)
     region_name = config.get(CONF_REGION_NAME)
 
-    api = DwdWeatherWarningsAPI(region_name)
+    api = DwdWeatherWarningsAPI(hass, region_name)
 
     sensors = [
         DwdWeatherWarningsSensor(api, name, condition)
@@ -176,7 +176,7 @@ class DwdWeatherWarningsSensor(Entity):
 class DwdWeatherWarningsAPI:
     """Get the latest data and update the states."""
 
-    def __init__(self, region_name):
+    def __init__(self, hass, region_name):
         """Initialize the data object."""
         resource = "{}{}{}?{}".format(
             "https://",
@@ -188,7 +188,7 @@ class DwdWeatherWarningsAPI:
         # a User-Agent is necessary for this rest api endpoint (#29496)
         headers = {"User-Agent": HA_USER_AGENT}
 
-        self._rest = RestData("GET", resource, None, headers, None, True)
+        self._rest = RestData("GET", resource, None, headers, None, True, hass=hass)
         self.region_name = region_name
         self.region_id = None
         self.region_state = None
@@ -17,6 +17,7 @@ from .hue_api import (
     HueAllLightsStateView,
     HueFullStateView,
     HueGroupView,
+    HueLightsState,
     HueOneLightChangeView,
     HueOneLightStateView,
     HueUnauthorizedUser,
@@ -175,6 +176,7 @@ class Config:
         self.type = conf.get(CONF_TYPE)
         self.numbers = None
         self.cached_states = {}
+        self.lights_state = HueLightsState(self)
 
         if self.type == TYPE_ALEXA:
             _LOGGER.warning(
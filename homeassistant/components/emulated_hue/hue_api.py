@@ -1,6 +1,9 @@
 """Support for a Hue API to control Home Assistant."""
 import hashlib
 import logging
+import secrets
+
+from aiohttp import hdrs, web
 
 from homeassistant import core
 from homeassistant.components import (
@@ -48,6 +51,7 @@ from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_SUPPORTED_FEATURES,
     ATTR_TEMPERATURE,
+    EVENT_STATE_CHANGED,
     HTTP_BAD_REQUEST,
     HTTP_NOT_FOUND,
     HTTP_UNAUTHORIZED,
@@ -199,7 +203,11 @@ class HueAllLightsStateView(HomeAssistantView):
         if not is_local(request[KEY_REAL_IP]):
             return self.json_message("Only local IPs allowed", HTTP_UNAUTHORIZED)
 
-        return self.json(create_list_of_entities(self.config, request))
+        lights, etag = self.config.lights_state.async_get(request.app["hass"])
+        if request.headers.get(hdrs.IF_NONE_MATCH) == etag:
+            return web.Response(status=304, headers={hdrs.ETAG: etag})
+
+        return self.json(lights, headers={hdrs.ETAG: etag})
 
 
 class HueFullStateView(HomeAssistantView):
@@ -221,8 +229,12 @@ class HueFullStateView(HomeAssistantView):
         if username != HUE_API_USERNAME:
             return self.json(UNAUTHORIZED_USER)
 
+        lights, etag = self.config.lights_state.async_get(request.app["hass"])
+        if request.headers.get(hdrs.IF_NONE_MATCH) == etag:
+            return web.Response(status=304, headers={hdrs.ETAG: etag})
+
         json_response = {
-            "lights": create_list_of_entities(self.config, request),
+            "lights": lights,
             "config": {
                 "mac": "00:00:00:00:00:00",
                 "swversion": "01003542",
@@ -231,7 +243,7 @@ class HueFullStateView(HomeAssistantView):
             },
         }
 
-        return self.json(json_response)
+        return self.json(json_response, headers={hdrs.ETAG: etag})
 
 
 class HueOneLightStateView(HomeAssistantView):
@@ -484,6 +496,7 @@ class HueOneLightChangeView(HomeAssistantView):
             # status, we report what Alexa will want to see, which is the same
             # as the actual requested command.
             config.cached_states[entity_id] = parsed
+            config.lights_state.async_invalidate(entity_id)
 
         # Separate call to turn on needed
         if turn_on_needed:
@@ -717,14 +730,67 @@ def create_hue_success_response(entity_id, attr, value):
     return {"success": {success_key: value}}
 
 
-def create_list_of_entities(config, request):
-    """Create a list of all entites."""
-    hass = request.app["hass"]
-    json_response = {}
+class HueLightsState:
+    """Hue JSON of all exposed entities, kept up to date with state changes.
+
+    Only entities that changed since the last request are converted again.
+    The ETag changes whenever the JSON of any light changes.
+    """
+
+    def __init__(self, config):
+        """Initialize the lights state."""
+        self.config = config
+        self._lights = None
+        self._lights_by_number = None
+        self._changed = set()
+        self._etag_prefix = secrets.token_hex(4)
+        self._version = 0
+
+    @core.callback
+    def async_invalidate(self, entity_id):
+        """Convert an entity again on the next request."""
+        if self._lights is not None:
+            self._changed.add(entity_id)
+
+    @core.callback
+    def _async_state_changed(self, event):
+        """Handle a state change."""
+        self.async_invalidate(event.data[ATTR_ENTITY_ID])
+
+    @core.callback
+    def async_get(self, hass):
+        """Return the JSON of all exposed entities by number and its ETag."""
+        if self._lights is None:
+            hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+            self._lights = {}
+            for entity in hass.states.async_all():
+                self._async_update(entity.entity_id, entity)
+            self._lights_by_number = None
+
+        elif self._changed:
+            for entity_id in self._changed:
+                if self._async_update(entity_id, hass.states.get(entity_id)):
+                    self._lights_by_number = None
+            self._changed.clear()
+
+        if self._lights_by_number is None:
+            self._lights_by_number = dict(self._lights.values())
+            self._version += 1
+
+        return self._lights_by_number, f'"{self._etag_prefix}-{self._version}"'
 
-    for entity in hass.states.async_all():
-        if config.is_entity_exposed(entity):
-            number = config.entity_id_to_number(entity.entity_id)
-            json_response[number] = entity_to_json(config, entity)
+    @core.callback
+    def _async_update(self, entity_id, entity):
+        """Convert an entity, return if its JSON changed."""
+        if entity is None or not self.config.is_entity_exposed(entity):
+            return self._lights.pop(entity_id, None) is not None
+
+        light = (
+            self.config.entity_id_to_number(entity_id),
+            entity_to_json(self.config, entity),
+        )
+        if self._lights.get(entity_id) == light:
+            return False
 
-    return json_response
+        self._lights[entity_id] = light
+        return True
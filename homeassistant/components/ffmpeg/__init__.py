@@ -1,4 +1,5 @@
 """Support for FFmpeg."""
+from datetime import timedelta
 import logging
 import re
 
@@ -17,6 +18,9 @@ from homeassistant.helpers.dispatcher import (
     async_dispatcher_send,
 )
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.event import async_track_time_interval
+
+from .pool import FFmpegWorkerPool
 
 DOMAIN = "ffmpeg"
 
@@ -40,6 +44,8 @@ CONF_OUTPUT = "output"
 
 DEFAULT_BINARY = "ffmpeg"
 
+POOL_CLEANUP_INTERVAL = timedelta(minutes=1)
+
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.Schema(
@@ -60,6 +66,14 @@ async def async_setup(hass, config):
 
     await manager.async_get_version()
 
+    async_track_time_interval(hass, manager.pool.async_stop_idle, POOL_CLEANUP_INTERVAL)
+
+    async def async_close_pool(event):
+        """Stop the FFmpeg processes of the pool."""
+        await manager.pool.async_close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_close_pool)
+
     # Register service
     async def async_service_handle(service):
         """Handle service ffmpeg process."""
@@ -98,6 +112,7 @@ class FFmpegManager:
         self._bin = ffmpeg_bin
         self._version = None
         self._major_version = None
+        self.pool = FFmpegWorkerPool(hass.loop, ffmpeg_bin)
 
     @property
     def binary(self):
@@ -118,6 +133,10 @@ class FFmpegManager:
 
         return self._version, self._major_version
 
+    async def async_get_image(self, input_source, extra_cmd=None):
+        """Return the latest JPEG frame of a source from the pool."""
+        return await self.pool.async_get_image(input_source, extra_cmd)
+
     @property
     def ffmpeg_stream_content_type(self):
         """Return HTTP content type for ffmpeg stream."""
@@ -3,7 +3,6 @@ import asyncio
 import logging
 
 from haffmpeg.camera import CameraMjpeg
-from haffmpeg.tools import IMAGE_JPEG, ImageFrame
 import voluptuous as vol
 
 from homeassistant.components.camera import PLATFORM_SCHEMA, SUPPORT_STREAM, Camera
@@ -56,12 +55,8 @@ class FFmpegCamera(Camera):
     async def async_camera_image(self):
         """Return a still image response from the camera."""
 
-        ffmpeg = ImageFrame(self._manager.binary, loop=self.hass.loop)
-
         image = await asyncio.shield(
-            ffmpeg.get_image(
-                self._input, output_format=IMAGE_JPEG, extra_cmd=self._extra_arguments
-            )
+            self._manager.async_get_image(self._input, self._extra_arguments)
         )
         return image
 
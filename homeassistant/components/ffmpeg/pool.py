@@ -0,0 +1,294 @@
+"""Long-lived FFmpeg processes that provide snapshots of video sources."""
+import asyncio
+from collections import OrderedDict
+import logging
+import os
+import shlex
+import sys
+
+_LOGGER = logging.getLogger(__name__)
+
+JPEG_EOI = b"\xff\xd9"
+JPEG_SOI = b"\xff\xd8"
+
+# Most FFmpeg processes that decode sources at the same time
+MAX_WORKERS = 16
+
+# Seconds without snapshot requests before the process of a source is stopped
+IDLE_TIMEOUT = 300
+
+# Frames per second written by a process, to keep the latest frame current
+FRAME_RATE = 1
+
+# Seconds without a new frame, or without a first frame after the start,
+# after which a process is considered stalled
+MAX_FRAME_AGE = 5 / FRAME_RATE
+
+# Largest frame that is read from a process
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+# Seconds to wait for a process to exit before it is killed
+STOP_TIMEOUT = 5
+
+
+def read_cpu_time(pid):
+    """Return the CPU seconds used by a process, None if unknown."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        with open(f"/proc/{pid}/stat") as stat_file:
+            stat = stat_file.read()
+    except OSError:
+        return None
+    # The process name can contain spaces, fields are counted after it
+    fields = stat[stat.rfind(")") + 2 :].split()
+    try:
+        ticks = int(fields[11]) + int(fields[12])
+    except (IndexError, ValueError):
+        return None
+    return ticks / os.sysconf("SC_CLK_TCK")
+
+
+class FFmpegFrameWorker:
+    """FFmpeg process that keeps the latest frame of a source as JPEG."""
+
+    def __init__(self, loop, argv):
+        """Initialize the worker."""
+        self.loop = loop
+        self.argv = argv
+        self.frame = None
+        self.frame_received = None
+        self.started = None
+        self.last_used = loop.time()
+        self.starts = 0
+        self._finished_cpu_time = 0.0
+        self._cpu_time = 0.0
+        self._process = None
+        self._read_task = None
+        self._new_frame = asyncio.Event()
+        self._exited = asyncio.Event()
+        self._start_lock = asyncio.Lock()
+
+    @property
+    def is_running(self):
+        """Return True if the process is running."""
+        return self._process is not None and self._process.returncode is None
+
+    @property
+    def is_stalled(self):
+        """Return True if the process stopped or never started writing frames."""
+        last_activity = self.frame_received or self.started
+        return (
+            last_activity is not None
+            and self.loop.time() - last_activity > MAX_FRAME_AGE
+        )
+
+    @property
+    def restarts(self):
+        """Return how often the process was started again."""
+        return max(self.starts - 1, 0)
+
+    @property
+    def cpu_time(self):
+        """Return the CPU seconds used by the processes of this worker."""
+        return self._finished_cpu_time + self._cpu_time
+
+    async def async_get_frame(self, timeout):
+        """Return the latest frame, starting the process if needed."""
+        self.last_used = self.loop.time()
+        if not self.is_running or self.is_stalled:
+            async with self._start_lock:
+                if self.is_running and self.is_stalled:
+                    # Do not return the same frame forever, if for example
+                    # ffmpeg waits for a stream that stopped sending data
+                    _LOGGER.warning(
+                        "No frame received from FFmpeg for %d seconds, restarting",
+                        self.loop.time() - (self.frame_received or self.started),
+                    )
+                    await self.async_stop()
+                if not self.is_running:
+                    await self._async_start()
+            if not self.is_running:
+                return None
+
+        if self.frame is None:
+            # Wake up on the first frame, or when the process exits without one
+            waiters = [
+                self.loop.create_task(self._new_frame.wait()),
+                self.loop.create_task(self._exited.wait()),
+            ]
+            done, pending = await asyncio.wait(
+                waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            for waiter in pending:
+                waiter.cancel()
+            if not done:
+                _LOGGER.warning("Timeout reading image")
+        return self.frame
+
+    async def _async_start(self):
+        """Start the process and read its frames."""
+        if self._read_task is not None:
+            # Frames of the previous process are not the latest anymore
+            await self._read_task
+            self._read_task = None
+        self.frame = None
+        self.frame_received = None
+        self.started = None
+        self._new_frame.clear()
+        self._exited.clear()
+        self._finished_cpu_time += self._cpu_time
+        self._cpu_time = 0.0
+
+        _LOGGER.debug("Start FFmpeg with %s", self.argv)
+        try:
+            self._process = await asyncio.create_subprocess_exec(
+                *self.argv,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=MAX_FRAME_SIZE,
+            )
+        except OSError as err:
+            _LOGGER.error("Unable to start FFmpeg: %s", err)
+            self._process = None
+            return
+
+        self.starts += 1
+        self.started = self.loop.time()
+        self._read_task = self.loop.create_task(self._async_read(self._process))
+
+    async def _async_read(self, process):
+        """Keep the latest frame written by a process."""
+        while True:
+            try:
+                data = await process.stdout.readuntil(JPEG_EOI)
+            except asyncio.IncompleteReadError:
+                break
+            except asyncio.LimitOverrunError as err:
+                _LOGGER.warning("Skipping frame larger than %d bytes", MAX_FRAME_SIZE)
+                await process.stdout.readexactly(err.consumed)
+                continue
+            start = data.find(JPEG_SOI)
+            if start == -1:
+                continue
+            self.frame = data[start:]
+            self.frame_received = self.loop.time()
+            self._new_frame.set()
+
+        await process.wait()
+        _LOGGER.debug("FFmpeg exited with code %s", process.returncode)
+        self._exited.set()
+
+    async def async_update_cpu_time(self):
+        """Update the CPU seconds used by the running process."""
+        if not self.is_running:
+            return
+        cpu_time = await self.loop.run_in_executor(
+            None, read_cpu_time, self._process.pid
+        )
+        if cpu_time is not None:
+            self._cpu_time = cpu_time
+
+    async def async_stop(self):
+        """Stop the process."""
+        if self.is_running:
+            await self.async_update_cpu_time()
+            self._process.terminate()
+            try:
+                await asyncio.wait_for(self._process.wait(), STOP_TIMEOUT)
+            except asyncio.TimeoutError:
+                _LOGGER.warning("Timeout while waiting of FFmpeg")
+                self._process.kill()
+                await self._process.wait()
+        if self._read_task is not None:
+            await self._read_task
+            self._read_task = None
+        self._process = None
+
+
+class FFmpegWorkerPool:
+    """Long-lived FFmpeg processes that provide snapshots of sources.
+
+    Every source is decoded by one process that writes a JPEG frame each
+    second, so a snapshot is the latest frame instead of a new process that
+    has to decode the stream up to its first complete frame. Processes are
+    started on the first snapshot of a source and stopped after it has not
+    been requested for IDLE_TIMEOUT seconds. At most max_workers processes
+    run at the same time, the least recently used one is stopped to start
+    another. A process that exited or has not written a frame for
+    MAX_FRAME_AGE seconds, counted from its start if it never wrote one, is
+    started again on the next snapshot.
+    """
+
+    def __init__(self, loop, ffmpeg_bin, max_workers=MAX_WORKERS):
+        """Initialize the pool."""
+        self.loop = loop
+        self._bin = ffmpeg_bin
+        self.max_workers = max_workers
+        self._workers = OrderedDict()
+
+    def _command(self, input_source, extra_cmd):
+        """Return the FFmpeg command line that writes frames of a source."""
+        argv = [self._bin]
+        input_cmd = shlex.split(input_source)
+        if len(input_cmd) > 1:
+            argv.extend(input_cmd)
+        else:
+            argv.extend(["-i", input_source])
+        argv.extend(["-an", "-c:v", "mjpeg", "-r", str(FRAME_RATE)])
+        if extra_cmd is not None:
+            argv.extend(shlex.split(extra_cmd))
+        argv.extend(["-f", "image2pipe", "-"])
+        return argv
+
+    async def async_get_image(self, input_source, extra_cmd=None, timeout=15):
+        """Return the latest JPEG frame of a source."""
+        key = (input_source, extra_cmd)
+        worker = self._workers.get(key)
+        if worker is None:
+            worker = self._workers[key] = FFmpegFrameWorker(
+                self.loop, self._command(input_source, extra_cmd)
+            )
+        self._workers.move_to_end(key)
+
+        if not worker.is_running:
+            running = [
+                other
+                for other in self._workers.values()
+                if other is not worker and other.is_running
+            ]
+            # The workers are ordered from least to most recently used
+            for other in running[: max(len(running) - self.max_workers + 1, 0)]:
+                await other.async_stop()
+
+        return await worker.async_get_frame(timeout)
+
+    def stats(self):
+        """Return the state, restart count and CPU seconds of the sources."""
+        return {
+            input_source: {
+                "running": worker.is_running,
+                "restarts": worker.restarts,
+                "cpu_time": round(worker.cpu_time, 2),
+            }
+            for (input_source, _), worker in self._workers.items()
+        }
+
+    async def async_stop_idle(self, now=None):
+        """Stop the processes of sources that were not used recently."""
+        idle_since = self.loop.time() - IDLE_TIMEOUT
+        for key, worker in list(self._workers.items()):
+            if worker.last_used < idle_since:
+                await worker.async_stop()
+                del self._workers[key]
+            else:
+                await worker.async_update_cpu_time()
+        _LOGGER.debug("FFmpeg workers: %s", self.stats())
+
+    async def async_close(self):
+        """Stop all processes."""
+        workers = list(self._workers.values())
+        self._workers.clear()
+        if workers:
+            await asyncio.wait([worker.async_stop() for worker in workers])
@@ -255,20 +255,23 @@ class SensorFilter(Entity):
                     )
                 )
                 if self._entity in filter_history:
+                    # Skip the states that were already loaded
+                    loaded = {
+                        (state.last_updated, state.context.id) for state in history_list
+                    }
                     history_list.extend(
-                        [
-                            state
-                            for state in filter_history[self._entity]
-                            if state not in history_list
-                        ]
+                        state
+                        for state in filter_history[self._entity]
+                        if (state.last_updated, state.context.id) not in loaded
                     )
 
             # Sort the window states
-            history_list = sorted(history_list, key=lambda s: s.last_updated)
-            _LOGGER.debug(
-                "Loading from history: %s",
-                [(s.state, s.last_updated) for s in history_list],
-            )
+            history_list.sort(key=lambda s: s.last_updated)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Loading from history: %s",
+                    [(s.state, s.last_updated) for s in history_list],
+                )
 
             # Replay history through the filter chain
             prev_state = None
@@ -1,5 +1,7 @@
 """Google Report State implementation."""
+from contextlib import suppress
 import logging
+from typing import Any, Dict
 
 from homeassistant.const import MATCH_ALL
 from homeassistant.core import HomeAssistant, callback
@@ -12,16 +14,32 @@ from .helpers import AbstractConfig, GoogleEntity, async_get_entities
 # https://github.com/actions-on-google/smart-home-nodejs/issues/196#issuecomment-439156639
 INITIAL_REPORT_DELAY = 60
 
+# Seconds to collect state changes before reporting them in one batch
+REPORT_STATE_WINDOW = 1
+
 
 _LOGGER = logging.getLogger(__name__)
 
 
 @callback
 def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig):
-    """Enable state reporting."""
+    """Enable state reporting.
+
+    State changes are collected for REPORT_STATE_WINDOW seconds and then
+    reported to Google in a single request.
+    """
+    # The last state data reported for each entity
+    reported: Dict[str, Any] = {}
+    # State data waiting to be reported
+    pending: Dict[str, Any] = {}
+    unsub_pending = None
+
+    @callback
+    def async_entity_state_listener(changed_entity, old_state, new_state):
+        nonlocal unsub_pending
 
-    async def async_entity_state_listener(changed_entity, old_state, new_state):
         if not new_state:
+            reported.pop(changed_entity, None)
             return
 
         if not google_config.should_expose(new_state):
@@ -38,16 +56,37 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
             _LOGGER.debug("Not reporting state for %s: %s", changed_entity, err.code)
             return
 
-        if old_state:
+        if changed_entity not in reported and old_state:
             old_entity = GoogleEntity(hass, google_config, old_state)
 
-            # Only report to Google if data that Google cares about has changed
-            if entity_data == old_entity.query_serialize():
-                return
+            with suppress(SmartHomeError):
+                reported[changed_entity] = old_entity.query_serialize()
+
+        # Only report to Google if data that Google cares about has changed
+        if reported.get(changed_entity) == entity_data:
+            pending.pop(changed_entity, None)
+            return
+
+        pending[changed_entity] = entity_data
+
+        if unsub_pending is None:
+            unsub_pending = async_call_later(
+                hass, REPORT_STATE_WINDOW, async_report_pending
+            )
+
+    async def async_report_pending(_now):
+        """Report the collected state changes."""
+        nonlocal unsub_pending
+        unsub_pending = None
 
-        await google_config.async_report_state_all(
-            {"devices": {"states": {changed_entity: entity_data}}}
-        )
+        if not pending:
+            return
+
+        states = dict(pending)
+        pending.clear()
+        reported.update(states)
+
+        await google_config.async_report_state_all({"devices": {"states": states}})
 
     async def inital_report(_now):
         """Report initially all states."""
@@ -62,10 +101,24 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
             except SmartHomeError:
                 continue
 
+        reported.update(entities)
+
         await google_config.async_report_state_all({"devices": {"states": entities}})
 
     async_call_later(hass, INITIAL_REPORT_DELAY, inital_report)
 
-    return hass.helpers.event.async_track_state_change(
+    unsub_state_change = hass.helpers.event.async_track_state_change(
         MATCH_ALL, async_entity_state_listener
     )
+
+    @callback
+    def unsub():
+        """Stop reporting states."""
+        unsub_state_change()
+
+        if unsub_pending is not None:
+            unsub_pending()
+
+        pending.clear()
+
+    return unsub
@@ -1,4 +1,5 @@
 """Extend the basic Accessory and Bridge functions."""
+from collections import defaultdict, deque
 from datetime import timedelta
 from functools import partial, wraps
 from inspect import getmodule
@@ -13,13 +14,11 @@ from homeassistant.const import (
     ATTR_BATTERY_LEVEL,
     ATTR_ENTITY_ID,
     ATTR_SERVICE,
+    EVENT_STATE_CHANGED,
     __version__,
 )
 from homeassistant.core import callback as ha_callback, split_entity_id
-from homeassistant.helpers.event import (
-    async_track_state_change,
-    track_point_in_utc_time,
-)
+from homeassistant.helpers.event import track_point_in_utc_time
 from homeassistant.util import dt as dt_util
 
 from .const import (
@@ -32,6 +31,7 @@ from .const import (
     CHAR_STATUS_LOW_BATTERY,
     CONF_LINKED_BATTERY_SENSOR,
     CONF_LOW_BATTERY_THRESHOLD,
+    DATA_STATE_ROUTER,
     DEBOUNCE_TIMEOUT,
     DEFAULT_LOW_BATTERY_THRESHOLD,
     EVENT_HOMEKIT_CHANGED,
@@ -74,6 +74,95 @@ def debounce(func):
     return wrapper
 
 
+@ha_callback
+def async_get_state_router(hass):
+    """Return the state router shared by all accessories."""
+    router = hass.data.get(DATA_STATE_ROUTER)
+    if router is None:
+        router = hass.data[DATA_STATE_ROUTER] = StateRouter(hass)
+    return router
+
+
+class StateRouter:
+    """Route state changes to accessories and run their updates in batches.
+
+    There is a single listener for state changes, no matter how many
+    accessories there are. Updates of characteristics are queued and run
+    one after another by a single executor job.
+    """
+
+    def __init__(self, hass):
+        """Initialize the state router."""
+        self.hass = hass
+        self._actions = defaultdict(list)
+        self._unsub = None
+        self._updates = deque()
+        self._running = False
+
+    @ha_callback
+    def async_track(self, entity_id, action):
+        """Call action(entity_id, old_state, new_state) when entity changes."""
+        if self._unsub is None:
+            self._unsub = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_state_changed
+            )
+        self._actions[entity_id].append(action)
+
+        @ha_callback
+        def async_remove():
+            """Stop calling action."""
+            actions = self._actions.get(entity_id)
+            if actions is None or action not in actions:
+                return
+            actions.remove(action)
+            if not actions:
+                del self._actions[entity_id]
+
+        return async_remove
+
+    @ha_callback
+    def _async_state_changed(self, event):
+        """Call the actions tracking the changed entity."""
+        entity_id = event.data.get(ATTR_ENTITY_ID)
+        actions = self._actions.get(entity_id)
+        if not actions:
+            return
+
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+        for action in list(actions):
+            action(entity_id, old_state, new_state)
+
+    @ha_callback
+    def async_queue_update(self, func, *args):
+        """Queue an update of characteristics to run in the executor."""
+        self._updates.append((func, args))
+        if not self._running:
+            self._running = True
+            self.hass.async_add_executor_job(self._run_updates)
+
+    def _run_updates(self):
+        """Run the queued updates.
+
+        Run inside the executor.
+        """
+        while self._updates:
+            func, args = self._updates.popleft()
+            try:
+                func(*args)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error updating accessory with %s", func)
+        self.hass.loop.call_soon_threadsafe(self._async_updates_done)
+
+    @ha_callback
+    def _async_updates_done(self):
+        """Start a new job for updates queued after the last one finished."""
+        self._running = False
+        if self._updates:
+            self._running = True
+            self.hass.async_add_executor_job(self._run_updates)
+
+
 class HomeAccessory(Accessory):
     """Adapter class for Accessory."""
 
@@ -134,25 +223,23 @@ class HomeAccessory(Accessory):
 
         Run inside the HAP-python event loop.
         """
-        self.hass.add_job(self.run_handler)
+        self.hass.loop.call_soon_threadsafe(self.run_handler)
 
-    async def run_handler(self):
+    @ha_callback
+    def run_handler(self):
         """Handle accessory driver started event.
 
         Run inside the Home Assistant event loop.
         """
+        router = async_get_state_router(self.hass)
         state = self.hass.states.get(self.entity_id)
-        self.hass.async_add_job(self.update_state_callback, None, None, state)
-        async_track_state_change(self.hass, self.entity_id, self.update_state_callback)
+        self.update_state_callback(None, None, state)
+        router.async_track(self.entity_id, self.update_state_callback)
 
         if self.linked_battery_sensor:
             battery_state = self.hass.states.get(self.linked_battery_sensor)
-            self.hass.async_add_job(
-                self.update_linked_battery, None, None, battery_state
-            )
-            async_track_state_change(
-                self.hass, self.linked_battery_sensor, self.update_linked_battery
-            )
+            self.update_linked_battery(None, None, battery_state)
+            router.async_track(self.linked_battery_sensor, self.update_linked_battery)
 
     @ha_callback
     def update_state_callback(self, entity_id=None, old_state=None, new_state=None):
@@ -160,14 +247,17 @@ class HomeAccessory(Accessory):
         _LOGGER.debug("New_state: %s", new_state)
         if new_state is None:
             return
+        router = async_get_state_router(self.hass)
         if self._support_battery_level and not self.linked_battery_sensor:
-            self.hass.async_add_executor_job(self.update_battery, new_state)
-        self.hass.async_add_executor_job(self.update_state, new_state)
+            router.async_queue_update(self.update_battery, new_state)
+        router.async_queue_update(self.update_state, new_state)
 
     @ha_callback
     def update_linked_battery(self, entity_id=None, old_state=None, new_state=None):
         """Handle linked battery sensor state change listener callback."""
-        self.hass.async_add_executor_job(self.update_battery, new_state)
+        async_get_state_router(self.hass).async_queue_update(
+            self.update_battery, new_state
+        )
 
     def update_battery(self, new_state):
         """Update battery service if available.
@@ -1,5 +1,6 @@
 """Constants used be the HomeKit component."""
 # #### Misc ####
+DATA_STATE_ROUTER = "homekit_state_router"
 DEBOUNCE_TIMEOUT = 0.5
 DOMAIN = "homekit"
 HOMEKIT_FILE = ".homekit.state"
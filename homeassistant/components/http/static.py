@@ -1,22 +1,99 @@
 """Static file handling for HTTP component."""
+import asyncio
+import logging
+import mimetypes
 from pathlib import Path
+import stat
+from time import monotonic
+from typing import Dict, Optional
 
 from aiohttp import hdrs
-from aiohttp.web import FileResponse
-from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound
+from aiohttp.web import FileResponse, Response
+from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound, HTTPNotModified
 from aiohttp.web_urldispatcher import StaticResource
+import attr
 
 # mypy: allow-untyped-defs
 
+_LOGGER = logging.getLogger(__name__)
+
 CACHE_TIME = 31 * 86400  # = 1 month
 CACHE_HEADERS = {hdrs.CACHE_CONTROL: f"public, max-age={CACHE_TIME}"}
 
+# Seconds before the details of a file are read from disk again
+STAT_CACHE_TIME = 60
+
+# Files up to this size are served from memory, up to a total per resource
+MAX_MEMORY_FILE_SIZE = 64 * 1024
+MAX_MEMORY_SIZE = 16 * 1024 * 1024
+
+# Precompressed variants of files, in order of preference
+ENCODING_EXTENSIONS = (("br", ".br"), ("gzip", ".gz"))
+
+
+@attr.s(slots=True)
+class StaticVariant:
+    """A file or a precompressed variant of it."""
+
+    path = attr.ib(type=Path)
+    etag = attr.ib(type=str)
+    mtime = attr.ib(type=float)
+    size = attr.ib(type=int)
+    body = attr.ib(type=Optional[bytes], default=None)
+
+
+@attr.s(slots=True)
+class StaticFile:
+    """A static file with its variants, keyed by content encoding."""
+
+    content_type = attr.ib(type=str)
+    encoding = attr.ib(type=Optional[str])
+    variants = attr.ib(type=Dict[Optional[str], StaticVariant])
+    loaded_at = attr.ib(type=float)
+
+    @property
+    def memory_size(self) -> int:
+        """Return the number of bytes kept in memory."""
+        return sum(
+            len(variant.body)
+            for variant in self.variants.values()
+            if variant.body is not None
+        )
+
+
+def _accepted_encodings(accept_encoding: str) -> set:
+    """Return the content encodings accepted by a client."""
+    accepted = set()
+    for coding in accept_encoding.lower().split(","):
+        name, _, params = coding.partition(";")
+        params = params.replace(" ", "")
+        try:
+            if params.startswith("q=") and float(params[2:]) == 0:
+                continue
+        except ValueError:
+            pass
+        accepted.add(name.strip())
+    return accepted
+
 
 class CachingStaticResource(StaticResource):
-    """Static Resource handler that will add cache headers."""
+    """Static Resource handler that will add cache headers.
 
-    async def _handle(self, request):
-        rel_url = request.match_info["filename"]
+    The details of served files are kept in an index, so requests do not
+    touch the disk from the event loop. Precompressed .br and .gz variants
+    of files are served to clients that accept them, small files are served
+    from memory and requests with a matching If-None-Match or
+    If-Modified-Since header are answered with 304 Not Modified.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the static resource."""
+        super().__init__(*args, **kwargs)
+        self._files: Dict[str, StaticFile] = {}
+        self._memory_size = 0
+
+    def _resolve(self, rel_url):
+        """Return the path of a file in the directory."""
         try:
             filename = Path(rel_url)
             if filename.anchor:
@@ -32,17 +109,128 @@ class CachingStaticResource(StaticResource):
             raise HTTPNotFound() from error
         except Exception as error:
             # perm error or other kind!
-            request.app.logger.exception(error)
+            _LOGGER.exception(error)
             raise HTTPNotFound() from error
+        return filepath
+
+    def _load(self, rel_url, current):
+        """Read the details of a file, None if it is a directory."""
+        filepath = self._resolve(rel_url)
 
         # on opening a dir, load its contents if allowed
         if filepath.is_dir():
-            return await super()._handle(request)
-        if filepath.is_file():
-            return FileResponse(
-                filepath,
-                chunk_size=self._chunk_size,
-                # type ignore: https://github.com/aio-libs/aiohttp/pull/3976
-                headers=CACHE_HEADERS,  # type: ignore
+            return None
+        if not filepath.is_file():
+            raise HTTPNotFound
+
+        content_type, encoding = mimetypes.guess_type(str(filepath))
+        variants = {}
+        for variant_encoding, extension in ((None, ""),) + ENCODING_EXTENSIONS:
+            path = filepath.with_name(filepath.name + extension)
+            try:
+                stat_result = path.stat()
+            except OSError:
+                continue
+            if not stat.S_ISREG(stat_result.st_mode):
+                continue
+
+            variant = StaticVariant(
+                path,
+                f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"',
+                stat_result.st_mtime,
+                stat_result.st_size,
             )
-        raise HTTPNotFound
+            previous = current and current.variants.get(variant_encoding)
+            if previous is not None and previous.etag == variant.etag:
+                variant.body = previous.body
+            elif (
+                variant.size <= MAX_MEMORY_FILE_SIZE
+                and self._memory_size + variant.size <= MAX_MEMORY_SIZE
+            ):
+                try:
+                    variant.body = path.read_bytes()
+                except OSError:
+                    pass
+            variants[variant_encoding] = variant
+
+        if None not in variants:
+            raise HTTPNotFound
+
+        return StaticFile(
+            content_type or "application/octet-stream", encoding, variants, monotonic(),
+        )
+
+    def _store(self, rel_url, static_file):
+        """Add a file to the index, keeping memory use within bounds."""
+        current = self._files.get(rel_url)
+        if current is not None:
+            self._memory_size -= current.memory_size
+        for variant in static_file.variants.values():
+            if variant.body is None:
+                continue
+            if self._memory_size + len(variant.body) > MAX_MEMORY_SIZE:
+                variant.body = None
+            else:
+                self._memory_size += len(variant.body)
+        self._files[rel_url] = static_file
+
+    async def _handle(self, request):
+        rel_url = request.match_info["filename"]
+        static_file = self._files.get(rel_url)
+
+        if (
+            static_file is None
+            or monotonic() - static_file.loaded_at >= STAT_CACHE_TIME
+        ):
+            loop = asyncio.get_running_loop()
+            loaded = await loop.run_in_executor(None, self._load, rel_url, static_file)
+            if loaded is None:
+                return await super()._handle(request)
+            self._store(rel_url, loaded)
+            static_file = loaded
+
+        accepted = _accepted_encodings(request.headers.get(hdrs.ACCEPT_ENCODING, ""))
+        content_encoding = static_file.encoding
+        variant = static_file.variants[None]
+        for encoding, _ in ENCODING_EXTENSIONS:
+            if encoding in accepted and encoding in static_file.variants:
+                content_encoding = encoding
+                variant = static_file.variants[encoding]
+                break
+
+        headers = {**CACHE_HEADERS, hdrs.ETAG: variant.etag}
+        if len(static_file.variants) > 1:
+            headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+
+        if_none_match = request.headers.get(hdrs.IF_NONE_MATCH)
+        if if_none_match is not None:
+            etags = {etag.strip() for etag in if_none_match.split(",")}
+            if "*" in etags or variant.etag in etags or f"W/{variant.etag}" in etags:
+                raise HTTPNotModified(headers=headers)
+        else:
+            modified_since = request.if_modified_since
+            if (
+                modified_since is not None
+                and int(variant.mtime) <= modified_since.timestamp()
+            ):
+                raise HTTPNotModified(headers=headers)
+
+        if content_encoding is not None:
+            headers[hdrs.CONTENT_ENCODING] = content_encoding
+
+        if variant.body is not None:
+            response = Response(
+                body=variant.body,
+                headers=headers,
+                content_type=static_file.content_type,
+            )
+            response.last_modified = variant.mtime
+            return response
+
+        headers[hdrs.CONTENT_TYPE] = static_file.content_type
+        return FileResponse(
+            variant.path,
+            chunk_size=self._chunk_size,
+            # type ignore: https://github.com/aio-libs/aiohttp/pull/3976
+            headers=headers,  # type: ignore
+        )
@@ -89,19 +89,6 @@ def calc_max(sensor_values):
     return val
 
 
-def calc_mean(sensor_values, round_digits):
-    """Calculate mean value, honoring unknown states."""
-    val = 0
-    count = 0
-    for sval in sensor_values:
-        if sval != STATE_UNKNOWN:
-            val += sval
-            count += 1
-    if count == 0:
-        return None
-    return round(val / count, round_digits)
-
-
 class MinMaxSensor(Entity):
     """Representation of a min/max sensor."""
 
@@ -123,6 +110,9 @@ class MinMaxSensor(Entity):
         self.min_value = self.max_value = self.mean = self.last = None
         self.count_sensors = len(self._entity_ids)
         self.states = {}
+        # Sum and number of the known values, to calculate the mean
+        self._sum = 0.0
+        self._count = 0
 
         @callback
         def async_min_max_sensor_state_listener(entity, old_state, new_state):
@@ -131,7 +121,7 @@ class MinMaxSensor(Entity):
                 STATE_UNKNOWN,
                 STATE_UNAVAILABLE,
             ]:
-                self.states[entity] = STATE_UNKNOWN
+                self._async_set_value(entity, STATE_UNKNOWN)
                 hass.async_add_job(self.async_update_ha_state, True)
                 return
 
@@ -149,12 +139,14 @@ class MinMaxSensor(Entity):
                 self._unit_of_measurement_mismatch = True
 
             try:
-                self.states[entity] = float(new_state.state)
-                self.last = float(new_state.state)
+                value = float(new_state.state)
             except ValueError:
                 _LOGGER.warning(
                     "Unable to store state. " "Only numerical states are supported"
                 )
+            else:
+                self._async_set_value(entity, value)
+                self.last = value
 
             hass.async_add_job(self.async_update_ha_state, True)
 
@@ -201,9 +193,44 @@ class MinMaxSensor(Entity):
         """Return the icon to use in the frontend, if any."""
         return ICON
 
+    @callback
+    def _async_set_value(self, entity, value):
+        """Store the value of a source and update the aggregates.
+
+        Only when the source that held the min or max value changes, all
+        values have to be compared again.
+        """
+        old_value = self.states.get(entity, STATE_UNKNOWN)
+        self.states[entity] = value
+
+        if old_value != STATE_UNKNOWN:
+            self._sum -= old_value
+            self._count -= 1
+        if value != STATE_UNKNOWN:
+            self._sum += value
+            self._count += 1
+
+        if not self._count:
+            # Start over to not accumulate rounding errors
+            self._sum = 0.0
+
+        if value != STATE_UNKNOWN and (
+            self.min_value is None or value <= self.min_value
+        ):
+            self.min_value = value
+        elif old_value == self.min_value:
+            self.min_value = calc_min(self.states.values())
+
+        if value != STATE_UNKNOWN and (
+            self.max_value is None or value >= self.max_value
+        ):
+            self.max_value = value
+        elif old_value == self.max_value:
+            self.max_value = calc_max(self.states.values())
+
     async def async_update(self):
         """Get the latest data and updates the states."""
-        sensor_values = [self.states[k] for k in self._entity_ids if k in self.states]
-        self.min_value = calc_min(sensor_values)
-        self.max_value = calc_max(sensor_values)
-        self.mean = calc_mean(sensor_values, self._round_digits)
+        if self._count:
+            self.mean = round(self._sum / self._count, self._round_digits)
+        else:
+            self.mean = None
@@ -1,8 +1,14 @@
 """Support for Modbus."""
+from collections import defaultdict
 import logging
 import threading
 
+from pymodbus.bit_read_message import ReadCoilsResponse
 from pymodbus.client.sync import ModbusSerialClient, ModbusTcpClient, ModbusUdpClient
+from pymodbus.register_read_message import (
+    ReadHoldingRegistersResponse,
+    ReadInputRegistersResponse,
+)
 from pymodbus.transaction import ModbusRtuFramer
 import voluptuous as vol
 
@@ -27,18 +33,34 @@ ATTR_UNIT = "unit"
 ATTR_VALUE = "value"
 
 CONF_BAUDRATE = "baudrate"
+CONF_BLOCK_GAP = "block_gap"
 CONF_BYTESIZE = "bytesize"
 CONF_HUB = "hub"
+CONF_MAX_BLOCK_SIZE = "max_block_size"
 CONF_PARITY = "parity"
 CONF_STOPBITS = "stopbits"
 
+DEFAULT_BLOCK_GAP = 0
 DEFAULT_HUB = "default"
+DEFAULT_MAX_BLOCK_SIZE = 125
 DOMAIN = "modbus"
 
+READ_COILS = "coils"
+READ_HOLDING_REGISTERS = "holding_registers"
+READ_INPUT_REGISTERS = "input_registers"
+
 SERVICE_WRITE_COIL = "write_coil"
 SERVICE_WRITE_REGISTER = "write_register"
 
-BASE_SCHEMA = vol.Schema({vol.Optional(CONF_NAME, default=DEFAULT_HUB): cv.string})
+BASE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_NAME, default=DEFAULT_HUB): cv.string,
+        vol.Optional(CONF_BLOCK_GAP, default=DEFAULT_BLOCK_GAP): cv.positive_int,
+        vol.Optional(CONF_MAX_BLOCK_SIZE, default=DEFAULT_MAX_BLOCK_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=DEFAULT_MAX_BLOCK_SIZE)
+        ),
+    }
+)
 
 SERIAL_SCHEMA = BASE_SCHEMA.extend(
     {
@@ -131,7 +153,12 @@ def setup(hass, config):
     for client_config in config[DOMAIN]:
         client = setup_client(client_config)
         name = client_config[CONF_NAME]
-        hub_collect[name] = ModbusHub(client, name)
+        hub_collect[name] = ModbusHub(
+            client,
+            name,
+            client_config[CONF_BLOCK_GAP],
+            client_config[CONF_MAX_BLOCK_SIZE],
+        )
         _LOGGER.debug("Setting up hub: %s", client_config)
 
     def stop_modbus(event):
@@ -183,14 +210,74 @@ def setup(hass, config):
     return True
 
 
-class ModbusHub:
-    """Thread safe wrapper class for pymodbus."""
+class ReadBlock:
+    """Contiguous range of coils or registers that is read at once."""
+
+    def __init__(self, read_type, unit, address, end):
+        """Initialize the read block."""
+        self.read_type = read_type
+        self.unit = unit
+        self.address = address
+        self.end = end
+        self.ranges = set()
+        self.result = None
+        self.unused_by = set()
+
+
+def plan_read_blocks(ranges, block_gap, max_block_size):
+    """Group ranges of coils or registers into blocks that are read at once.
+
+    Ranges are (read type, unit, address, count) tuples. Ranges of the same
+    type and unit end up in one block if there are at most block_gap unused
+    addresses between them and the block doesn't exceed max_block_size.
+    """
+    grouped = defaultdict(list)
+    for read_range in ranges:
+        grouped[read_range[:2]].append(read_range)
+
+    blocks = {}
+    for (read_type, unit), unit_ranges in grouped.items():
+        block = None
+        for read_range in sorted(unit_ranges, key=lambda item: item[2:]):
+            address, count = read_range[2:]
+            end = address + count
+            if (
+                block is None
+                or address > block.end + block_gap
+                or max(end, block.end) - block.address > max_block_size
+            ):
+                block = ReadBlock(read_type, unit, address, end)
+            block.end = max(block.end, end)
+            block.ranges.add(read_range)
+            blocks[read_range] = block
+
+    return blocks
+
 
-    def __init__(self, modbus_client, name):
+class ModbusHub:
+    """Thread safe wrapper class for pymodbus.
+
+    Entities can announce the ranges they read with register_read. Those are
+    read in blocks: the first entity that reads a range of a block reads the
+    whole block, the other entities get their part of that result. The block
+    is read again once an entity reads a range a second time.
+    """
+
+    def __init__(
+        self,
+        modbus_client,
+        name,
+        block_gap=DEFAULT_BLOCK_GAP,
+        max_block_size=DEFAULT_MAX_BLOCK_SIZE,
+    ):
         """Initialize the Modbus hub."""
         self._client = modbus_client
         self._lock = threading.Lock()
         self._name = name
+        self._block_gap = block_gap
+        self._max_block_size = max_block_size
+        self._read_ranges = set()
+        self._read_blocks = None
 
     @property
     def name(self):
@@ -207,38 +294,91 @@ class ModbusHub:
         with self._lock:
             self._client.connect()
 
-    def read_coils(self, unit, address, count):
-        """Read coils."""
+    def register_read(self, read_type, unit, address, count):
+        """Announce a range that is read periodically."""
         with self._lock:
-            kwargs = {"unit": unit} if unit else {}
+            self._read_ranges.add((read_type, unit, address, count))
+            self._read_blocks = None
+
+    def _read(self, read_type, unit, address, count):
+        """Read from the client, the lock has to be held."""
+        kwargs = {"unit": unit} if unit else {}
+        if read_type == READ_COILS:
             return self._client.read_coils(address, count, **kwargs)
+        if read_type == READ_INPUT_REGISTERS:
+            return self._client.read_input_registers(address, count, **kwargs)
+        return self._client.read_holding_registers(address, count, **kwargs)
+
+    def _read_planned(self, read_type, unit, address, count):
+        """Read a range, through its block if it was announced."""
+        with self._lock:
+            if self._read_blocks is None:
+                self._read_blocks = plan_read_blocks(
+                    self._read_ranges, self._block_gap, self._max_block_size
+                )
+
+            read_range = (read_type, unit, address, count)
+            block = self._read_blocks.get(read_range)
+            if block is None:
+                return self._read(read_type, unit, address, count)
+
+            if block.result is None or read_range not in block.unused_by:
+                block.result = self._read(
+                    read_type, unit, block.address, block.end - block.address
+                )
+                block.unused_by = set(block.ranges)
+            block.unused_by.discard(read_range)
+            result = block.result
+
+        start = address - block.address
+        if read_type == READ_COILS:
+            bits = getattr(result, "bits", None)
+            if bits is None:
+                return result
+            return ReadCoilsResponse(bits[start : start + count])
+
+        registers = getattr(result, "registers", None)
+        if registers is None:
+            return result
+        if read_type == READ_INPUT_REGISTERS:
+            return ReadInputRegistersResponse(registers[start : start + count])
+        return ReadHoldingRegistersResponse(registers[start : start + count])
+
+    def _invalidate_blocks(self, read_type, unit):
+        """Make sure written values are read again, the lock has to be held."""
+        for block in (self._read_blocks or {}).values():
+            if block.read_type == read_type and block.unit == unit:
+                block.result = None
+
+    def read_coils(self, unit, address, count):
+        """Read coils."""
+        return self._read_planned(READ_COILS, unit, address, count)
 
     def read_input_registers(self, unit, address, count):
         """Read input registers."""
-        with self._lock:
-            kwargs = {"unit": unit} if unit else {}
-            return self._client.read_input_registers(address, count, **kwargs)
+        return self._read_planned(READ_INPUT_REGISTERS, unit, address, count)
 
     def read_holding_registers(self, unit, address, count):
         """Read holding registers."""
-        with self._lock:
-            kwargs = {"unit": unit} if unit else {}
-            return self._client.read_holding_registers(address, count, **kwargs)
+        return self._read_planned(READ_HOLDING_REGISTERS, unit, address, count)
 
     def write_coil(self, unit, address, value):
         """Write coil."""
         with self._lock:
             kwargs = {"unit": unit} if unit else {}
             self._client.write_coil(address, value, **kwargs)
+            self._invalidate_blocks(READ_COILS, unit)
 
     def write_register(self, unit, address, value):
         """Write register."""
         with self._lock:
             kwargs = {"unit": unit} if unit else {}
             self._client.write_register(address, value, **kwargs)
+            self._invalidate_blocks(READ_HOLDING_REGISTERS, unit)
 
     def write_registers(self, unit, address, values):
         """Write registers."""
         with self._lock:
             kwargs = {"unit": unit} if unit else {}
             self._client.write_registers(address, values, **kwargs)
+            self._invalidate_blocks(READ_HOLDING_REGISTERS, unit)
@@ -12,7 +12,7 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.const import CONF_DEVICE_CLASS, CONF_NAME, CONF_SLAVE
 from homeassistant.helpers import config_validation as cv
 
-from . import CONF_HUB, DEFAULT_HUB, DOMAIN as MODBUS_DOMAIN
+from . import CONF_HUB, DEFAULT_HUB, DOMAIN as MODBUS_DOMAIN, READ_COILS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -63,6 +63,7 @@ class ModbusCoilSensor(BinarySensorDevice):
         self._coil = int(coil)
         self._device_class = device_class
         self._value = None
+        hub.register_read(READ_COILS, self._slave, self._coil, 1)
 
     @property
     def name(self):
@@ -18,7 +18,7 @@ from homeassistant.const import (
 )
 import homeassistant.helpers.config_validation as cv
 
-from . import CONF_HUB, DEFAULT_HUB, DOMAIN as MODBUS_DOMAIN
+from . import CONF_HUB, DEFAULT_HUB, DOMAIN as MODBUS_DOMAIN, READ_HOLDING_REGISTERS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -149,6 +149,11 @@ class ModbusThermostat(ClimateDevice):
 
         self._structure = ">{}".format(data_types[self._data_type][self._count])
 
+        for register in (target_temp_register, current_temp_register):
+            hub.register_read(
+                READ_HOLDING_REGISTERS, self._slave, register, self._count
+            )
+
     @property
     def supported_features(self):
         """Return the list of supported features."""
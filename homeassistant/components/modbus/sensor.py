@@ -17,7 +17,13 @@ from homeassistant.const import (
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.restore_state import RestoreEntity
 
-from . import CONF_HUB, DEFAULT_HUB, DOMAIN as MODBUS_DOMAIN
+from . import (
+    CONF_HUB,
+    DEFAULT_HUB,
+    DOMAIN as MODBUS_DOMAIN,
+    READ_HOLDING_REGISTERS,
+    READ_INPUT_REGISTERS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -185,6 +191,12 @@ class ModbusRegisterSensor(RestoreEntity):
         self._device_class = device_class
         self._value = None
 
+        if self._register_type == REGISTER_TYPE_INPUT:
+            read_type = READ_INPUT_REGISTERS
+        else:
+            read_type = READ_HOLDING_REGISTERS
+        hub.register_read(read_type, self._slave, self._register, self._count)
+
     async def async_added_to_hass(self):
         """Handle entity which will be added."""
         state = await self.async_get_last_state()
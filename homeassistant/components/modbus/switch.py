@@ -15,7 +15,14 @@ from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.restore_state import RestoreEntity
 
-from . import CONF_HUB, DEFAULT_HUB, DOMAIN as MODBUS_DOMAIN
+from . import (
+    CONF_HUB,
+    DEFAULT_HUB,
+    DOMAIN as MODBUS_DOMAIN,
+    READ_COILS,
+    READ_HOLDING_REGISTERS,
+    READ_INPUT_REGISTERS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -116,6 +123,7 @@ class ModbusCoilSwitch(ToggleEntity, RestoreEntity):
         self._slave = int(slave) if slave else None
         self._coil = int(coil)
         self._is_on = None
+        hub.register_read(READ_COILS, self._slave, self._coil, 1)
 
     async def async_added_to_hass(self):
         """Handle entity which will be added."""
@@ -197,6 +205,13 @@ class ModbusRegisterSwitch(ModbusCoilSwitch):
 
         self._is_on = None
 
+        if self._verify_state:
+            if self._register_type == REGISTER_TYPE_INPUT:
+                read_type = READ_INPUT_REGISTERS
+            else:
+                read_type = READ_HOLDING_REGISTERS
+            hub.register_read(read_type, self._slave, self._register, 1)
+
     def turn_on(self, **kwargs):
         """Set switch on."""
         self._hub.write_register(self._slave, self._register, self._command_on)
@@ -1 +1,23 @@
 """The ping component."""
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import callback
+
+from .prober import PingProber
+
+DOMAIN = "ping"
+
+
+@callback
+def async_get_prober(hass):
+    """Return the prober shared by all ping platforms."""
+    prober = hass.data.get(DOMAIN)
+    if prober is None:
+        prober = hass.data[DOMAIN] = PingProber(hass.loop)
+
+        @callback
+        def async_close_prober(event):
+            """Close the prober."""
+            prober.close()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_close_prober)
+    return prober
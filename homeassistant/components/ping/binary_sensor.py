@@ -1,9 +1,6 @@
 """Tracks the latency of a host by sending ICMP echo requests (ping)."""
 from datetime import timedelta
 import logging
-import re
-import subprocess
-import sys
 
 import voluptuous as vol
 
@@ -11,6 +8,8 @@ from homeassistant.components.binary_sensor import PLATFORM_SCHEMA, BinarySensor
 from homeassistant.const import CONF_HOST, CONF_NAME
 import homeassistant.helpers.config_validation as cv
 
+from . import async_get_prober
+
 _LOGGER = logging.getLogger(__name__)
 
 ATTR_ROUND_TRIP_TIME_AVG = "round_trip_time_avg"
@@ -26,16 +25,6 @@ DEFAULT_DEVICE_CLASS = "connectivity"
 
 SCAN_INTERVAL = timedelta(minutes=5)
 
-PING_MATCHER = re.compile(
-    r"(?P<min>\d+.\d+)\/(?P<avg>\d+.\d+)\/(?P<max>\d+.\d+)\/(?P<mdev>\d+.\d+)"
-)
-
-PING_MATCHER_BUSYBOX = re.compile(
-    r"(?P<min>\d+.\d+)\/(?P<avg>\d+.\d+)\/(?P<max>\d+.\d+)"
-)
-
-WIN32_PING_MATCHER = re.compile(r"(?P<min>\d+)ms.+(?P<max>\d+)ms.+(?P<avg>\d+)ms")
-
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
         vol.Required(CONF_HOST): cv.string,
@@ -45,13 +34,13 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
 )
 
 
-def setup_platform(hass, config, add_entities, discovery_info=None):
+async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Set up the Ping Binary sensor."""
     name = config.get(CONF_NAME)
     host = config.get(CONF_HOST)
     count = config.get(CONF_PING_COUNT)
 
-    add_entities([PingBinarySensor(name, PingData(host, count))], True)
+    async_add_entities([PingBinarySensor(name, PingData(hass, host, count))], True)
 
 
 class PingBinarySensor(BinarySensorDevice):
@@ -88,64 +77,24 @@ class PingBinarySensor(BinarySensorDevice):
                 ATTR_ROUND_TRIP_TIME_MIN: self.ping.data["min"],
             }
 
-    def update(self):
+    async def async_update(self):
         """Get the latest data."""
-        self.ping.update()
+        await self.ping.async_update()
 
 
 class PingData:
     """The Class for handling the data retrieval."""
 
-    def __init__(self, host, count):
+    def __init__(self, hass, host, count):
         """Initialize the data object."""
+        self.hass = hass
         self._ip_address = host
         self._count = count
         self.data = {}
         self.available = False
 
-        if sys.platform == "win32":
-            self._ping_cmd = [
-                "ping",
-                "-n",
-                str(self._count),
-                "-w",
-                "1000",
-                self._ip_address,
-            ]
-        else:
-            self._ping_cmd = [
-                "ping",
-                "-n",
-                "-q",
-                "-c",
-                str(self._count),
-                "-W1",
-                self._ip_address,
-            ]
-
-    def ping(self):
-        """Send ICMP echo request and return details if success."""
-        pinger = subprocess.Popen(
-            self._ping_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-        )
-        try:
-            out = pinger.communicate()
-            _LOGGER.debug("Output is %s", str(out))
-            if sys.platform == "win32":
-                match = WIN32_PING_MATCHER.search(str(out).split("\n")[-1])
-                rtt_min, rtt_avg, rtt_max = match.groups()
-                return {"min": rtt_min, "avg": rtt_avg, "max": rtt_max, "mdev": ""}
-            if "max/" not in str(out):
-                match = PING_MATCHER_BUSYBOX.search(str(out).split("\n")[-1])
-                rtt_min, rtt_avg, rtt_max = match.groups()
-                return {"min": rtt_min, "avg": rtt_avg, "max": rtt_max, "mdev": ""}
-            match = PING_MATCHER.search(str(out).split("\n")[-1])
-            rtt_min, rtt_avg, rtt_max, rtt_mdev = match.groups()
-            return {"min": rtt_min, "avg": rtt_avg, "max": rtt_max, "mdev": rtt_mdev}
-        except (subprocess.CalledProcessError, AttributeError):
-            return False
-
-    def update(self):
+    async def async_update(self):
         """Retrieve the latest details from the host."""
-        self.data = self.ping()
+        prober = async_get_prober(self.hass)
+        self.data = await prober.async_ping(self._ip_address, self._count) or False
         self.available = bool(self.data)
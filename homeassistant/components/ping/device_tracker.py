@@ -1,8 +1,7 @@
 """Tracks devices by sending a ICMP echo request (ping)."""
+import asyncio
 from datetime import timedelta
 import logging
-import subprocess
-import sys
 
 import voluptuous as vol
 
@@ -14,6 +13,9 @@ from homeassistant.components.device_tracker.const import (
     SOURCE_TYPE_ROUTER,
 )
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.event import async_track_point_in_utc_time
+
+from . import async_get_prober
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,43 +38,27 @@ class Host:
         self.ip_address = ip_address
         self.dev_id = dev_id
         self._count = config[CONF_PING_COUNT]
-        if sys.platform == "win32":
-            self._ping_cmd = ["ping", "-n", "1", "-w", "1000", self.ip_address]
-        else:
-            self._ping_cmd = ["ping", "-n", "-q", "-c1", "-W1", self.ip_address]
-
-    def ping(self):
-        """Send an ICMP echo request and return True if success."""
-        pinger = subprocess.Popen(
-            self._ping_cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
-        )
-        try:
-            pinger.communicate()
-            return pinger.returncode == 0
-        except subprocess.CalledProcessError:
-            return False
 
-    def update(self, see):
+    async def async_update(self, async_see):
         """Update device state by sending one or more ping messages."""
-        failed = 0
-        while failed < self._count:  # check more times if host is unreachable
-            if self.ping():
-                see(dev_id=self.dev_id, source_type=SOURCE_TYPE_ROUTER)
-                return True
-            failed += 1
+        # Pings up to count times while the host is unreachable
+        prober = async_get_prober(self.hass)
+        if await prober.async_ping(self.ip_address, self._count, stop_on_reply=True):
+            await async_see(dev_id=self.dev_id, source_type=SOURCE_TYPE_ROUTER)
+            return True
 
-        _LOGGER.debug("No response from %s failed=%d", self.ip_address, failed)
+        _LOGGER.debug("No response from %s failed=%d", self.ip_address, self._count)
 
 
-def setup_scanner(hass, config, see, discovery_info=None):
+async def async_setup_scanner(hass, config, async_see, discovery_info=None):
     """Set up the Host objects and return the update function."""
     hosts = [
         Host(ip, dev_id, hass, config)
         for (dev_id, ip) in config[const.CONF_HOSTS].items()
     ]
+    # All hosts are pinged at the same time
     interval = config.get(
-        CONF_SCAN_INTERVAL,
-        timedelta(seconds=len(hosts) * config[CONF_PING_COUNT]) + SCAN_INTERVAL,
+        CONF_SCAN_INTERVAL, timedelta(seconds=config[CONF_PING_COUNT]) + SCAN_INTERVAL,
     )
     _LOGGER.debug(
         "Started ping tracker with interval=%s on hosts: %s",
@@ -80,15 +66,14 @@ def setup_scanner(hass, config, see, discovery_info=None):
         ",".join([host.ip_address for host in hosts]),
     )
 
-    def update_interval(now):
+    async def async_update_interval(now):
         """Update all the hosts on every interval time."""
         try:
-            for host in hosts:
-                host.update(see)
+            await asyncio.gather(*(host.async_update(async_see) for host in hosts))
         finally:
-            hass.helpers.event.track_point_in_utc_time(
-                update_interval, util.dt.utcnow() + interval
+            async_track_point_in_utc_time(
+                hass, async_update_interval, util.dt.utcnow() + interval
             )
 
-    update_interval(None)
+    await async_update_interval(None)
     return True
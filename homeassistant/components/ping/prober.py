@@ -0,0 +1,284 @@
+"""Send ICMP echo requests to many hosts without blocking the event loop."""
+import asyncio
+import itertools
+import logging
+import re
+import socket
+import statistics
+import struct
+import sys
+
+_LOGGER = logging.getLogger(__name__)
+
+ICMP_ECHO_REPLY = 0
+ICMP_ECHO_REQUEST = 8
+
+# Seconds between the echo requests to a host, and to wait for every reply
+PING_INTERVAL = 1
+PING_TIMEOUT = 1
+
+# Most ping processes run at the same time when ICMP sockets are not allowed
+MAX_PING_PROCESSES = 16
+
+PING_MATCHER = re.compile(
+    r"(?P<min>\d+.\d+)\/(?P<avg>\d+.\d+)\/(?P<max>\d+.\d+)\/(?P<mdev>\d+.\d+)"
+)
+
+PING_MATCHER_BUSYBOX = re.compile(
+    r"(?P<min>\d+.\d+)\/(?P<avg>\d+.\d+)\/(?P<max>\d+.\d+)"
+)
+
+WIN32_PING_MATCHER = re.compile(r"(?P<min>\d+)ms.+(?P<max>\d+)ms.+(?P<avg>\d+)ms")
+
+
+def checksum(data):
+    """Return the internet checksum of data."""
+    if len(data) % 2:
+        data += b"\x00"
+    total = sum(struct.unpack("!%dH" % (len(data) // 2), data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def echo_request(identifier, sequence):
+    """Return an ICMP echo request packet."""
+    payload = b"home-assistant-ping"
+    header = struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, 0, identifier, sequence)
+    header = struct.pack(
+        "!BBHHH",
+        ICMP_ECHO_REQUEST,
+        0,
+        checksum(header + payload),
+        identifier,
+        sequence,
+    )
+    return header + payload
+
+
+def round_trip_stats(round_trips):
+    """Return the statistics of round trip times like ping reports them."""
+    return {
+        "min": round(min(round_trips), 3),
+        "avg": round(statistics.mean(round_trips), 3),
+        "max": round(max(round_trips), 3),
+        "mdev": round(statistics.pstdev(round_trips), 3),
+    }
+
+
+def ping_command(host, count):
+    """Return the system ping command for a host."""
+    if sys.platform == "win32":
+        return ["ping", "-n", str(count), "-w", "1000", host]
+    return ["ping", "-n", "-q", "-c", str(count), "-W1", host]
+
+
+def parse_ping_output(out):
+    """Return the round trip statistics from the output of ping."""
+    last_line = out.strip().split("\n")[-1]
+    if sys.platform == "win32":
+        match = WIN32_PING_MATCHER.search(last_line)
+        mdev = None
+    elif "max/" not in out:
+        match = PING_MATCHER_BUSYBOX.search(last_line)
+        mdev = None
+    else:
+        match = PING_MATCHER.search(last_line)
+        mdev = match and float(match.group("mdev"))
+    if match is None:
+        return None
+    return {
+        "min": float(match.group("min")),
+        "avg": float(match.group("avg")),
+        "max": float(match.group("max")),
+        "mdev": mdev,
+    }
+
+
+class PingProber:
+    """Ping many hosts at the same time.
+
+    All echo requests are sent and received on one ICMP socket that is
+    watched by the event loop, so pinging hosts does not take up executor
+    threads. An unprivileged ICMP socket is used if the system allows it,
+    otherwise a raw socket. If neither can be opened, the system ping
+    command is run as an asyncio subprocess instead.
+
+    Pings of a host that are requested while the same ping is running
+    share its result.
+    """
+
+    def __init__(self, loop):
+        """Initialize the prober."""
+        self.loop = loop
+        self._socket = None
+        self._raw = False
+        self._identifier = id(self) & 0xFFFF
+        self._sequence = itertools.count()
+        self._waiting = {}
+        self._probes = {}
+        self._process_semaphore = asyncio.Semaphore(MAX_PING_PROCESSES)
+
+        if sys.platform != "win32":
+            self._open_socket()
+
+    def _open_socket(self):
+        """Open the ICMP socket, if the system allows it."""
+        for sock_type in (socket.SOCK_DGRAM, socket.SOCK_RAW):
+            try:
+                sock = socket.socket(socket.AF_INET, sock_type, socket.IPPROTO_ICMP)
+            except OSError as err:
+                _LOGGER.debug(
+                    "Unable to open ICMP socket of type %s: %s", sock_type, err
+                )
+                continue
+            sock.setblocking(False)
+            self._socket = sock
+            self._raw = sock_type == socket.SOCK_RAW
+            self.loop.add_reader(sock.fileno(), self._read)
+            return
+        _LOGGER.debug("Using the ping command, ICMP sockets are not allowed")
+
+    def close(self):
+        """Close the ICMP socket."""
+        if self._socket is None:
+            return
+        self.loop.remove_reader(self._socket.fileno())
+        self._socket.close()
+        self._socket = None
+
+    def _read(self):
+        """Receive the available ICMP packets."""
+        while True:
+            try:
+                data, (address, _) = self._socket.recvfrom(1024)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as err:
+                _LOGGER.debug("Error receiving ICMP packet: %s", err)
+                return
+
+            received = self.loop.time()
+            if self._raw:
+                # Raw sockets receive the IP header too
+                data = data[(data[0] & 0x0F) * 4 :]
+            if len(data) < 8:
+                continue
+            icmp_type, _, _, identifier, sequence = struct.unpack("!BBHHH", data[:8])
+            # The system replaces the identifier of unprivileged ICMP sockets
+            if icmp_type != ICMP_ECHO_REPLY or (
+                self._raw and identifier != self._identifier
+            ):
+                continue
+
+            waiting = self._waiting.get(sequence)
+            if waiting is None:
+                continue
+            waiting_address, future = waiting
+            if waiting_address == address and not future.done():
+                future.set_result(received)
+
+    async def async_ping(self, host, count, stop_on_reply=False):
+        """Ping a host count times and return the round trip statistics.
+
+        Returns None if the host did not reply. Stops after the first reply
+        if stop_on_reply is set.
+        """
+        key = (host, count, stop_on_reply)
+        probe = self._probes.get(key)
+        if probe is None:
+            probe = self._probes[key] = self.loop.create_task(
+                self._async_probe(host, count, stop_on_reply)
+            )
+            probe.add_done_callback(lambda _: self._probes.pop(key, None))
+        return await asyncio.shield(probe)
+
+    async def _async_probe(self, host, count, stop_on_reply):
+        """Ping a host."""
+        address = None
+        if self._socket is not None:
+            try:
+                info = await self.loop.getaddrinfo(
+                    host, None, family=socket.AF_INET, type=socket.SOCK_RAW
+                )
+                address = info[0][4][0]
+            except (socket.gaierror, UnicodeError):
+                _LOGGER.debug("No IPv4 address for %s, using the ping command", host)
+
+        if address is None:
+            return await self._async_ping_command(host, count, stop_on_reply)
+
+        round_trips = []
+        next_echo = self.loop.time()
+        for _ in range(count):
+            delay = next_echo - self.loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            next_echo = self.loop.time() + PING_INTERVAL
+            round_trip = await self._async_echo(address)
+            if round_trip is not None:
+                round_trips.append(round_trip)
+                if stop_on_reply:
+                    break
+
+        _LOGGER.debug(
+            "Received %d of %d replies from %s", len(round_trips), count, host
+        )
+        if not round_trips:
+            return None
+        return round_trip_stats(round_trips)
+
+    async def _async_echo(self, address):
+        """Send one echo request and return the round trip time in ms."""
+        sequence = next(self._sequence) & 0xFFFF
+        future = self.loop.create_future()
+        self._waiting[sequence] = (address, future)
+        try:
+            sent = self.loop.time()
+            self._socket.sendto(echo_request(self._identifier, sequence), (address, 0))
+            received = await asyncio.wait_for(future, PING_TIMEOUT)
+            return (received - sent) * 1000
+        except (OSError, asyncio.TimeoutError):
+            return None
+        finally:
+            self._waiting.pop(sequence, None)
+
+    async def _async_ping_command(self, host, count, stop_on_reply):
+        """Ping a host with the system ping command."""
+        if stop_on_reply:
+            runs, run_count = count, 1
+        else:
+            runs, run_count = 1, count
+
+        for _ in range(runs):
+            async with self._process_semaphore:
+                result = await self._async_run_ping(host, run_count)
+            if result is not None:
+                return result
+        return None
+
+    async def _async_run_ping(self, host, count):
+        """Run the ping command and return the round trip statistics."""
+        try:
+            pinger = await asyncio.create_subprocess_exec(
+                *ping_command(host, count),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except OSError as err:
+            _LOGGER.error("Unable to run the ping command: %s", err)
+            return None
+
+        try:
+            out, _ = await asyncio.wait_for(
+                pinger.communicate(), count * PING_INTERVAL + PING_TIMEOUT + 5
+            )
+        except asyncio.TimeoutError:
+            pinger.kill()
+            await pinger.wait()
+            return None
+
+        _LOGGER.debug("Output is %s", out)
+        if pinger.returncode != 0:
+            return None
+        return parse_ping_output(out.decode("utf-8", "replace"))
@@ -81,7 +81,9 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
     else:
         auth = None
 
-    rest = RestData(method, resource, auth, headers, payload, verify_ssl, timeout)
+    rest = RestData(
+        method, resource, auth, headers, payload, verify_ssl, timeout, hass=hass
+    )
     rest.update()
     if rest.data is None:
         raise PlatformNotReady
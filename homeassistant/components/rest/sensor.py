@@ -23,12 +23,14 @@ from homeassistant.const import (
     CONF_USERNAME,
     CONF_VALUE_TEMPLATE,
     CONF_VERIFY_SSL,
+    EVENT_HOMEASSISTANT_STOP,
     HTTP_BASIC_AUTHENTICATION,
     HTTP_DIGEST_AUTHENTICATION,
 )
 from homeassistant.exceptions import PlatformNotReady
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import Entity
+from homeassistant.util.shared_fetch import SharedFetches
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,6 +43,9 @@ DEFAULT_TIMEOUT = 10
 CONF_JSON_ATTRS = "json_attributes"
 METHODS = ["POST", "GET"]
 
+# Identical requests of the RestData objects of a hass share their responses
+DATA_SHARED_FETCHES = "rest_shared_fetches"
+
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
         vol.Exclusive(CONF_RESOURCE, CONF_RESOURCE): cv.url,
@@ -101,7 +106,9 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
             auth = HTTPBasicAuth(username, password)
     else:
         auth = None
-    rest = RestData(method, resource, auth, headers, payload, verify_ssl, timeout)
+    rest = RestData(
+        method, resource, auth, headers, payload, verify_ssl, timeout, hass=hass
+    )
     rest.update()
     if rest.data is None:
         raise PlatformNotReady
@@ -229,9 +236,27 @@ class RestData:
     """Class for handling the data retrieval."""
 
     def __init__(
-        self, method, resource, auth, headers, data, verify_ssl, timeout=DEFAULT_TIMEOUT
+        self,
+        method,
+        resource,
+        auth,
+        headers,
+        data,
+        verify_ssl,
+        timeout=DEFAULT_TIMEOUT,
+        hass=None,
     ):
-        """Initialize the data object."""
+        """Initialize the data object.
+
+        If hass is passed, identical requests share their responses and the
+        connection is kept open between updates until Home Assistant stops.
+        """
+        self._hass = hass
+        self._shared_fetches = None
+        if hass is not None:
+            self._shared_fetches = hass.data.setdefault(
+                DATA_SHARED_FETCHES, SharedFetches()
+            )
         self._method = method
         self._resource = resource
         self._auth = auth
@@ -240,16 +265,50 @@ class RestData:
         self._verify_ssl = verify_ssl
         self._timeout = timeout
         self.data = None
+        self._session = None
 
     def set_url(self, url):
         """Set url."""
         self._resource = url
 
+    def _request_key(self):
+        """Return a key identifying the request."""
+        auth = self._auth
+        if auth is not None:
+            auth = (type(auth).__name__, auth.username, auth.password)
+        return (
+            self._method,
+            self._resource,
+            tuple(sorted((self._headers or {}).items())),
+            auth,
+            self._request_data,
+            self._verify_ssl,
+        )
+
     def update(self):
         """Get the latest data from REST service with provided method."""
+        if self._shared_fetches is None:
+            self.data = self._fetch()
+        else:
+            self.data = self._shared_fetches.get(self._request_key(), self, self._fetch)
+
+    def _fetch(self):
+        """Fetch the data from the REST service."""
         _LOGGER.debug("Updating from %s", self._resource)
+        if self._hass is None:
+            request = requests.request
+        else:
+            if self._session is None:
+                # Keeps the connection open between updates
+                self._session = requests.Session()
+                self._hass.bus.listen_once(
+                    EVENT_HOMEASSISTANT_STOP, self._close_session
+                )
+            # Like requests.request, don't send cookies of earlier responses
+            self._session.cookies.clear()
+            request = self._session.request
         try:
-            response = requests.request(
+            response = request(
                 self._method,
                 self._resource,
                 headers=self._headers,
@@ -258,7 +317,13 @@ class RestData:
                 timeout=self._timeout,
                 verify=self._verify_ssl,
             )
-            self.data = response.text
+            return response.text
         except requests.exceptions.RequestException as ex:
             _LOGGER.error("Error fetching data: %s failed with %s", self._resource, ex)
-            self.data = None
+            return None
+
+    def _close_session(self, event):
+        """Close the connection when Home Assistant stops."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
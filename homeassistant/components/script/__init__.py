@@ -1,5 +1,6 @@
 """Support for scripts."""
 import asyncio
+import copy
 import logging
 
 import voluptuous as vol
@@ -81,7 +82,7 @@ async def async_setup(hass, config):
 
     async def reload_service(service):
         """Call a service to reload scripts."""
-        conf = await component.async_prepare_reload()
+        conf = await component.async_prepare_reload(skip_reset=True)
         if conf is None:
             return
 
@@ -129,7 +130,11 @@ async def async_setup(hass, config):
 
 
 async def _async_process_config(hass, config, component):
-    """Process script configuration."""
+    """Process script configuration.
+
+    Scripts that are already loaded with the same config are left untouched,
+    so running scripts are not interrupted by a reload.
+    """
 
     async def service_handler(service):
         """Execute a service call to script.<script name>."""
@@ -140,11 +145,32 @@ async def _async_process_config(hass, config, component):
             return
         await script.async_turn_on(variables=service.data, context=service.context)
 
-    scripts = []
+    loaded = {script.object_id: script for script in component.entities}
+    removed = []
+    changed = {}
 
     for object_id, cfg in config.get(DOMAIN, {}).items():
+        current = loaded.pop(object_id, None)
+        if current is not None:
+            if current.config == cfg:
+                continue
+            removed.append(current)
+        changed[object_id] = cfg
+
+    # Removing a script also removes its service
+    removed.extend(loaded.values())
+    for script in removed:
+        await component.async_remove_entity(script.entity_id)
+
+    scripts = []
+
+    for object_id, cfg in changed.items():
         alias = cfg.get(CONF_ALIAS, object_id)
-        script = ScriptEntity(hass, object_id, alias, cfg[CONF_SEQUENCE])
+        # The script attaches hass to the templates in its sequence, keep a
+        # copy of the config as it was validated to compare on reload
+        script = ScriptEntity(
+            hass, object_id, alias, cfg[CONF_SEQUENCE], copy.deepcopy(cfg)
+        )
         scripts.append(script)
         hass.services.async_register(
             DOMAIN, object_id, service_handler, schema=SCRIPT_SERVICE_SCHEMA
@@ -163,9 +189,10 @@ async def _async_process_config(hass, config, component):
 class ScriptEntity(ToggleEntity):
     """Representation of a script entity."""
 
-    def __init__(self, hass, object_id, name, sequence):
+    def __init__(self, hass, object_id, name, sequence, config=None):
         """Initialize the script."""
         self.object_id = object_id
+        self.config = config
         self.entity_id = ENTITY_ID_FORMAT.format(object_id)
         self.script = Script(hass, sequence, name, self.async_update_ha_state)
 
@@ -9,6 +9,8 @@ CONF_PRIV_KEY = "priv_key"
 CONF_PRIV_PROTOCOL = "priv_protocol"
 CONF_VERSION = "version"
 
+DOMAIN = "snmp"
+
 DEFAULT_AUTH_PROTOCOL = "none"
 DEFAULT_COMMUNITY = "public"
 DEFAULT_HOST = "localhost"
@@ -1,6 +1,8 @@
 """Support for displaying collected data over SNMP."""
+import asyncio
 from datetime import timedelta
 import logging
+from time import monotonic
 
 import pysnmp.hlapi.asyncio as hlapi
 from pysnmp.hlapi.asyncio import (
@@ -45,6 +47,7 @@ from .const import (
     DEFAULT_PORT,
     DEFAULT_PRIV_PROTOCOL,
     DEFAULT_VERSION,
+    DOMAIN,
     MAP_AUTH_PROTOCOLS,
     MAP_PRIV_PROTOCOLS,
     SNMP_VERSIONS,
@@ -54,6 +57,9 @@ _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(seconds=10)
 
+# Most OIDs that are requested from an agent in one GET request
+MAX_OIDS_PER_REQUEST = 10
+
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
         vol.Required(CONF_BASEOID): cv.string,
@@ -100,45 +106,141 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     if value_template is not None:
         value_template.hass = hass
 
-    if version == "3":
-
-        if not authkey:
-            authproto = "none"
-        if not privkey:
-            privproto = "none"
-
-        request_args = [
-            SnmpEngine(),
-            UsmUserData(
-                username,
-                authKey=authkey or None,
-                privKey=privkey or None,
-                authProtocol=getattr(hlapi, MAP_AUTH_PROTOCOLS[authproto]),
-                privProtocol=getattr(hlapi, MAP_PRIV_PROTOCOLS[privproto]),
-            ),
-            UdpTransportTarget((host, port)),
-            ContextData(),
-        ]
-    else:
-        request_args = [
-            SnmpEngine(),
-            CommunityData(community, mpModel=SNMP_VERSIONS[version]),
-            UdpTransportTarget((host, port)),
-            ContextData(),
-        ]
+    agent_key = (
+        host,
+        port,
+        version,
+        community,
+        username,
+        authkey,
+        authproto,
+        privkey,
+        privproto,
+    )
+    agents = hass.data.setdefault(DOMAIN, {})
+    agent = agents.get(agent_key)
+
+    if agent is None:
+        if version == "3":
+
+            if not authkey:
+                authproto = "none"
+            if not privkey:
+                privproto = "none"
+
+            request_args = [
+                SnmpEngine(),
+                UsmUserData(
+                    username,
+                    authKey=authkey or None,
+                    privKey=privkey or None,
+                    authProtocol=getattr(hlapi, MAP_AUTH_PROTOCOLS[authproto]),
+                    privProtocol=getattr(hlapi, MAP_PRIV_PROTOCOLS[privproto]),
+                ),
+                UdpTransportTarget((host, port)),
+                ContextData(),
+            ]
+        else:
+            request_args = [
+                SnmpEngine(),
+                CommunityData(community, mpModel=SNMP_VERSIONS[version]),
+                UdpTransportTarget((host, port)),
+                ContextData(),
+            ]
+        agent = agents[agent_key] = SnmpAgent(request_args)
 
     errindication, _, _, _ = await getCmd(
-        *request_args, ObjectType(ObjectIdentity(baseoid))
+        *agent.request_args, ObjectType(ObjectIdentity(baseoid))
     )
 
     if errindication and not accept_errors:
         _LOGGER.error("Please check the details in the configuration file")
         return
 
-    data = SnmpData(request_args, baseoid, accept_errors, default_value)
+    agent.add_oid(baseoid)
+
+    data = SnmpData(agent, baseoid, accept_errors, default_value)
     async_add_entities([SnmpSensor(data, name, unit, value_template)], True)
 
 
+class SnmpAgent:
+    """Requests the OIDs of all sensors of an SNMP agent together.
+
+    All sensors of an agent share one SNMP engine and transport. When a
+    sensor updates, the values it did not get yet are handed out if they
+    were requested less than a scan interval ago. Otherwise the OIDs of
+    all sensors are requested again, up to MAX_OIDS_PER_REQUEST per GET
+    request. Sensors of an agent polling at the same interval therefore
+    cause a single round of requests per interval.
+    """
+
+    def __init__(self, request_args):
+        """Initialize the agent."""
+        self.request_args = request_args
+        self._oids = []
+        self._results = {}
+        self._requested_at = None
+        self._served = set()
+        self._lock = asyncio.Lock()
+
+    def add_oid(self, oid):
+        """Request an OID together with the others."""
+        if oid not in self._oids:
+            self._oids.append(oid)
+
+    async def async_get(self, consumer, oid):
+        """Return the error and the value of an OID for a consumer."""
+        async with self._lock:
+            if (
+                oid not in self._results
+                or consumer in self._served
+                or monotonic() - self._requested_at >= SCAN_INTERVAL.total_seconds()
+            ):
+                await self._async_request_all()
+            self._served.add(consumer)
+            return self._results[oid]
+
+    async def _async_request_all(self):
+        """Request the values of all OIDs."""
+        oids = self._oids
+        results = {}
+        for chunk_results in await asyncio.gather(
+            *(
+                self._async_request(oids[start : start + MAX_OIDS_PER_REQUEST])
+                for start in range(0, len(oids), MAX_OIDS_PER_REQUEST)
+            )
+        ):
+            results.update(chunk_results)
+        self._results = results
+        self._requested_at = monotonic()
+        self._served = set()
+
+    async def _async_request(self, oids):
+        """Request the values of OIDs with a single GET request."""
+        errindication, errstatus, errindex, restable = await getCmd(
+            *self.request_args, *(ObjectType(ObjectIdentity(oid)) for oid in oids)
+        )
+
+        if errindication:
+            return {oid: (errindication, None) for oid in oids}
+
+        if errstatus and len(oids) > 1:
+            # SNMPv1 agents fail the whole request if a single OID fails
+            results = {}
+            for oid in oids:
+                results.update(await self._async_request([oid]))
+            return results
+
+        if errstatus:
+            error = "{} at {}".format(
+                errstatus.prettyPrint(),
+                errindex and restable[-1][int(errindex) - 1] or "?",
+            )
+            return {oids[0]: (error, None)}
+
+        return {oid: (None, str(resrow[-1])) for oid, resrow in zip(oids, restable)}
+
+
 class SnmpSensor(Entity):
     """Representation of a SNMP sensor."""
 
@@ -183,9 +285,9 @@ class SnmpSensor(Entity):
 class SnmpData:
     """Get the latest data and update the states."""
 
-    def __init__(self, request_args, baseoid, accept_errors, default_value):
+    def __init__(self, agent, baseoid, accept_errors, default_value):
         """Initialize the data object."""
-        self._request_args = request_args
+        self._agent = agent
         self._baseoid = baseoid
         self._accept_errors = accept_errors
         self._default_value = default_value
@@ -193,21 +295,11 @@ class SnmpData:
 
     async def async_update(self):
         """Get the latest data from the remote SNMP capable host."""
+        error, value = await self._agent.async_get(self, self._baseoid)
 
-        errindication, errstatus, errindex, restable = await getCmd(
-            *self._request_args, ObjectType(ObjectIdentity(self._baseoid))
-        )
-
-        if errindication and not self._accept_errors:
-            _LOGGER.error("SNMP error: %s", errindication)
-        elif errstatus and not self._accept_errors:
-            _LOGGER.error(
-                "SNMP error: %s at %s",
-                errstatus.prettyPrint(),
-                errindex and restable[-1][int(errindex) - 1] or "?",
-            )
-        elif (errindication or errstatus) and self._accept_errors:
+        if error and not self._accept_errors:
+            _LOGGER.error("SNMP error: %s", error)
+        elif error:
             self.value = self._default_value
         else:
-            for resrow in restable:
-                self.value = str(resrow[-1])
+            self.value = value
@@ -13,19 +13,25 @@ from homeassistant.loader import bind_hass
 
 from .const import (
     ATTR_ENDPOINTS,
+    ATTR_LOOKBACK_MAX_BYTES,
     ATTR_STREAMS,
     CONF_DURATION,
     CONF_LOOKBACK,
+    CONF_LOOKBACK_MAX_BYTES,
     CONF_STREAM_SOURCE,
     DOMAIN,
     SERVICE_RECORD,
 )
 from .core import PROVIDERS
 from .hls import async_setup_hls
+from .lookback import async_setup_lookback
 
 _LOGGER = logging.getLogger(__name__)
 
-CONFIG_SCHEMA = vol.Schema({DOMAIN: vol.Schema({})}, extra=vol.ALLOW_EXTRA)
+CONFIG_SCHEMA = vol.Schema(
+    {DOMAIN: vol.Schema({vol.Optional(CONF_LOOKBACK_MAX_BYTES): cv.positive_int})},
+    extra=vol.ALLOW_EXTRA,
+)
 
 STREAM_SERVICE_SCHEMA = vol.Schema({vol.Required(CONF_STREAM_SOURCE): cv.string})
 
@@ -40,12 +46,8 @@ SERVICE_RECORD_SCHEMA = STREAM_SERVICE_SCHEMA.extend(
 logging.getLogger("libav").setLevel(logging.ERROR)
 
 
-@bind_hass
-def request_stream(hass, stream_source, *, fmt="hls", keepalive=False, options=None):
-    """Set up stream with token."""
-    if DOMAIN not in hass.config.components:
-        raise HomeAssistantError("Stream integration is not set up.")
-
+def _get_stream(hass, stream_source, keepalive, options):
+    """Get the stream for a source, creating it if needed."""
     if options is None:
         options = {}
 
@@ -58,15 +60,27 @@ def request_stream(hass, stream_source, *, fmt="hls", keepalive=False, options=N
         options["rtsp_flags"] = "prefer_tcp"
         options["stimeout"] = "5000000"
 
+    streams = hass.data[DOMAIN][ATTR_STREAMS]
+    stream = streams.get(stream_source)
+    if not stream:
+        stream = Stream(hass, stream_source, options=options, keepalive=keepalive)
+        streams[stream_source] = stream
+    else:
+        # Update keepalive option on existing stream, a lookback buffer
+        # always keeps the stream alive
+        stream.keepalive = keepalive or "lookback" in stream.outputs
+
+    return stream
+
+
+@bind_hass
+def request_stream(hass, stream_source, *, fmt="hls", keepalive=False, options=None):
+    """Set up stream with token."""
+    if DOMAIN not in hass.config.components:
+        raise HomeAssistantError("Stream integration is not set up.")
+
     try:
-        streams = hass.data[DOMAIN][ATTR_STREAMS]
-        stream = streams.get(stream_source)
-        if not stream:
-            stream = Stream(hass, stream_source, options=options, keepalive=keepalive)
-            streams[stream_source] = stream
-        else:
-            # Update keepalive option on existing stream
-            stream.keepalive = keepalive
+        stream = _get_stream(hass, stream_source, keepalive, options)
 
         # Add provider
         stream.add_provider(fmt)
@@ -79,6 +93,46 @@ def request_stream(hass, stream_source, *, fmt="hls", keepalive=False, options=N
         raise HomeAssistantError("Unable to get stream")
 
 
+@bind_hass
+def request_lookback(hass, stream_source, duration, *, max_bytes=None, options=None):
+    """Keep the last duration seconds of a stream available for recordings.
+
+    The stream is kept alive, so recordings can include up to duration
+    seconds of video from before the record service was called.
+    """
+    if DOMAIN not in hass.config.components:
+        raise HomeAssistantError("Stream integration is not set up.")
+
+    if max_bytes is None:
+        max_bytes = hass.data[DOMAIN].get(ATTR_LOOKBACK_MAX_BYTES)
+
+    try:
+        stream = _get_stream(hass, stream_source, True, options)
+        lookback = stream.add_provider("lookback")
+        lookback.max_duration = duration
+        lookback.max_bytes = max_bytes
+        stream.start()
+    except Exception:
+        raise HomeAssistantError("Unable to get stream")
+
+
+@bind_hass
+def stop_lookback(hass, stream_source, *, keepalive=False):
+    """Stop keeping a lookback buffer of a stream.
+
+    The stream is only kept alive afterwards if keepalive is set.
+    """
+    if DOMAIN not in hass.config.components:
+        raise HomeAssistantError("Stream integration is not set up.")
+
+    stream = hass.data[DOMAIN][ATTR_STREAMS].get(stream_source)
+    if stream is None or "lookback" not in stream.outputs:
+        return
+
+    stream.keepalive = keepalive
+    stream.outputs["lookback"].cleanup()
+
+
 async def async_setup(hass, config):
     """Set up stream."""
     # Keep import here so that we can import stream integration without installing reqs
@@ -88,6 +142,9 @@ async def async_setup(hass, config):
     hass.data[DOMAIN] = {}
     hass.data[DOMAIN][ATTR_ENDPOINTS] = {}
     hass.data[DOMAIN][ATTR_STREAMS] = {}
+    hass.data[DOMAIN][ATTR_LOOKBACK_MAX_BYTES] = config.get(DOMAIN, {}).get(
+        CONF_LOOKBACK_MAX_BYTES
+    )
 
     # Setup HLS
     hls_endpoint = async_setup_hls(hass)
@@ -96,6 +153,9 @@ async def async_setup(hass, config):
     # Setup Recorder
     async_setup_recorder(hass)
 
+    # Setup lookback buffer
+    async_setup_lookback(hass)
+
     @callback
     def shutdown(event):
         """Stop all stream workers."""
@@ -222,9 +282,15 @@ async def async_handle_record_service(hass, call):
 
     stream.start()
 
-    # Take advantage of lookback
+    # Take advantage of lookback, preferring the lookback buffer which can
+    # hold more than the few segments kept for HLS
+    lookback_output = stream.outputs.get("lookback")
     hls = stream.outputs.get("hls")
-    if lookback > 0 and hls:
+    if lookback > 0 and lookback_output:
+        # Wait for latest segment, then add the lookback
+        await lookback_output.recv()
+        recorder.prepend(lookback_output.get_lookback(lookback))
+    elif lookback > 0 and hls:
         num_segments = min(int(lookback // hls.target_duration), hls.num_segments)
         # Wait for latest segment, then add the lookback
         await hls.recv()
@@ -4,10 +4,12 @@ DOMAIN = "stream"
 CONF_STREAM_SOURCE = "stream_source"
 CONF_LOOKBACK = "lookback"
 CONF_DURATION = "duration"
+CONF_LOOKBACK_MAX_BYTES = "lookback_max_bytes"
 
 ATTR_ENDPOINTS = "endpoints"
 ATTR_STREAMS = "streams"
 ATTR_KEEPALIVE = "keepalive"
+ATTR_LOOKBACK_MAX_BYTES = "lookback_max_bytes"
 
 SERVICE_RECORD = "record"
 
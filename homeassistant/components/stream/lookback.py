@@ -0,0 +1,118 @@
+"""Provide a lookback buffer of recent stream segments."""
+from collections import deque
+from typing import List, Optional
+
+from homeassistant.core import callback
+
+from .core import PROVIDERS, Segment, StreamOutput
+
+
+@callback
+def async_setup_lookback(hass):
+    """Only here so Provider Registry works."""
+
+
+def _segment_size(segment: Segment) -> int:
+    """Return the size of an encoded segment in bytes."""
+    with segment.segment.getbuffer() as view:
+        return view.nbytes
+
+
+@PROVIDERS.register("lookback")
+class LookbackOutput(StreamOutput):
+    """Keep the most recent segments of a stream for recordings.
+
+    The buffer holds at least max_duration seconds of video, unless that
+    would exceed max_bytes.
+    """
+
+    def __init__(self, stream, timeout: int = 300) -> None:
+        """Initialize lookback output."""
+        super().__init__(stream, timeout)
+        # The buffer should not keep the stream access token alive
+        self.idle = True
+        self.max_duration = 0
+        self.max_bytes: Optional[int] = None
+        self._segments = deque()
+        self._duration = 0
+        self._size = 0
+
+    @property
+    def name(self) -> str:
+        """Return provider name."""
+        return "lookback"
+
+    @property
+    def format(self) -> str:
+        """Return container format."""
+        return "mpegts"
+
+    @property
+    def audio_codec(self) -> str:
+        """Return desired audio codec."""
+        return "aac"
+
+    @property
+    def video_codec(self) -> str:
+        """Return desired video codec."""
+        return "h264"
+
+    @property
+    def duration(self) -> float:
+        """Return the duration of the buffered segments in seconds."""
+        return self._duration
+
+    @property
+    def size(self) -> int:
+        """Return the size of the buffered segments in bytes."""
+        return self._size
+
+    def get_lookback(self, seconds: float) -> List[Segment]:
+        """Return the most recent segments covering the given seconds."""
+        segments = []
+        duration = 0
+
+        for segment in reversed(self._segments):
+            if duration >= seconds:
+                break
+            segments.append(segment)
+            duration += segment.duration
+
+        segments.reverse()
+        return segments
+
+    @callback
+    def put(self, segment: Segment) -> None:
+        """Store output and drop segments that are no longer needed."""
+        super().put(segment)
+
+        if segment is None:
+            return
+
+        self._duration += segment.duration
+        self._size += _segment_size(segment)
+
+        while len(self._segments) > 1 and (
+            self._duration - self._segments[0].duration >= self.max_duration
+            or (self.max_bytes is not None and self._size > self.max_bytes)
+        ):
+            oldest = self._segments.popleft()
+            self._duration -= oldest.duration
+            self._size -= _segment_size(oldest)
+
+    @callback
+    def _timeout(self, _now=None):
+        """Handle lookback timeout.
+
+        The buffer is kept until the stream stops, even if nobody reads it.
+        """
+        self._unsub = None
+        self.idle = True
+        self._stream.check_idle()
+
+    def cleanup(self):
+        """Handle cleanup."""
+        self._segments = deque()
+        self._duration = 0
+        self._size = 0
+        self._stream.remove_provider(self)
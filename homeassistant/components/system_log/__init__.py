@@ -23,6 +23,8 @@ DEFAULT_FIRE_EVENT = False
 DOMAIN = "system_log"
 
 EVENT_SYSTEM_LOG = "system_log_event"
+# Seconds between events for repeated occurrences of the same entry
+EVENT_INTERVAL = 1
 
 SERVICE_CLEAR = "clear"
 SERVICE_WRITE = "write"
@@ -93,6 +95,26 @@ def _figure_out_source(record, call_stack, hass):
     return record.pathname
 
 
+def _root_cause(record):
+    """Return the last frame of the traceback of a record, if any."""
+    if not record.exc_info:
+        return None
+
+    tb = record.exc_info[2]  # pylint: disable=invalid-name
+    if tb is None:
+        return None
+
+    # Only the last frame has to be extracted
+    while tb.tb_next is not None:
+        tb = tb.tb_next
+    return str(traceback.extract_tb(tb)[-1])
+
+
+def _dedup_key(message, root_cause):
+    """Return the key of an entry in the DedupStore."""
+    return str(frozenset([message, root_cause]))
+
+
 class LogEntry:
     """Store HA log entries."""
 
@@ -102,23 +124,21 @@ class LogEntry:
         self.level = record.levelname
         self.message = record.getMessage()
         self.exception = ""
-        self.root_cause = None
         if record.exc_info:
             self.exception = "".join(traceback.format_exception(*record.exc_info))
-            _, _, tb = record.exc_info  # pylint: disable=invalid-name
-            # Last line of traceback contains the root cause of the exception
-            if traceback.extract_tb(tb):
-                self.root_cause = str(traceback.extract_tb(tb)[-1])
+        # Last line of traceback contains the root cause of the exception
+        self.root_cause = _root_cause(record)
         self.source = source
         self.count = 1
 
     def hash(self):
         """Calculate a key for DedupStore."""
-        return frozenset([self.message, self.root_cause])
+        return _dedup_key(self.message, self.root_cause)
 
     def to_dict(self):
         """Convert object into dict to maintain backward compatibility."""
-        return vars(self)
+        # A copy, entries keep changing while events are handled
+        return dict(vars(self))
 
 
 class DedupStore(OrderedDict):
@@ -131,21 +151,26 @@ class DedupStore(OrderedDict):
 
     def add_entry(self, entry):
         """Add a new entry."""
-        key = str(entry.hash())
+        key = entry.hash()
 
-        if key in self:
-            # Update stored entry
-            self[key].count += 1
-            self[key].timestamp = entry.timestamp
-
-            self.move_to_end(key)
-        else:
+        if self.add_occurrence(key, entry.timestamp) is None:
             self[key] = entry
 
         if len(self) > self.maxlen:
             # Removes the first record which should also be the oldest
             self.popitem(last=False)
 
+    def add_occurrence(self, key, timestamp):
+        """Count another occurrence of a stored entry and return it."""
+        entry = self.get(key)
+        if entry is None:
+            return None
+
+        entry.count += 1
+        entry.timestamp = timestamp
+        self.move_to_end(key)
+        return entry
+
     def to_list(self):
         """Return reversed list of log entries - LIFO."""
         return [value.to_dict() for value in reversed(self.values())]
@@ -160,6 +185,8 @@ class LogErrorHandler(logging.Handler):
         self.hass = hass
         self.records = DedupStore(maxlen=maxlen)
         self.fire_event = fire_event
+        # When an event was last fired for each entry
+        self._event_fired = {}
 
     def emit(self, record):
         """Save error and warning logs.
@@ -167,18 +194,40 @@ class LogErrorHandler(logging.Handler):
         Everything logged with error or warning is saved in local buffer. A
         default upper limit is set to 50 (older entries are discarded) but can
         be changed if needed.
+
+        Repeated entries are only counted, the call stack and source are only
+        looked up for new entries.
         """
         if record.levelno >= logging.WARN:
-            stack = []
-            if not record.exc_info:
-                stack = [f for f, _, _, _ in traceback.extract_stack()]
+            key = _dedup_key(record.getMessage(), _root_cause(record))
+            entry = self.records.add_occurrence(key, record.created)
+
+            if entry is None:
+                stack = []
+                if not record.exc_info:
+                    stack = [f for f, _, _, _ in traceback.extract_stack()]
+
+                entry = LogEntry(
+                    record, stack, _figure_out_source(record, stack, self.hass)
+                )
+                self.records.add_entry(entry)
+            elif record.created - self._event_fired.get(key, 0) < EVENT_INTERVAL:
+                return
 
-            entry = LogEntry(
-                record, stack, _figure_out_source(record, stack, self.hass)
-            )
-            self.records.add_entry(entry)
             if self.fire_event:
-                self.hass.bus.fire(EVENT_SYSTEM_LOG, entry.to_dict())
+                self._fire_event(key, entry)
+
+    def _fire_event(self, key, entry):
+        """Fire an event for an entry."""
+        self._event_fired[key] = entry.timestamp
+        # Forget entries that are no longer stored
+        if len(self._event_fired) > 2 * self.records.maxlen:
+            self._event_fired = {
+                key: fired
+                for key, fired in self._event_fired.items()
+                if key in self.records
+            }
+        self.hass.bus.fire(EVENT_SYSTEM_LOG, entry.to_dict())
 
 
 async def async_setup(hass, config):
@@ -3,7 +3,6 @@ from collections import deque
 import logging
 import math
 
-import numpy as np
 import voluptuous as vol
 
 from homeassistant.components.binary_sensor import (
@@ -124,6 +123,11 @@ class SensorTrend(BinarySensorDevice):
         self._gradient = None
         self._state = None
         self.samples = deque(maxlen=max_samples)
+        # Running sums of the samples for the least squares fit. Timestamps
+        # are relative to the first sample to keep the sums precise.
+        self._offset = None
+        self._sums = None
+        self._removed = 0
 
     @property
     def name(self):
@@ -171,7 +175,7 @@ class SensorTrend(BinarySensorDevice):
                     state = new_state.state
                 if state not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
                     sample = (new_state.last_updated.timestamp(), float(state))
-                    self.samples.append(sample)
+                    self._add_sample(sample)
                     self.async_schedule_update_ha_state(True)
             except (ValueError, TypeError) as ex:
                 _LOGGER.error(ex)
@@ -186,13 +190,13 @@ class SensorTrend(BinarySensorDevice):
         if self._sample_duration > 0:
             cutoff = utcnow().timestamp() - self._sample_duration
             while self.samples and self.samples[0][0] < cutoff:
-                self.samples.popleft()
+                self._remove_sample(self.samples.popleft())
 
         if len(self.samples) < 2:
             return
 
         # Calculate gradient of linear trend
-        await self.hass.async_add_job(self._calculate_gradient)
+        self._calculate_gradient()
 
         # Update state
         self._state = (
@@ -203,12 +207,68 @@ class SensorTrend(BinarySensorDevice):
         if self._invert:
             self._state = not self._state
 
+    def _add_sample(self, sample):
+        """Add a sample, dropping the oldest one if the window is full."""
+        if self.samples and len(self.samples) == self.samples.maxlen:
+            self._remove_sample(self.samples[0])
+
+        self.samples.append(sample)
+
+        if self._sums is None:
+            self._rebuild_sums()
+            return
+
+        timestamp, value = sample
+        timestamp -= self._offset
+        self._sums[0] += timestamp
+        self._sums[1] += value
+        self._sums[2] += timestamp * timestamp
+        self._sums[3] += timestamp * value
+
+    def _remove_sample(self, sample):
+        """Remove a sample that leaves the window from the sums."""
+        if self._sums is None:
+            return
+
+        timestamp, value = sample
+        timestamp -= self._offset
+        self._sums[0] -= timestamp
+        self._sums[1] -= value
+        self._sums[2] -= timestamp * timestamp
+        self._sums[3] -= timestamp * value
+
+        # Recalculating once per window keeps rounding errors from adding up
+        # and the offset close to the samples, at constant amortized cost.
+        self._removed += 1
+        if self._removed >= len(self.samples):
+            self._sums = None
+
+    def _rebuild_sums(self):
+        """Calculate the sums of all samples."""
+        if not self.samples:
+            return
+
+        self._removed = 0
+        self._offset = self.samples[0][0]
+        self._sums = [0.0, 0.0, 0.0, 0.0]
+        for timestamp, value in self.samples:
+            timestamp -= self._offset
+            self._sums[0] += timestamp
+            self._sums[1] += value
+            self._sums[2] += timestamp * timestamp
+            self._sums[3] += timestamp * value
+
     def _calculate_gradient(self):
-        """Compute the linear trend gradient of the current samples.
-
-        This need run inside executor.
-        """
-        timestamps = np.array([t for t, _ in self.samples])
-        values = np.array([s for _, s in self.samples])
-        coeffs = np.polyfit(timestamps, values, 1)
-        self._gradient = coeffs[0]
+        """Compute the linear trend gradient of the current samples."""
+        if self._sums is None:
+            self._rebuild_sums()
+
+        count = len(self.samples)
+        sum_t, sum_v, sum_tt, sum_tv = self._sums
+        denominator = count * sum_tt - sum_t * sum_t
+        if denominator == 0:
+            # All samples are from the same moment
+            self._gradient = 0.0
+            return
+
+        self._gradient = (count * sum_tv - sum_t * sum_v) / denominator
@@ -7,7 +7,7 @@ from homeassistant.core import DOMAIN as HASS_DOMAIN, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceNotFound, Unauthorized
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.event import async_track_state_change
-from homeassistant.helpers.service import async_get_all_descriptions
+from homeassistant.helpers.service import async_get_all_descriptions_json
 
 from . import const, decorators, messages
 
@@ -21,10 +21,12 @@ def async_register_commands(hass, async_reg):
     async_reg(hass, handle_unsubscribe_events)
     async_reg(hass, handle_call_service)
     async_reg(hass, handle_get_states)
+    async_reg(hass, handle_subscribe_entities)
     async_reg(hass, handle_get_services)
     async_reg(hass, handle_get_config)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
+    async_reg(hass, handle_supported_features)
 
 
 def pong_message(iden):
@@ -181,6 +183,82 @@ def handle_get_states(hass, connection, msg):
     connection.send_message(messages.result_message(msg["id"], states))
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "subscribe_entities",
+        vol.Optional("entity_ids"): cv.entity_ids,
+    }
+)
+def handle_subscribe_entities(hass, connection, msg):
+    """Handle subscribe entities command.
+
+    Sends the states of all entities the user can read, followed by only the
+    changed fields of every state change. Uses the short keys of
+    messages.compressed_state_dict.
+
+    Async friendly.
+    """
+    entity_ids = msg.get("entity_ids")
+    if entity_ids is not None:
+        entity_ids = set(entity_ids)
+    entity_perm = connection.user.permissions.check_entity
+
+    @callback
+    def forward_entity_changes(event):
+        """Forward the changes of entity states to websocket."""
+        entity_id = event.data["entity_id"]
+        if entity_ids is not None and entity_id not in entity_ids:
+            return
+        if not entity_perm(entity_id, POLICY_READ):
+            return
+
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+        if new_state is None:
+            changes = {messages.ENTITY_EVENT_REMOVE: [entity_id]}
+        elif old_state is None:
+            changes = {
+                messages.ENTITY_EVENT_ADD: {
+                    entity_id: messages.compressed_state_dict(new_state)
+                }
+            }
+        else:
+            diff = messages.compressed_state_diff(old_state, new_state)
+            if not diff:
+                return
+            changes = {messages.ENTITY_EVENT_CHANGE: {entity_id: diff}}
+
+        connection.send_message(messages.event_message(msg["id"], changes))
+
+    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
+        EVENT_STATE_CHANGED, forward_entity_changes
+    )
+    connection.send_result(msg["id"])
+
+    if entity_ids is not None:
+        states = (hass.states.get(entity_id) for entity_id in entity_ids)
+        states = [state for state in states if state is not None]
+    else:
+        states = hass.states.async_all()
+    if not connection.user.permissions.access_all_entities(POLICY_READ):
+        states = [
+            state for state in states if entity_perm(state.entity_id, POLICY_READ)
+        ]
+
+    connection.send_message(
+        messages.event_message(
+            msg["id"],
+            {
+                messages.ENTITY_EVENT_ADD: {
+                    state.entity_id: messages.compressed_state_dict(state)
+                    for state in states
+                }
+            },
+        )
+    )
+
+
 @decorators.async_response
 @decorators.websocket_command({vol.Required("type"): "get_services"})
 async def handle_get_services(hass, connection, msg):
@@ -188,8 +266,8 @@ async def handle_get_services(hass, connection, msg):
 
     Async friendly.
     """
-    descriptions = await async_get_all_descriptions(hass)
-    connection.send_message(messages.result_message(msg["id"], descriptions))
+    payload = await async_get_all_descriptions_json(hass, const.JSON_DUMP)
+    connection.send_message(messages.construct_result_message(msg["id"], payload))
 
 
 @callback
@@ -252,3 +330,16 @@ def handle_render_template(hass, connection, msg):
 
     connection.send_result(msg["id"])
     state_listener()
+
+
+@callback
+@decorators.websocket_command(
+    {vol.Required("type"): "supported_features", vol.Required("features"): {str: int}}
+)
+def handle_supported_features(hass, connection, msg):
+    """Handle setting the features supported by the client.
+
+    Async friendly.
+    """
+    connection.supported_features = msg["features"]
+    connection.send_result(msg["id"])
@@ -16,6 +16,7 @@ from .const import (
     CANCELLATION_ERRORS,
     DATA_CONNECTIONS,
     ERR_UNKNOWN_ERROR,
+    FEATURE_COALESCE_MESSAGES,
     JSON_DUMP,
     MAX_PENDING_MSG,
     SIGNAL_WEBSOCKET_CONNECTED,
@@ -51,6 +52,7 @@ class WebSocketHandler:
         self._to_write: asyncio.Queue = asyncio.Queue(maxsize=MAX_PENDING_MSG)
         self._handle_task = None
         self._writer_task = None
+        self._connection = None
         self._logger = logging.getLogger("{}.connection.{}".format(__name__, id(self)))
 
     async def _writer(self):
@@ -62,26 +64,46 @@ class WebSocketHandler:
                 if message is None:
                     break
 
-                self._logger.debug("Sending %s", message)
-
-                if isinstance(message, str):
-                    await self.wsock.send_str(message)
-                    continue
-
-                try:
-                    dumped = JSON_DUMP(message)
-                except (ValueError, TypeError) as err:
-                    self._logger.error(
-                        "Unable to serialize to JSON: %s\n%s", err, message
+                messages = [message]
+                if (
+                    self._connection is not None
+                    and self._connection.supported_features.get(
+                        FEATURE_COALESCE_MESSAGES
                     )
-                    await self.wsock.send_json(
-                        error_message(
-                            message["id"], ERR_UNKNOWN_ERROR, "Invalid JSON in response"
-                        )
+                ):
+                    # Send the backlog as a JSON array in a single frame
+                    while not self._to_write.empty():
+                        message = self._to_write.get_nowait()
+                        if message is None:
+                            break
+                        messages.append(message)
+
+                if len(messages) == 1:
+                    await self.wsock.send_str(self._dump(messages[0]))
+                else:
+                    await self.wsock.send_str(
+                        "[" + ",".join(self._dump(msg) for msg in messages) + "]"
                     )
-                    continue
 
-                await self.wsock.send_str(dumped)
+                if message is None:
+                    break
+
+    def _dump(self, message):
+        """Return a message serialized to JSON."""
+        self._logger.debug("Sending %s", message)
+
+        if isinstance(message, str):
+            return message
+
+        try:
+            return JSON_DUMP(message)
+        except (ValueError, TypeError) as err:
+            self._logger.error("Unable to serialize to JSON: %s\n%s", err, message)
+            return JSON_DUMP(
+                error_message(
+                    message["id"], ERR_UNKNOWN_ERROR, "Invalid JSON in response"
+                )
+            )
 
     @callback
     def _send_message(self, message):
@@ -159,7 +181,7 @@ class WebSocketHandler:
                 raise Disconnect
 
             self._logger.debug("Received %s", msg_data)
-            connection = await auth.async_handle(msg_data)
+            connection = self._connection = await auth.async_handle(msg_data)
             self.hass.data[DATA_CONNECTIONS] = (
                 self.hass.data.get(DATA_CONNECTIONS, 0) + 1
             )
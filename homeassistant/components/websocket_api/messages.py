@@ -23,6 +23,11 @@ def result_message(iden, result=None):
     return {"id": iden, "type": const.TYPE_RESULT, "success": True, "result": result}
 
 
+def construct_result_message(iden, payload):
+    """Return a success result message with a result serialized to JSON."""
+    return f'{{"id":{iden},"type":"{const.TYPE_RESULT}","success":true,"result":{payload}}}'
+
+
 def error_message(iden, code, message):
     """Return an error result message."""
     return {
@@ -36,3 +41,71 @@ def error_message(iden, code, message):
 def event_message(iden, event):
     """Return an event message."""
     return {"id": iden, "type": "event", "event": event}
+
+
+# Short keys of states sent by subscribe_entities
+COMPRESSED_STATE_STATE = "s"
+COMPRESSED_STATE_ATTRIBUTES = "a"
+COMPRESSED_STATE_CONTEXT = "c"
+COMPRESSED_STATE_LAST_CHANGED = "lc"
+COMPRESSED_STATE_LAST_UPDATED = "lu"
+
+ENTITY_EVENT_ADD = "a"
+ENTITY_EVENT_CHANGE = "c"
+ENTITY_EVENT_REMOVE = "r"
+
+
+def _compressed_context(context):
+    """Return the context as an id if it has no parent or user."""
+    if context.parent_id is None and context.user_id is None:
+        return context.id
+    return context.as_dict()
+
+
+def compressed_state_dict(state):
+    """Return a state with short keys, leaving out a duplicate last updated."""
+    compressed = {
+        COMPRESSED_STATE_STATE: state.state,
+        COMPRESSED_STATE_ATTRIBUTES: dict(state.attributes),
+        COMPRESSED_STATE_CONTEXT: _compressed_context(state.context),
+        COMPRESSED_STATE_LAST_CHANGED: state.last_changed.timestamp(),
+    }
+    if state.last_updated != state.last_changed:
+        compressed[COMPRESSED_STATE_LAST_UPDATED] = state.last_updated.timestamp()
+    return compressed
+
+
+def compressed_state_diff(old_state, new_state):
+    """Return the fields of a state that changed, with short keys.
+
+    Changed and added fields are under "+", the keys of removed attributes
+    are under "-".
+    """
+    additions = {}
+    if old_state.state != new_state.state:
+        additions[COMPRESSED_STATE_STATE] = new_state.state
+    if old_state.last_changed != new_state.last_changed:
+        additions[COMPRESSED_STATE_LAST_CHANGED] = new_state.last_changed.timestamp()
+    elif old_state.last_updated != new_state.last_updated:
+        additions[COMPRESSED_STATE_LAST_UPDATED] = new_state.last_updated.timestamp()
+    if old_state.context != new_state.context:
+        additions[COMPRESSED_STATE_CONTEXT] = _compressed_context(new_state.context)
+
+    diff = {}
+    old_attributes = old_state.attributes
+    new_attributes = new_state.attributes
+    if old_attributes != new_attributes:
+        changed = {
+            key: value
+            for key, value in new_attributes.items()
+            if key not in old_attributes or old_attributes[key] != value
+        }
+        if changed:
+            additions[COMPRESSED_STATE_ATTRIBUTES] = changed
+        removed = [key for key in old_attributes if key not in new_attributes]
+        if removed:
+            diff["-"] = {COMPRESSED_STATE_ATTRIBUTES: removed}
+
+    if additions:
+        diff["+"] = additions
+    return diff
@@ -20,7 +20,6 @@ from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
 )
-from homeassistant.helpers.event import async_track_time_interval
 
 from .channels import EventRelayChannel
 from .const import (
@@ -97,9 +96,6 @@ class ZHADevice(LogMixin):
             self._zigpy_device.__class__.__module__,
             self._zigpy_device.__class__.__name__,
         )
-        self._available_check = async_track_time_interval(
-            self.hass, self._check_available, _UPDATE_ALIVE_INTERVAL
-        )
         self.status = DeviceStatus.CREATED
 
     @property
@@ -222,11 +218,17 @@ class ZHADevice(LogMixin):
         """Set availability from restore and prevent signals."""
         self._available = available
 
-    def _check_available(self, *_):
+    @callback
+    def async_check_available(self, now):
+        """Check if the device has been seen recently enough to be available.
+
+        Returns the time the device has to be checked again. The gateway
+        checks all devices, ordered by this time.
+        """
         if self.last_seen is None:
             self.update_available(False)
         else:
-            difference = time.time() - self.last_seen
+            difference = now - self.last_seen
             if difference > _KEEP_ALIVE_INTERVAL:
                 if self._checkins_missed_count < _CHECKIN_GRACE_PERIODS:
                     self._checkins_missed_count += 1
@@ -248,6 +250,10 @@ class ZHADevice(LogMixin):
             else:
                 self.update_available(True)
                 self._checkins_missed_count = 0
+                # Nothing to do until the device hasn't been seen for too long
+                return self.last_seen + _KEEP_ALIVE_INTERVAL
+
+        return now + _UPDATE_ALIVE_INTERVAL.total_seconds()
 
     def update_available(self, available):
         """Set sensor availability."""
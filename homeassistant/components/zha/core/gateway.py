@@ -7,9 +7,12 @@ https://home-assistant.io/integrations/zha/
 
 import asyncio
 import collections
+from datetime import timedelta
+import heapq
 import itertools
 import logging
 import os
+import time
 import traceback
 
 from homeassistant.components.system_log import LogEntry, _figure_out_source
@@ -19,6 +22,7 @@ from homeassistant.helpers.device_registry import (
     async_get_registry as get_dev_reg,
 )
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
 
 from .const import (
     ATTR_IEEE,
@@ -71,6 +75,8 @@ from .store import async_get_registry
 
 _LOGGER = logging.getLogger(__name__)
 
+AVAILABILITY_CHECK_INTERVAL = timedelta(seconds=60)
+
 EntityReference = collections.namedtuple(
     "EntityReference",
     "reference_id zha_device cluster_channels device_info remove_future",
@@ -86,6 +92,12 @@ class ZHAGateway:
         self._config = config
         self._devices = {}
         self._device_registry = collections.defaultdict(list)
+        self._entity_references = {}
+        # Devices ordered by when their availability has to be checked
+        self._availability_queue = []
+        self._availability_due = {}
+        self._availability_counter = itertools.count()
+        self._unsub_availability_check = None
         self.zha_storage = None
         self.ha_device_registry = None
         self.application_controller = None
@@ -201,6 +213,10 @@ class ZHAGateway:
         """Handle device being removed from the network."""
         zha_device = self._devices.pop(device.ieee, None)
         entity_refs = self._device_registry.pop(device.ieee, None)
+        self._availability_due.pop(device.ieee, None)
+        if entity_refs is not None:
+            for entity_ref in entity_refs:
+                self._entity_references.pop(entity_ref.reference_id, None)
         if zha_device is not None:
             device_info = async_get_device_info(self._hass, zha_device)
             zha_device.async_unsub_dispatcher()
@@ -228,14 +244,11 @@ class ZHAGateway:
 
     def get_entity_reference(self, entity_id):
         """Return entity reference for given entity_id if found."""
-        for entity_reference in itertools.chain.from_iterable(
-            self.device_registry.values()
-        ):
-            if entity_id == entity_reference.reference_id:
-                return entity_reference
+        return self._entity_references.get(entity_id)
 
     def remove_entity_reference(self, entity):
         """Remove entity reference for given entity_id if found."""
+        self._entity_references.pop(entity.entity_id, None)
         if entity.zha_device.ieee in self.device_registry:
             entity_refs = self.device_registry.get(entity.zha_device.ieee)
             self.device_registry[entity.zha_device.ieee] = [
@@ -262,16 +275,50 @@ class ZHAGateway:
         remove_future,
     ):
         """Record the creation of a hass entity associated with ieee."""
-        self._device_registry[ieee].append(
-            EntityReference(
-                reference_id=reference_id,
-                zha_device=zha_device,
-                cluster_channels=cluster_channels,
-                device_info=device_info,
-                remove_future=remove_future,
+        entity_ref = EntityReference(
+            reference_id=reference_id,
+            zha_device=zha_device,
+            cluster_channels=cluster_channels,
+            device_info=device_info,
+            remove_future=remove_future,
+        )
+        self._device_registry[ieee].append(entity_ref)
+        self._entity_references[reference_id] = entity_ref
+
+    @callback
+    def _async_schedule_availability_check(self, ieee, due):
+        """Schedule when the availability of a device has to be checked."""
+        if self._unsub_availability_check is None:
+            self._unsub_availability_check = async_track_time_interval(
+                self._hass, self._async_check_availability, AVAILABILITY_CHECK_INTERVAL
             )
+        self._availability_due[ieee] = due
+        heapq.heappush(
+            self._availability_queue, (due, next(self._availability_counter), ieee)
         )
 
+    @callback
+    def _async_check_availability(self, *_):
+        """Check the availability of all devices that are due in one sweep."""
+        now = time.time()
+        queue = self._availability_queue
+        due_devices = []
+        while queue and queue[0][0] <= now:
+            due, _, ieee = heapq.heappop(queue)
+            # Skip devices that were removed or rescheduled
+            if self._availability_due.get(ieee) != due:
+                continue
+            del self._availability_due[ieee]
+            due_devices.append(ieee)
+
+        # Devices are only scheduled again after the sweep, a device that is
+        # due right away again is checked on the next interval
+        for ieee in due_devices:
+            zha_device = self._devices[ieee]
+            self._async_schedule_availability_check(
+                ieee, zha_device.async_check_available(now)
+            )
+
     @callback
     def async_enable_debug_mode(self):
         """Enable debug mode for ZHA."""
@@ -300,6 +347,7 @@ class ZHAGateway:
         if zha_device is None:
             zha_device = ZHADevice(self._hass, zigpy_device, self)
             self._devices[zigpy_device.ieee] = zha_device
+            self._async_schedule_availability_check(zigpy_device.ieee, time.time())
             self.ha_device_registry.async_get_or_create(
                 config_entry_id=self._config_entry.entry_id,
                 connections={(CONNECTION_ZIGBEE, str(zha_device.ieee))},
@@ -441,6 +489,9 @@ class ZHAGateway:
     async def shutdown(self):
         """Stop ZHA Controller Application."""
         _LOGGER.debug("Shutting down ZHA ControllerApplication")
+        if self._unsub_availability_check is not None:
+            self._unsub_availability_check()
+            self._unsub_availability_check = None
         await self.application_controller.shutdown()
 
 
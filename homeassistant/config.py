@@ -53,7 +53,7 @@ from homeassistant.requirements import (
 )
 from homeassistant.util.package import is_docker_env
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM
-from homeassistant.util.yaml import SECRET_YAML, load_yaml
+from homeassistant.util.yaml import SECRET_YAML, load_yaml, save_cache
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -62,6 +62,7 @@ RE_YAML_ERROR = re.compile(r"homeassistant\.util\.yaml")
 RE_ASCII = re.compile(r"\033\[[^m]*m")
 YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
+YAML_CACHE_FILE = "yaml_cache"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE = "hass_customize"
 
@@ -337,6 +338,7 @@ def load_yaml_config_file(config_path: str) -> Dict[Any, Any]:
     This method needs to run in an executor.
     """
     conf_dict = load_yaml(config_path)
+    save_cache()
 
     if not isinstance(conf_dict, dict):
         msg = "The configuration file {} does not contain a dictionary".format(
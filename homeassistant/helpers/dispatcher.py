@@ -1,8 +1,10 @@
 """Helpers for Home Assistant dispatcher & internal component/platform."""
+import asyncio
+import functools
 import logging
 from typing import Any, Callable
 
-from homeassistant.core import callback
+from homeassistant.core import callback, is_callback
 from homeassistant.loader import bind_hass
 from homeassistant.util.async_ import run_callback_threadsafe
 from homeassistant.util.logging import catch_log_exception
@@ -12,6 +14,25 @@ from .typing import HomeAssistantType
 _LOGGER = logging.getLogger(__name__)
 DATA_DISPATCHER = "dispatcher"
 
+# How a target is run when a signal is sent
+JOB_CALLBACK = "callback"
+JOB_COROUTINE_FUNCTION = "coroutine_function"
+JOB_EXECUTOR = "executor"
+
+
+def _job_type(target: Callable[..., Any]) -> str:
+    """Determine how a target has to be run."""
+    # Check for partials to properly determine if coroutine function
+    check_target = target
+    while isinstance(check_target, functools.partial):
+        check_target = check_target.func
+
+    if is_callback(check_target):
+        return JOB_CALLBACK
+    if asyncio.iscoroutinefunction(check_target):
+        return JOB_COROUTINE_FUNCTION
+    return JOB_EXECUTOR
+
 
 @bind_hass
 def dispatcher_connect(
@@ -42,7 +63,7 @@ def async_dispatcher_connect(
         hass.data[DATA_DISPATCHER] = {}
 
     if signal not in hass.data[DATA_DISPATCHER]:
-        hass.data[DATA_DISPATCHER][signal] = []
+        hass.data[DATA_DISPATCHER][signal] = {}
 
     wrapped_target = catch_log_exception(
         target,
@@ -51,16 +72,16 @@ def async_dispatcher_connect(
         ),
     )
 
-    hass.data[DATA_DISPATCHER][signal].append(wrapped_target)
+    # Targets are classified once, not every time a signal is sent
+    hass.data[DATA_DISPATCHER][signal][wrapped_target] = _job_type(wrapped_target)
 
     @callback
     def async_remove_dispatcher() -> None:
         """Remove signal listener."""
         try:
-            hass.data[DATA_DISPATCHER][signal].remove(wrapped_target)
-        except (KeyError, ValueError):
-            # KeyError is key target listener did not exist
-            # ValueError if listener did not exist within signal
+            del hass.data[DATA_DISPATCHER][signal][wrapped_target]
+        except KeyError:
+            # Signal or target listener did not exist
             _LOGGER.warning("Unable to remove unknown dispatcher %s", target)
 
     return async_remove_dispatcher
@@ -77,9 +98,20 @@ def dispatcher_send(hass: HomeAssistantType, signal: str, *args: Any) -> None:
 def async_dispatcher_send(hass: HomeAssistantType, signal: str, *args: Any) -> None:
     """Send signal and data.
 
+    Callbacks are run right away, coroutine functions are scheduled as tasks
+    and other functions are run in the executor.
+
     This method must be run in the event loop.
     """
-    target_list = hass.data.get(DATA_DISPATCHER, {}).get(signal, [])
-
-    for target in target_list:
-        hass.async_add_job(target, *args)
+    targets = hass.data.get(DATA_DISPATCHER, {}).get(signal)
+    if not targets:
+        return
+
+    # Targets may connect or disconnect while callbacks are run
+    for target, job_type in list(targets.items()):
+        if job_type is JOB_CALLBACK:
+            target(*args)
+        elif job_type is JOB_COROUTINE_FUNCTION:
+            hass.async_create_task(target(*args))
+        else:
+            hass.async_add_executor_job(target, *args)
@@ -5,7 +5,7 @@ from datetime import datetime, timedelta
 import functools as ft
 import logging
 from timeit import default_timer as timer
-from typing import Any, Dict, Iterable, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from homeassistant.config import DATA_CUSTOMIZE
 from homeassistant.const import (
@@ -119,6 +119,16 @@ class Entity(ABC):
     _context: Optional[Context] = None
     _context_set: Optional[datetime] = None
 
+    # Registry entry, customize config and entity_id the values below are
+    # looked up from. They are looked up again when one of them is replaced.
+    _static_source: Optional[Tuple[Any, Any, Optional[str]]] = None
+    _static_name: Optional[str] = None
+    _static_customize: Optional[Dict] = None
+
+    # Unit and unit system the temperature conversion was checked for
+    _conversion_source: Optional[Tuple[Any, Any]] = None
+    _convert_temperature = False
+
     @property
     def should_poll(self) -> bool:
         """Return True if entity has to be polled for state.
@@ -329,9 +339,8 @@ class Entity(ABC):
         if unit_of_measurement is not None:
             attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
 
-        entry = self.registry_entry
-        # pylint: disable=consider-using-ternary
-        name = (entry and entry.name) or self.name
+        self._async_update_static_attributes()
+        name = self._static_name or self.name
         if name is not None:
             attr[ATTR_FRIENDLY_NAME] = name
 
@@ -373,24 +382,32 @@ class Entity(ABC):
             )
 
         # Overwrite properties that have been set in the config file.
-        if DATA_CUSTOMIZE in self.hass.data:
-            attr.update(self.hass.data[DATA_CUSTOMIZE].get(self.entity_id))
+        if self._static_customize is not None:
+            attr.update(self._static_customize)
 
         # Convert temperature if we detect one
-        try:
-            unit_of_measure = attr.get(ATTR_UNIT_OF_MEASUREMENT)
-            units = self.hass.config.units
-            if (
+        unit_of_measure = attr.get(ATTR_UNIT_OF_MEASUREMENT)
+        units = self.hass.config.units
+        conversion_source = self._conversion_source
+        if (
+            conversion_source is None
+            or conversion_source[0] != unit_of_measure
+            or conversion_source[1] is not units
+        ):
+            self._conversion_source = (unit_of_measure, units)
+            self._convert_temperature = (
                 unit_of_measure in (TEMP_CELSIUS, TEMP_FAHRENHEIT)
                 and unit_of_measure != units.temperature_unit
-            ):
+            )
+        if self._convert_temperature:
+            try:
                 prec = len(state) - state.index(".") - 1 if "." in state else 0
                 temp = units.temperature(float(state), unit_of_measure)
                 state = str(round(temp) if prec == 0 else round(temp, prec))
                 attr[ATTR_UNIT_OF_MEASUREMENT] = units.temperature_unit
-        except ValueError:
-            # Could not convert state to float
-            pass
+            except ValueError:
+                # Could not convert state to float
+                pass
 
         if (
             self._context is not None
@@ -403,6 +420,30 @@ class Entity(ABC):
             self.entity_id, state, attr, self.force_update, self._context
         )
 
+    @callback
+    def _async_update_static_attributes(self) -> None:
+        """Look up registry and customize values if their source changed.
+
+        The registry entry and the customize config are replaced when they
+        are updated or reloaded, so they are compared by identity.
+        """
+        entry = self.registry_entry
+        customize = self.hass.data.get(DATA_CUSTOMIZE)
+        source = self._static_source
+        if (
+            source is not None
+            and source[0] is entry
+            and source[1] is customize
+            and source[2] == self.entity_id
+        ):
+            return
+
+        self._static_source = (entry, customize, self.entity_id)
+        self._static_name = entry.name if entry is not None else None
+        self._static_customize = (
+            customize.get(self.entity_id) if customize is not None else None
+        )
+
     def schedule_update_ha_state(self, force_refresh=False):
         """Schedule an update ha state change task.
 
@@ -109,10 +109,13 @@ class RestoreStateData:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
         self.store: Store = Store(
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder, minify=True
         )
         self.last_states: Dict[str, StoredState] = {}
         self.entity_ids: Set[str] = set()
+        # The states written by the last successful dump, used to skip
+        # periodic dumps when nothing changed.
+        self._dumped_states: Optional[Dict[str, State]] = None
 
     def async_get_stored_states(self) -> List[StoredState]:
         """Get the set of states which should be stored.
@@ -147,18 +150,49 @@ class RestoreStateData:
 
         return stored_states
 
-    async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
+    @callback
+    def _async_states_changed(self, states: Dict[str, State]) -> bool:
+        """Return if the states differ from the last dumped states.
+
+        State objects are immutable and replaced on every change, so an
+        identity check is enough to find out if an entity changed.
+        """
+        dumped_states = self._dumped_states
+
+        if dumped_states is None or len(dumped_states) != len(states):
+            return True
+
+        return any(
+            dumped_states.get(entity_id) is not state
+            for entity_id, state in states.items()
+        )
+
+    async def async_dump_states(self, force: bool = False) -> None:
+        """Save the current state machine to storage.
+
+        Unless forced, the dump is skipped if no stored state changed since
+        the last successful dump.
+        """
+        stored_states = self.async_get_stored_states()
+        states = {
+            stored_state.state.entity_id: stored_state.state
+            for stored_state in stored_states
+        }
+
+        if not force and not self._async_states_changed(states):
+            _LOGGER.debug("Skipping dump, no states changed")
+            return
+
         _LOGGER.debug("Dumping states")
         try:
             await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+                [stored_state.as_dict() for stored_state in stored_states]
             )
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            return
+
+        self._dumped_states = states
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
@@ -167,6 +201,9 @@ class RestoreStateData:
         def _async_dump_states(*_: Any) -> None:
             self.hass.async_create_task(self.async_dump_states())
 
+        def _async_dump_all_states(*_: Any) -> None:
+            self.hass.async_create_task(self.async_dump_states(force=True))
+
         # Dump the initial states now. This helps minimize the risk of having
         # old states loaded by overwritting the last states once home assistant
         # has started and the old states have been read.
@@ -175,8 +212,11 @@ class RestoreStateData:
         # Dump states periodically
         async_track_time_interval(self.hass, _async_dump_states, STATE_DUMP_INTERVAL)
 
-        # Dump states when stopping hass
-        self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_dump_states)
+        # Dump states when stopping hass, this also refreshes the last seen
+        # time of states that did not change since the last dump.
+        self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, _async_dump_all_states
+        )
 
     @callback
     def async_restore_entity_added(self, entity_id: str) -> None:
@@ -33,6 +33,8 @@ CONF_SERVICE_DATA_TEMPLATE = "data_template"
 _LOGGER = logging.getLogger(__name__)
 
 SERVICE_DESCRIPTION_CACHE = "service_description_cache"
+ALL_SERVICE_DESCRIPTIONS_CACHE = "all_service_descriptions_cache"
+ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "all_service_descriptions_json_cache"
 
 
 @bind_hass
@@ -177,10 +179,21 @@ async def _load_services_file(hass: HomeAssistantType, domain: str) -> JSON_TYPE
 
 @bind_hass
 async def async_get_all_descriptions(hass):
-    """Return descriptions (i.e. user documentation) for all service calls."""
+    """Return descriptions (i.e. user documentation) for all service calls.
+
+    The result is shared between callers until a service is registered or
+    removed, or a description changes. It must not be modified.
+    """
     descriptions_cache = hass.data.setdefault(SERVICE_DESCRIPTION_CACHE, {})
     format_cache_key = "{}.{}".format
     services = hass.services.async_services()
+    all_services = {
+        (domain, service) for domain in services for service in services[domain]
+    }
+
+    all_cache = hass.data.get(ALL_SERVICE_DESCRIPTIONS_CACHE)
+    if all_cache is not None and all_cache[0] == all_services:
+        return all_cache[1]
 
     # See if there are new services not seen before.
     # Any service that we saw before already has an entry in description_cache.
@@ -226,9 +239,29 @@ async def async_get_all_descriptions(hass):
 
             descriptions[domain][service] = description
 
+    hass.data[ALL_SERVICE_DESCRIPTIONS_CACHE] = (all_services, descriptions)
     return descriptions
 
 
+@bind_hass
+async def async_get_all_descriptions_json(hass, serializer):
+    """Return the descriptions for all service calls serialized by serializer.
+
+    The serialized descriptions are cached per serializer until the
+    descriptions change.
+    """
+    descriptions = await async_get_all_descriptions(hass)
+
+    json_cache = hass.data.get(ALL_SERVICE_DESCRIPTIONS_JSON_CACHE)
+    if json_cache is None or json_cache[0] is not descriptions:
+        json_cache = hass.data[ALL_SERVICE_DESCRIPTIONS_JSON_CACHE] = (descriptions, {})
+
+    serialized = json_cache[1].get(serializer)
+    if serialized is None:
+        serialized = json_cache[1][serializer] = serializer(descriptions)
+    return serialized
+
+
 @ha.callback
 @bind_hass
 def async_set_service_schema(hass, domain, service, schema):
@@ -241,6 +274,8 @@ def async_set_service_schema(hass, domain, service, schema):
     }
 
     hass.data[SERVICE_DESCRIPTION_CACHE]["{}.{}".format(domain, service)] = description
+    hass.data.pop(ALL_SERVICE_DESCRIPTIONS_CACHE, None)
+    hass.data.pop(ALL_SERVICE_DESCRIPTIONS_JSON_CACHE, None)
 
 
 @bind_hass
@@ -3,7 +3,8 @@ import asyncio
 from json import JSONEncoder
 import logging
 import os
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
@@ -15,6 +16,7 @@ from homeassistant.util import json as json_util
 # mypy: no-check-untyped-defs
 
 STORAGE_DIR = ".storage"
+DATA_STORAGE_WRITER = "storage_writer"
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -64,8 +66,15 @@ class Store:
         private: bool = False,
         *,
         encoder: Optional[Type[JSONEncoder]] = None,
+        minify: bool = False,
+        dumps: Optional[json_util.JSONDumps] = None,
     ):
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        Stores that are large and not meant to be edited by hand can set
+        minify to write compact JSON instead of the indented format, or pass
+        their own serializer as dumps.
+        """
         self.version = version
         self.key = key
         self.hass = hass
@@ -76,6 +85,8 @@ class Store:
         self._write_lock = asyncio.Lock()
         self._load_task: Optional[asyncio.Future] = None
         self._encoder = encoder
+        self._minify = minify
+        self._dumps = dumps
 
     @property
     def path(self):
@@ -193,9 +204,7 @@ class Store:
 
         async with self._write_lock:
             try:
-                await self.hass.async_add_executor_job(
-                    self._write_data, self.path, data
-                )
+                await _async_get_writer(self.hass).async_write(self, data)
             except (json_util.SerializationError, json_util.WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
@@ -205,8 +214,112 @@ class Store:
             os.makedirs(os.path.dirname(path))
 
         _LOGGER.debug("Writing data for %s", self.key)
-        json_util.save_json(path, data, self._private, encoder=self._encoder)
+        start = time.monotonic()
+        json_util.save_json(
+            path,
+            data,
+            self._private,
+            encoder=self._encoder,
+            minify=self._minify,
+            dumps=self._dumps,
+        )
+        _LOGGER.debug(
+            "Writing data for %s took %.3f seconds", self.key, time.monotonic() - start
+        )
 
     async def _async_migrate_func(self, old_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
+
+
+@callback
+def _async_get_writer(hass: HomeAssistant) -> "_StorageWriter":
+    """Return the storage writer."""
+    writer = hass.data.get(DATA_STORAGE_WRITER)
+
+    if writer is None:
+        writer = hass.data[DATA_STORAGE_WRITER] = _StorageWriter(hass)
+
+    return writer
+
+
+class _StorageWriter:
+    """Write the data of stores in batches.
+
+    Writes that are requested in the same event loop iteration, like delayed
+    saves that are due at the same time or the saves when Home Assistant is
+    stopping, are written by a single executor job.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize the storage writer."""
+        self.hass = hass
+        self._queue: List[Tuple[Store, Dict, asyncio.Future]] = []
+
+    async def async_write(self, store: Store, data: Dict) -> None:
+        """Queue data to be written for a store and wait until it is written."""
+        future = self.hass.loop.create_future()
+
+        if not self._queue:
+            self.hass.loop.call_soon(self._async_flush)
+
+        self._queue.append((store, data, future))
+        await future
+
+    @callback
+    def _async_flush(self) -> None:
+        """Write all queued data."""
+        queue = self._queue
+        self._queue = []
+        self.hass.async_create_task(self._async_write_batch(queue))
+
+    async def _async_write_batch(
+        self, queue: List[Tuple[Store, Dict, asyncio.Future]]
+    ) -> None:
+        """Write a batch of data in the executor."""
+        try:
+            errors = await self.hass.async_add_executor_job(
+                _write_batch, [(store, data) for store, data, _ in queue]
+            )
+        except asyncio.CancelledError:
+            for _, _, future in queue:
+                future.cancel()
+            raise
+        except Exception as err:  # pylint: disable=broad-except
+            # For example when the executor was shut down, the stores that
+            # wait for this batch would wait forever without the error
+            for _, _, future in queue:
+                if not future.done():
+                    future.set_exception(err)
+            return
+
+        for (_, _, future), err in zip(queue, errors):
+            if future.done():
+                continue
+            if err is None:
+                future.set_result(None)
+            else:
+                future.set_exception(err)
+
+
+def _write_batch(batch: List[Tuple[Store, Dict]]) -> List[Optional[Exception]]:
+    """Write the data of multiple stores, collecting errors per store."""
+    errors: List[Optional[Exception]] = []
+    start = time.monotonic()
+
+    for store, data in batch:
+        try:
+            store._write_data(store.path, data)  # pylint: disable=protected-access
+        except Exception as err:  # pylint: disable=broad-except
+            errors.append(err)
+        else:
+            errors.append(None)
+
+    if len(batch) > 1:
+        _LOGGER.debug(
+            "Writing data for %s stores took %.3f seconds",
+            len(batch),
+            time.monotonic() - start,
+        )
+
+    return errors
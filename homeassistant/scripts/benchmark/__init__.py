@@ -138,6 +138,34 @@ async def async_million_state_changed_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def async_million_dispatcher_signals(hass):
+    """Send a million dispatcher signals."""
+    count = 0
+    signal = "benchmark_signal"
+    event = asyncio.Event()
+
+    @core.callback
+    def listener(*args):
+        """Handle signal."""
+        nonlocal count
+        count += 1
+
+        if count == 10 ** 6:
+            event.set()
+
+    hass.helpers.dispatcher.async_dispatcher_connect(signal, listener)
+
+    start = timer()
+
+    for _ in range(10 ** 6):
+        hass.helpers.dispatcher.async_dispatcher_send(signal, "data")
+
+    await event.wait()
+
+    return timer() - start
+
+
 @benchmark
 @asyncio.coroutine
 def logbook_filtering_state(hass):
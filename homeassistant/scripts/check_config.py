@@ -196,6 +196,7 @@ def check(config_dir, secrets=False):
     if secrets:
         # Ensure !secrets point to the patched function
         yaml_loader.yaml.SafeLoader.add_constructor("!secret", yaml_loader.secret_yaml)
+        yaml_loader.FastSafeLoader.add_constructor("!secret", yaml_loader.secret_yaml)
 
     try:
         hass = core.HomeAssistant()
@@ -224,6 +225,9 @@ def check(config_dir, secrets=False):
             yaml_loader.yaml.SafeLoader.add_constructor(
                 "!secret", yaml_loader.secret_yaml
             )
+            yaml_loader.FastSafeLoader.add_constructor(
+                "!secret", yaml_loader.secret_yaml
+            )
         bootstrap.clear_secret_cache()
 
     return res
@@ -10,6 +10,7 @@ import string
 import threading
 from types import MappingProxyType
 from typing import (
+    AbstractSet,
     Any,
     Callable,
     Coroutine,
@@ -80,7 +81,11 @@ def ensure_unique_string(
     If preferred string exists will append _2, _3, ..
     """
     test_string = preferred_string
-    current_strings_set = set(current_strings)
+    # Sets and dictionary views are searched directly instead of copied
+    if isinstance(current_strings, AbstractSet):
+        current_strings_set = current_strings
+    else:
+        current_strings_set = set(current_strings)
 
     tries = 1
 
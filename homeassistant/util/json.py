@@ -3,12 +3,19 @@ import json
 import logging
 import os
 import tempfile
-from typing import Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Type, Union
 
 from homeassistant.exceptions import HomeAssistantError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 _LOGGER = logging.getLogger(__name__)
 
+JSONDumps = Callable[[Any, Optional[Type[json.JSONEncoder]]], str]
+
 
 class SerializationError(HomeAssistantError):
     """Error serializing the data to JSON."""
@@ -40,21 +47,50 @@ def load_json(
     return {} if default is None else default
 
 
+def dumps_pretty(data: Any, encoder: Optional[Type[json.JSONEncoder]] = None) -> str:
+    """Serialize data to indented JSON with sorted keys."""
+    return json.dumps(data, sort_keys=True, indent=4, cls=encoder)
+
+
+def dumps_minified(data: Any, encoder: Optional[Type[json.JSONEncoder]] = None) -> str:
+    """Serialize data to compact JSON.
+
+    Uses orjson when it is installed, falling back to the standard library.
+    """
+    if orjson is not None:
+        return orjson.dumps(  # type: ignore
+            data,
+            default=None if encoder is None else encoder().default,
+            option=orjson.OPT_NON_STR_KEYS,
+        ).decode("utf-8")
+
+    return json.dumps(data, separators=(",", ":"), cls=encoder)
+
+
 def save_json(
     filename: str,
     data: Union[List, Dict],
     private: bool = False,
     *,
     encoder: Optional[Type[json.JSONEncoder]] = None,
+    minify: bool = False,
+    dumps: Optional[JSONDumps] = None,
 ) -> None:
     """Save JSON data to a file.
 
+    When minify is set, the data is written without indentation, whitespace
+    or key sorting, which is a lot faster and smaller for large documents.
+    A custom serializer can be passed in as dumps.
+
     Returns True on success.
     """
+    if dumps is None:
+        dumps = dumps_minified if minify else dumps_pretty
+
     tmp_filename = ""
     tmp_path = os.path.split(filename)[0]
     try:
-        json_data = json.dumps(data, sort_keys=True, indent=4, cls=encoder)
+        json_data = dumps(data, encoder)
         # Modern versions of Python tempfile create this file with mode 0o600
         with tempfile.NamedTemporaryFile(
             mode="w", encoding="utf-8", dir=tmp_path, delete=False
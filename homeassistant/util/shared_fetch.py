@@ -0,0 +1,76 @@
+"""Share the result of fetching a resource between its consumers."""
+import threading
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, Optional, Set
+
+# A result is at most shared between consumers fetching within this many seconds
+DEFAULT_MAX_AGE = 10
+
+
+class SharedFetch:
+    """Result of fetching a resource, shared by all consumers of the resource.
+
+    A consumer gets the last result if it was fetched less than max_age
+    seconds ago and the consumer did not get that result before. Otherwise
+    the resource is fetched again. Consumers that poll the same resource at
+    the same interval therefore cause a single fetch per interval, while
+    every consumer still sees a fresh result on each of its updates.
+    """
+
+    def __init__(self, max_age: float = DEFAULT_MAX_AGE) -> None:
+        """Initialize the shared fetch."""
+        self.max_age = max_age
+        self.fetched_at: Optional[float] = None
+        self._result: Any = None
+        self._served: Set[Hashable] = set()
+        self._lock = threading.Lock()
+
+    def get(self, consumer: Hashable, fetch: Callable[[], Any]) -> Any:
+        """Return the result for a consumer, fetching it if needed."""
+        with self._lock:
+            if (
+                self.fetched_at is not None
+                and consumer not in self._served
+                and monotonic() - self.fetched_at < self.max_age
+            ):
+                self._served.add(consumer)
+                return self._result
+
+            self._result = fetch()
+            self.fetched_at = monotonic()
+            self._served = {consumer}
+            return self._result
+
+
+class SharedFetches:
+    """Shared fetches of resources, identified by a key."""
+
+    def __init__(self, max_age: float = DEFAULT_MAX_AGE) -> None:
+        """Initialize the shared fetches."""
+        self.max_age = max_age
+        self._fetches: Dict[Hashable, SharedFetch] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, consumer: Hashable, fetch: Callable[[], Any]) -> Any:
+        """Return the result of the resource identified by key for a consumer."""
+        with self._lock:
+            shared = self._fetches.get(key)
+            if shared is None:
+                self._prune()
+                shared = self._fetches[key] = SharedFetch(self.max_age)
+        return shared.get(consumer, fetch)
+
+    def clear(self) -> None:
+        """Forget all results."""
+        with self._lock:
+            self._fetches.clear()
+
+    def _prune(self) -> None:
+        """Forget resources whose last result can no longer be shared."""
+        now = monotonic()
+        for key in [
+            key
+            for key, shared in self._fetches.items()
+            if shared.fetched_at is not None and now - shared.fetched_at >= self.max_age
+        ]:
+            del self._fetches[key]
@@ -1,7 +1,7 @@
 """YAML utility functions."""
 from .const import _SECRET_NAMESPACE, SECRET_YAML
 from .dumper import dump, save_yaml
-from .loader import clear_secret_cache, load_yaml, secret_yaml
+from .loader import clear_secret_cache, enable_cache, load_yaml, save_cache, secret_yaml
 
 __all__ = [
     "SECRET_YAML",
@@ -9,6 +9,8 @@ __all__ = [
     "dump",
     "save_yaml",
     "clear_secret_cache",
+    "enable_cache",
     "load_yaml",
+    "save_cache",
     "secret_yaml",
 ]
@@ -0,0 +1,173 @@
+"""Cache of parsed YAML files."""
+from collections import OrderedDict
+import json
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from homeassistant.const import __version__
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.json import load_json, save_json
+
+from .objects import NodeListClass, NodeStrClass
+
+_LOGGER = logging.getLogger(__name__)
+
+DependencyKey = Tuple[str, str]
+Dependencies = Dict[DependencyKey, Any]
+
+
+def _encode(obj: Any) -> Any:
+    """Encode parsed YAML as JSON, keeping file names and line numbers.
+
+    Raises TypeError for values that JSON can't represent, like dates.
+    """
+    if obj is None or isinstance(obj, (bool, int, float)):
+        return obj
+    if isinstance(obj, NodeStrClass):
+        encoded: Dict[str, Any] = {"s": str(obj)}
+    elif isinstance(obj, str):
+        return obj
+    elif isinstance(obj, list):
+        encoded = {"l": [_encode(item) for item in obj]}
+    elif isinstance(obj, dict):
+        encoded = {"d": [[_encode(key), _encode(val)] for key, val in obj.items()]}
+    else:
+        raise TypeError(f"Unable to cache {type(obj).__name__}")
+
+    if hasattr(obj, "__config_file__"):
+        encoded["f"] = obj.__config_file__
+        encoded["n"] = obj.__line__
+    return encoded
+
+
+def _decode(obj: Any) -> Any:
+    """Decode parsed YAML that was encoded with _encode."""
+    if not isinstance(obj, dict):
+        return obj
+    if "s" in obj:
+        decoded: Any = NodeStrClass(obj["s"])
+    elif "l" in obj:
+        items = [_decode(item) for item in obj["l"]]
+        decoded = NodeListClass(items) if "f" in obj else items
+    else:
+        decoded = OrderedDict((_decode(key), _decode(val)) for key, val in obj["d"])
+
+    if "f" in obj:
+        setattr(decoded, "__config_file__", obj["f"])
+        setattr(decoded, "__line__", obj["n"])
+    return decoded
+
+
+class YamlCache:
+    """Cache of the parsed files of a configuration, stored on disk as JSON.
+
+    Every file is stored together with the state of everything it depended
+    on while it was parsed: the file itself, included files and directories,
+    secret files and environment variables. A cached file is only used while
+    all of those are unchanged.
+
+    Files that contain resolved secrets are only kept in memory.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        config_file: str,
+        dependency_state: Callable[[DependencyKey], Any],
+    ) -> None:
+        """Initialize the cache."""
+        self.path = path
+        self.config_file = os.path.abspath(config_file)
+        self._dependency_state = dependency_state
+        self._entries: Optional[Dict[str, Tuple[Dependencies, str, bool]]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Tuple[Dependencies, str, bool]]:
+        """Load the cache from disk on first use."""
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        try:
+            stored = load_json(self.path)
+            # Parsing might differ between versions
+            if stored.get("version") != __version__:
+                return self._entries
+            self._entries = {
+                fname: (
+                    {(kind, name): state for kind, name, state in entry["deps"]},
+                    entry["data"],
+                    True,
+                )
+                for fname, entry in stored["files"].items()
+            }
+        except (HomeAssistantError, AttributeError, KeyError, TypeError, ValueError):
+            _LOGGER.warning("Unable to read YAML cache %s", self.path)
+        return self._entries
+
+    def get(self, fname: str) -> Optional[Tuple[Dependencies, Any]]:
+        """Return dependencies and data of a file if it is unchanged."""
+        with self._lock:
+            entry = self._load().get(fname)
+
+        if entry is None:
+            return None
+
+        deps, data, _ = entry
+        for key, state in deps.items():
+            if self._dependency_state(key) != state:
+                return None
+
+        try:
+            # Every caller gets its own copy, configurations are modified in place
+            return deps, _decode(json.loads(data))
+        except (AttributeError, KeyError, TypeError, ValueError):
+            _LOGGER.warning("Invalid YAML cache entry for %s", fname)
+            return None
+
+    def set(self, fname: str, deps: Dependencies, data: Any, persist: bool) -> None:
+        """Store a parsed file, on disk too if persist is True."""
+        try:
+            encoded = json.dumps(_encode(data))
+        except TypeError as err:
+            _LOGGER.debug("Not caching %s: %s", fname, err)
+            return
+
+        with self._lock:
+            self._load()[fname] = (deps, encoded, persist)
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache to disk if it changed."""
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            # Forget about files that were removed
+            self._entries = {
+                fname: entry
+                for fname, entry in self._entries.items()
+                if os.path.isfile(fname)
+            }
+            files: Dict[str, Dict[str, Any]] = {}
+            for fname, (deps, data, persist) in self._entries.items():
+                if not persist:
+                    continue
+                dep_list: List[List[Any]] = [
+                    [kind, name, state] for (kind, name), state in deps.items()
+                ]
+                files[fname] = {"deps": dep_list, "data": data}
+            self._dirty = False
+
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            save_json(
+                self.path,
+                {"version": __version__, "files": files},
+                private=True,
+                minify=True,
+            )
+        except (HomeAssistantError, OSError) as err:
+            _LOGGER.warning("Unable to write YAML cache %s: %s", self.path, err)
@@ -4,15 +4,26 @@ import fnmatch
 import logging
 import os
 import sys
-from typing import Dict, Iterator, List, TypeVar, Union, overload
+import threading
+from typing import Any, Dict, Iterator, List, Optional, TypeVar, Union, overload
 
 import yaml
 
 from homeassistant.exceptions import HomeAssistantError
 
+from .cache import Dependencies, DependencyKey, YamlCache
 from .const import _SECRET_NAMESPACE, SECRET_YAML
 from .objects import NodeListClass, NodeStrClass
 
+try:
+    from yaml import CSafeLoader as FastestAvailableSafeLoader
+
+    HAS_C_LOADER = True
+except ImportError:
+    from yaml import SafeLoader as FastestAvailableSafeLoader  # type: ignore
+
+    HAS_C_LOADER = False
+
 try:
     import keyring
 except ImportError:
@@ -31,6 +42,16 @@ DICT_T = TypeVar("DICT_T", bound=Dict)  # pylint: disable=invalid-name
 
 _LOGGER = logging.getLogger(__name__)
 __SECRET_CACHE: Dict[str, JSON_TYPE] = {}
+__YAML_CACHE: Optional[YamlCache] = None
+
+# Marks a file that depends on something that can't be cached
+_UNCACHEABLE = ("uncacheable", "")
+
+# Marks a file that contains resolved secrets, which are not stored on disk
+_SECRETS = ("secrets", "")
+
+# Dependencies of the files that are being loaded in the current thread
+_TRACKING = threading.local()
 
 
 def clear_secret_cache() -> None:
@@ -41,6 +62,61 @@ def clear_secret_cache() -> None:
     __SECRET_CACHE.clear()
 
 
+def enable_cache(path: Optional[str], config_file: Optional[str] = None) -> None:
+    """Cache config_file and the files it includes at path.
+
+    Disable the cache if path is None.
+
+    Async friendly.
+    """
+    global __YAML_CACHE  # pylint: disable=invalid-name
+
+    if path is None or config_file is None:
+        __YAML_CACHE = None
+    elif (
+        __YAML_CACHE is None
+        or __YAML_CACHE.path != path
+        or __YAML_CACHE.config_file != os.path.abspath(config_file)
+    ):
+        __YAML_CACHE = YamlCache(path, config_file, _dependency_state)
+
+
+def save_cache() -> None:
+    """Write the parsed YAML cache to disk if it changed."""
+    if __YAML_CACHE is not None:
+        __YAML_CACHE.save()
+
+
+def _dependency_state(key: DependencyKey) -> Any:
+    """Return the current state of something a YAML file depends on."""
+    kind, name = key
+    if kind == "file":
+        try:
+            stat = os.stat(name)
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+    if kind == "dir":
+        return list(_find_files(name, "*.yaml"))
+    if kind == "env":
+        return os.environ.get(name)
+    return True
+
+
+def _track_dependency(key: DependencyKey) -> None:
+    """Record a dependency of the file that is being loaded."""
+    stack = getattr(_TRACKING, "stack", None)
+    if stack:
+        stack[-1][key] = _dependency_state(key)
+
+
+def _track_dependencies(deps: Dependencies) -> None:
+    """Record the dependencies of an included file."""
+    stack = getattr(_TRACKING, "stack", None)
+    if stack:
+        stack[-1].update(deps)
+
+
 # pylint: disable=too-many-ancestors
 class SafeLineLoader(yaml.SafeLoader):
     """Loader class that keeps track of line numbers."""
@@ -53,13 +129,70 @@ class SafeLineLoader(yaml.SafeLoader):
         return node
 
 
+# pylint: disable=too-many-ancestors
+class FastSafeLoader(FastestAvailableSafeLoader):
+    """Loader class that uses the libyaml parser when it is available.
+
+    Line numbers are taken from the node marks, which libyaml provides too.
+    """
+
+    def __init__(self, stream: Any) -> None:
+        """Initialize the loader."""
+        super().__init__(stream)
+        if HAS_C_LOADER:
+            # The C parser doesn't expose these
+            self.name = getattr(stream, "name", "<file>")
+            self.stream = stream
+
+
 def load_yaml(fname: str) -> JSON_TYPE:
-    """Load a YAML file."""
+    """Load a YAML file.
+
+    If the YAML cache is enabled, the configuration file and the files it
+    includes are only parsed again if they or anything they include has
+    changed.
+    """
+    cache = __YAML_CACHE
+    stack = getattr(_TRACKING, "stack", None)
+    if (
+        cache is None
+        # Files like known_devices.yaml are not part of the configuration
+        or (not stack and os.path.abspath(fname) != cache.config_file)
+        or os.path.basename(fname) == SECRET_YAML
+    ):
+        return _load_yaml(fname)
+
+    cached = cache.get(fname)
+    if cached is not None:
+        deps, data = cached
+        _track_dependencies(deps)
+        return data
+
+    if stack is None:
+        stack = _TRACKING.stack = []
+
+    deps = {}
+    stack.append(deps)
+    try:
+        _track_dependency(("file", fname))
+        data = _load_yaml(fname)
+    finally:
+        stack.pop()
+
+    _track_dependencies(deps)
+    # Files that can't be found on disk, like mocked files, are not cached
+    if _UNCACHEABLE not in deps and deps[("file", fname)] is not None:
+        cache.set(fname, deps, data, _SECRETS not in deps)
+    return data
+
+
+def _load_yaml(fname: str) -> JSON_TYPE:
+    """Parse a YAML file."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
             # If configuration file is empty YAML returns None
             # We convert that to an empty dict
-            return yaml.load(conf_file, Loader=SafeLineLoader) or OrderedDict()
+            return yaml.load(conf_file, Loader=FastSafeLoader) or OrderedDict()
     except yaml.YAMLError as exc:
         _LOGGER.error(str(exc))
         raise HomeAssistantError(exc)
@@ -140,6 +273,7 @@ def _include_dir_named_yaml(
     """Load multiple files from directory as a dictionary."""
     mapping: OrderedDict = OrderedDict()
     loc = os.path.join(os.path.dirname(loader.name), node.value)
+    _track_dependency(("dir", loc))
     for fname in _find_files(loc, "*.yaml"):
         filename = os.path.splitext(os.path.basename(fname))[0]
         if os.path.basename(fname) == SECRET_YAML:
@@ -154,6 +288,7 @@ def _include_dir_merge_named_yaml(
     """Load multiple files from directory as a merged dictionary."""
     mapping: OrderedDict = OrderedDict()
     loc = os.path.join(os.path.dirname(loader.name), node.value)
+    _track_dependency(("dir", loc))
     for fname in _find_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
@@ -168,6 +303,7 @@ def _include_dir_list_yaml(
 ) -> List[JSON_TYPE]:
     """Load multiple files from directory as a list."""
     loc = os.path.join(os.path.dirname(loader.name), node.value)
+    _track_dependency(("dir", loc))
     return [
         load_yaml(f)
         for f in _find_files(loc, "*.yaml")
@@ -181,6 +317,7 @@ def _include_dir_merge_list_yaml(
     """Load multiple files from directory as a merged list."""
     loc: str = os.path.join(os.path.dirname(loader.name), node.value)
     merged_list: List[JSON_TYPE] = []
+    _track_dependency(("dir", loc))
     for fname in _find_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
@@ -231,6 +368,7 @@ def _construct_seq(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
 def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
+    _track_dependency(("env", args[0]))
 
     # Check for a default value
     if len(args) > 1:
@@ -244,6 +382,7 @@ def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
 def _load_secret_yaml(secret_path: str) -> JSON_TYPE:
     """Load the secrets yaml from path."""
     secret_path = os.path.join(secret_path, SECRET_YAML)
+    _track_dependency(("file", secret_path))
     if secret_path in __SECRET_CACHE:
         return __SECRET_CACHE[secret_path]
 
@@ -275,6 +414,7 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
         secrets = _load_secret_yaml(secret_path)
 
         if node.value in secrets:
+            _track_dependency(_SECRETS)
             _LOGGER.debug(
                 "Secret %s retrieved from secrets.yaml in " "folder %s",
                 node.value,
@@ -289,6 +429,9 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
         if not os.path.exists(secret_path) or len(secret_path) < 5:
             break  # Somehow we got past the .homeassistant config folder
 
+    # Secrets from keyring or credstash are not stored on disk
+    _track_dependency(_UNCACHEABLE)
+
     if keyring:
         # do some keyring stuff
         pwd = keyring.get_password(_SECRET_NAMESPACE, node.value)
@@ -314,18 +457,18 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     raise HomeAssistantError(f"Secret {node.value} not defined")
 
 
-yaml.SafeLoader.add_constructor("!include", _include_yaml)
-yaml.SafeLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict
-)
-yaml.SafeLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq
-)
-yaml.SafeLoader.add_constructor("!env_var", _env_var_yaml)
-yaml.SafeLoader.add_constructor("!secret", secret_yaml)
-yaml.SafeLoader.add_constructor("!include_dir_list", _include_dir_list_yaml)
-yaml.SafeLoader.add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
-yaml.SafeLoader.add_constructor("!include_dir_named", _include_dir_named_yaml)
-yaml.SafeLoader.add_constructor(
-    "!include_dir_merge_named", _include_dir_merge_named_yaml
-)
+def _add_constructor(tag: str, constructor: Any) -> None:
+    """Add a constructor to both loaders."""
+    yaml.SafeLoader.add_constructor(tag, constructor)
+    FastSafeLoader.add_constructor(tag, constructor)
+
+
+_add_constructor("!include", _include_yaml)
+_add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict)
+_add_constructor(yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq)
+_add_constructor("!env_var", _env_var_yaml)
+_add_constructor("!secret", secret_yaml)
+_add_constructor("!include_dir_list", _include_dir_list_yaml)
+_add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
+_add_constructor("!include_dir_named", _include_dir_named_yaml)
+_add_constructor("!include_dir_merge_named", _include_dir_merge_named_yaml)
@@ -1,8 +1,21 @@
 """Test report state."""
+from datetime import timedelta
+
 from homeassistant.components.alexa import state_report
+from homeassistant.util.dt import utcnow
 
 from . import DEFAULT_CONFIG, TEST_URL
 
+from tests.common import async_fire_time_changed
+
+
+async def fire_report_window(hass):
+    """Fire the time change that sends the collected state reports."""
+    async_fire_time_changed(
+        hass, utcnow() + timedelta(seconds=state_report.REPORT_STATE_WINDOW)
+    )
+    await hass.async_block_till_done()
+
 
 async def test_report_state(hass, aioclient_mock):
     """Test proactive state reports."""
@@ -24,6 +37,7 @@ async def test_report_state(hass, aioclient_mock):
 
     # To trigger event listener
     await hass.async_block_till_done()
+    await fire_report_window(hass)
 
     assert len(aioclient_mock.mock_calls) == 1
     call = aioclient_mock.mock_calls
@@ -68,6 +82,7 @@ async def test_report_state_instance(hass, aioclient_mock):
 
     # To trigger event listener
     await hass.async_block_till_done()
+    await fire_report_window(hass)
 
     assert len(aioclient_mock.mock_calls) == 1
     call = aioclient_mock.mock_calls
@@ -86,6 +101,47 @@ async def test_report_state_instance(hass, aioclient_mock):
     assert call_json["event"]["endpoint"]["endpointId"] == "fan#test_fan"
 
 
+async def test_report_state_coalesced(hass, aioclient_mock):
+    """Test state changes are collected and unchanged states not reported."""
+    aioclient_mock.post(TEST_URL, text="", status=202)
+
+    attrs = {"friendly_name": "Test Contact Sensor", "device_class": "door"}
+    hass.states.async_set("binary_sensor.test_contact", "on", attrs)
+
+    unsub = await state_report.async_enable_proactive_mode(hass, DEFAULT_CONFIG)
+
+    hass.states.async_set("binary_sensor.test_contact", "off", attrs)
+    hass.states.async_set("binary_sensor.test_contact", "on", attrs)
+    hass.states.async_set("binary_sensor.test_contact", "off", attrs)
+    await hass.async_block_till_done()
+
+    assert len(aioclient_mock.mock_calls) == 0
+
+    await fire_report_window(hass)
+
+    assert len(aioclient_mock.mock_calls) == 1
+    call_json = aioclient_mock.mock_calls[0][2]
+    assert (
+        call_json["event"]["payload"]["change"]["properties"][0]["value"]
+        == "NOT_DETECTED"
+    )
+
+    # Attribute changes that do not change a reported property are skipped
+    hass.states.async_set("binary_sensor.test_contact", "off", {**attrs, "battery": 50})
+    await hass.async_block_till_done()
+    await fire_report_window(hass)
+
+    assert len(aioclient_mock.mock_calls) == 1
+
+    # Pending reports are dropped when proactive mode is disabled
+    hass.states.async_set("binary_sensor.test_contact", "on", attrs)
+    await hass.async_block_till_done()
+    unsub()
+    await fire_report_window(hass)
+
+    assert len(aioclient_mock.mock_calls) == 1
+
+
 async def test_send_add_or_update_message(hass, aioclient_mock):
     """Test sending an AddOrUpdateReport message."""
     aioclient_mock.post(TEST_URL, text="")
@@ -160,6 +216,7 @@ async def test_doorbell_event(hass, aioclient_mock):
 
     # To trigger event listener
     await hass.async_block_till_done()
+    await fire_report_window(hass)
 
     assert len(aioclient_mock.mock_calls) == 1
     call = aioclient_mock.mock_calls
@@ -2,7 +2,7 @@
 # pylint: disable=protected-access
 import asyncio
 import json
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from aiohttp import web
 import pytest
@@ -10,6 +10,12 @@ import voluptuous as vol
 
 from homeassistant import const
 from homeassistant.bootstrap import DATA_LOGGING
+from homeassistant.components.api import (
+    STREAM_OVERFLOW_DISCONNECT,
+    STREAM_OVERFLOW_DROP_OLDEST,
+    URL_API_STREAM_STATS,
+    EventStreamBuffer,
+)
 import homeassistant.core as ha
 from homeassistant.setup import async_setup_component
 
@@ -281,6 +287,28 @@ def test_api_get_services(hass, mock_api_client):
         assert serv_domain["services"] == local
 
 
+async def test_api_get_services_etag(hass, mock_api_client):
+    """Test services are not sent again if they did not change."""
+    resp = await mock_api_client.get(const.URL_API_SERVICES)
+    assert resp.status == 200
+    etag = resp.headers["ETag"]
+
+    resp = await mock_api_client.get(
+        const.URL_API_SERVICES, headers={"If-None-Match": etag}
+    )
+    assert resp.status == 304
+
+    hass.services.async_register("light", "test_service", lambda call: None)
+
+    resp = await mock_api_client.get(
+        const.URL_API_SERVICES, headers={"If-None-Match": etag}
+    )
+    assert resp.status == 200
+    assert resp.headers["ETag"] != etag
+    data = await resp.json()
+    assert {"domain": "light", "services": ANY} in data
+
+
 @asyncio.coroutine
 def test_api_call_service_no_data(hass, mock_api_client):
     """Test if the API allows us to call a service."""
@@ -389,6 +417,93 @@ def test_stream_with_restricted(hass, mock_api_client):
     assert data["event_type"] == "test_event3"
 
 
+async def test_streams_share_listener_and_encoding(hass, mock_api_client):
+    """Test open streams share one listener and encode every event once."""
+    listen_count = _listen_count(hass)
+
+    resp1 = await mock_api_client.get(const.URL_API_STREAM)
+    resp2 = await mock_api_client.get(
+        "{}?restrict=test_event1".format(const.URL_API_STREAM)
+    )
+    assert resp1.status == 200
+    assert resp2.status == 200
+    assert listen_count + 1 == _listen_count(hass)
+
+    with patch("homeassistant.components.api.json.dumps", wraps=json.dumps) as dumps:
+        hass.bus.async_fire("test_event1")
+        data1 = await _stream_next_event(resp1.content)
+        data2 = await _stream_next_event(resp2.content)
+
+    assert data1["event_type"] == "test_event1"
+    assert data2["event_type"] == "test_event1"
+    assert len(dumps.mock_calls) == 1
+
+    resp = await mock_api_client.get(URL_API_STREAM_STATS)
+    assert resp.status == 200
+    stats = sorted(await resp.json(), key=lambda item: item["restrict"] or [])
+    assert len(stats) == 2
+    assert stats[0]["restrict"] is None
+    assert stats[1]["restrict"] == ["test_event1"]
+    assert stats[1]["overflow"] == STREAM_OVERFLOW_DROP_OLDEST
+    assert stats[1]["backlog"] == 0
+
+
+async def test_stream_invalid_options(hass, mock_api_client):
+    """Test the stream rejects invalid buffer options."""
+    resp = await mock_api_client.get("{}?overflow=invalid".format(const.URL_API_STREAM))
+    assert resp.status == 400
+
+    resp = await mock_api_client.get("{}?max_backlog=0".format(const.URL_API_STREAM))
+    assert resp.status == 400
+
+
+async def test_stream_buffer_drop_oldest(hass):
+    """Test a full buffer drops the oldest events."""
+    buffer = EventStreamBuffer(max_backlog=2)
+
+    for payload in ("a", "b", "c"):
+        buffer.async_put(payload)
+
+    assert buffer.backlog == 2
+    assert buffer.dropped == 1
+    assert await buffer.async_get() == "b"
+    assert await buffer.async_get() == "c"
+
+    buffer.async_close()
+    assert await buffer.async_get() is None
+    assert buffer.as_dict()["sent"] == 2
+    assert buffer.as_dict()["peak_backlog"] == 2
+
+
+async def test_stream_buffer_disconnect(hass):
+    """Test a full buffer closes the stream with the disconnect policy."""
+    buffer = EventStreamBuffer(max_backlog=2, overflow=STREAM_OVERFLOW_DISCONNECT)
+
+    for payload in ("a", "b", "c"):
+        buffer.async_put(payload)
+
+    assert buffer.overflowed
+    assert buffer.dropped == 3
+    assert await buffer.async_get() is None
+
+
+async def test_stream_disconnects_on_overflow(hass, mock_api_client):
+    """Test a stream that can't keep up is disconnected."""
+    listen_count = _listen_count(hass)
+
+    resp = await mock_api_client.get(
+        "{}?max_backlog=1&overflow=disconnect".format(const.URL_API_STREAM)
+    )
+    assert resp.status == 200
+    assert listen_count + 1 == _listen_count(hass)
+
+    hass.bus.async_fire("test_event1")
+    hass.bus.async_fire("test_event2")
+    await resp.content.read()
+
+    assert listen_count == _listen_count(hass)
+
+
 @asyncio.coroutine
 def _stream_next_event(stream):
     """Read the stream for next event while ignoring ping."""
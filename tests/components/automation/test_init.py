@@ -512,6 +512,110 @@ async def test_reload_config_service(hass, calls, hass_admin_user, hass_read_onl
     assert calls[1].data.get("event") == "test_event2"
 
 
+async def test_reload_only_changed_automations(hass, calls):
+    """Test reload keeps automations whose config did not change."""
+    keep = {
+        "id": "keep",
+        "alias": "keep",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": [{"delay": {"seconds": 5}}, {"service": "test.automation"}],
+    }
+    change = {
+        "id": "change",
+        "alias": "change",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"service": "test.automation"},
+    }
+    remove = {
+        "alias": "remove",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"service": "test.automation"},
+    }
+    assert await async_setup_component(
+        hass, automation.DOMAIN, {automation.DOMAIN: [keep, change, remove]}
+    )
+    assert hass.bus.async_listeners().get("test_event") == 3
+
+    # Start the delay of the automation that is kept
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+    kept_state = hass.states.get("automation.keep")
+
+    changed = {**change, "trigger": {"platform": "event", "event_type": "test_event2"}}
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={automation.DOMAIN: [keep, changed]},
+    ), patch("homeassistant.config.find_config_file", return_value=""):
+        await common.async_reload(hass)
+        await hass.async_block_till_done()
+
+    assert hass.states.get("automation.keep").last_changed == kept_state.last_changed
+    assert hass.states.get("automation.change") is not None
+    assert hass.states.get("automation.remove") is None
+    listeners = hass.bus.async_listeners()
+    assert listeners.get("test_event") == 1
+    assert listeners.get("test_event2") == 1
+
+    # The running automation was not interrupted
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+
+    hass.bus.async_fire("test_event2")
+    await hass.async_block_till_done()
+    assert len(calls) == 4
+
+
+async def test_reload_keeps_templated_automations(hass, calls):
+    """Test reload keeps automations with templates whose config did not change."""
+    config = {
+        automation.DOMAIN: {
+            "id": "templated",
+            "alias": "templated",
+            "trigger": [
+                {"platform": "event", "event_type": "test_event"},
+                {
+                    "platform": "template",
+                    "value_template": "{{ is_state('test.entity', 'hello') }}",
+                },
+            ],
+            "condition": {
+                "condition": "template",
+                "value_template": "{{ trigger.platform is defined }}",
+            },
+            "action": {
+                "service": "test.automation",
+                "data_template": {"some": "{{ trigger.platform }}"},
+            },
+        }
+    }
+    assert await async_setup_component(hass, automation.DOMAIN, config)
+    component = hass.data["entity_components"][automation.DOMAIN]
+    entity = component.get_entity("automation.templated")
+
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value=config,
+    ), patch("homeassistant.config.find_config_file", return_value=""):
+        await common.async_reload(hass)
+        await hass.async_block_till_done()
+
+    assert component.get_entity("automation.templated") is entity
+    assert hass.bus.async_listeners().get("test_event") == 1
+
+    hass.states.async_set("test.entity", "hello")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+    assert calls[1].data["some"] == "template"
+
+
 async def test_reload_config_when_invalid_config(hass, calls):
     """Test the reload config service handling invalid config."""
     with assert_setup_component(1, automation.DOMAIN):
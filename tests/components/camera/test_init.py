@@ -1,13 +1,18 @@
 """The tests for the camera component."""
 import asyncio
 import base64
+from datetime import timedelta
 import io
 from unittest.mock import PropertyMock, mock_open, patch
 
 import pytest
 
 from homeassistant.components import camera, http
-from homeassistant.components.camera.const import DOMAIN, PREF_PRELOAD_STREAM
+from homeassistant.components.camera.const import (
+    DOMAIN,
+    PREF_LOOKBACK,
+    PREF_PRELOAD_STREAM,
+)
 from homeassistant.components.camera.prefs import CameraEntityPreferences
 from homeassistant.components.websocket_api.const import TYPE_RESULT
 from homeassistant.const import (
@@ -17,6 +22,7 @@ from homeassistant.const import (
 )
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.setup import async_setup_component, setup_component
+import homeassistant.util.dt as dt_util
 
 from tests.common import (
     assert_setup_component,
@@ -164,6 +170,60 @@ def test_snapshot_service(hass, mock_camera):
         assert mock_write.mock_calls[0][1][0] == b"Test"
 
 
+async def test_get_image_shares_fetches(hass):
+    """Test concurrent image requests share one fetch and are cached."""
+    assert await async_setup_component(
+        hass, "camera", {camera.DOMAIN: {"platform": "demo"}}
+    )
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.camera_image",
+        return_value=b"Test",
+    ) as mock_image:
+        images = await asyncio.gather(
+            camera.async_get_image(hass, "camera.demo_camera"),
+            camera.async_get_image(hass, "camera.demo_camera"),
+        )
+        assert len(mock_image.mock_calls) == 1
+        assert images[0].content is images[1].content
+
+        await camera.async_get_image(hass, "camera.demo_camera")
+        assert len(mock_image.mock_calls) == 1
+
+        with patch(
+            "homeassistant.util.dt.utcnow",
+            return_value=dt_util.utcnow() + timedelta(seconds=1),
+        ):
+            await camera.async_get_image(hass, "camera.demo_camera")
+        assert len(mock_image.mock_calls) == 2
+
+
+async def test_still_stream_broadcast(hass):
+    """Test still stream subscribers share the fetched images."""
+    images = [b"1", b"1", b"2", None]
+    calls = 0
+
+    async def image_cb():
+        """Return the next image."""
+        nonlocal calls
+        calls += 1
+        return images.pop(0)
+
+    broadcast = camera.StillStreamBroadcast(hass, image_cb, 0)
+
+    async def collect():
+        """Collect all images of the broadcast."""
+        return [image async for image in broadcast.async_images()]
+
+    first, second = await asyncio.gather(collect(), collect())
+
+    assert first == [b"1", b"2"]
+    assert second == [b"1", b"2"]
+    assert first[0] is second[0]
+    assert calls == 4
+    assert broadcast.subscribers == 0
+
+
 async def test_websocket_camera_thumbnail(hass, hass_ws_client, mock_camera):
     """Test camera_thumbnail websocket command."""
     await async_setup_component(hass, "camera", {})
@@ -272,6 +332,47 @@ async def test_websocket_update_prefs(
     )
 
 
+async def test_websocket_update_prefs_lookback(hass, hass_ws_client, mock_camera):
+    """Test updating the lookback preference updates the lookback buffer."""
+    hass.config.components.add("stream")
+    client = await hass_ws_client(hass)
+
+    with patch(
+        "homeassistant.components.camera.request_lookback"
+    ) as mock_request_lookback, patch(
+        "homeassistant.components.camera.stop_lookback"
+    ) as mock_stop_lookback, patch(
+        "homeassistant.components.demo.camera.DemoCamera.stream_source",
+        side_effect=lambda: mock_coro("http://example.com"),
+    ):
+        await client.send_json(
+            {
+                "id": 8,
+                "type": "camera/update_prefs",
+                "entity_id": "camera.demo_camera",
+                "lookback": 30,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert mock_request_lookback.mock_calls[0][1][1:] == ("http://example.com", 30)
+        assert not mock_stop_lookback.called
+
+        await client.send_json(
+            {
+                "id": 9,
+                "type": "camera/update_prefs",
+                "entity_id": "camera.demo_camera",
+                "lookback": 0,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert len(mock_request_lookback.mock_calls) == 1
+        assert mock_stop_lookback.mock_calls[0][1][1:] == ("http://example.com",)
+        assert mock_stop_lookback.mock_calls[0][2] == {"keepalive": False}
+
+
 async def test_play_stream_service_no_source(hass, mock_camera, mock_stream):
     """Test camera play_stream service."""
     data = {
@@ -346,6 +447,28 @@ async def test_preload_stream(hass, mock_stream):
         assert mock_request_stream.called
 
 
+async def test_preload_lookback(hass, mock_stream):
+    """Test camera lookback preference keeps a lookback buffer."""
+    demo_prefs = CameraEntityPreferences({PREF_LOOKBACK: 30})
+    with patch(
+        "homeassistant.components.camera.request_stream"
+    ) as mock_request_stream, patch(
+        "homeassistant.components.camera.request_lookback"
+    ) as mock_request_lookback, patch(
+        "homeassistant.components.camera.prefs.CameraPreferences.get",
+        return_value=demo_prefs,
+    ), patch(
+        "homeassistant.components.demo.camera.DemoCamera.stream_source",
+        return_value=mock_coro("http://example.com"),
+    ):
+        await async_setup_component(hass, "camera", {DOMAIN: {"platform": "demo"}})
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
+        await hass.async_block_till_done()
+        assert not mock_request_stream.called
+        assert len(mock_request_lookback.mock_calls) == 1
+        assert mock_request_lookback.mock_calls[0][1][1:] == ("http://example.com", 30)
+
+
 async def test_record_service_invalid_path(hass, mock_camera):
     """Test record service with invalid path."""
     data = {
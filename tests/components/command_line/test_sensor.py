@@ -73,6 +73,37 @@ class TestCommandSensorSensor(unittest.TestCase):
 
         assert "Works" == data.value
 
+    def test_update_shared(self):
+        """Test sensors running the same command share its output."""
+        data = command_line.CommandSensorData(self.hass, "echo 50", 15)
+        other = command_line.CommandSensorData(self.hass, "echo 50", 15)
+        with patch(
+            "homeassistant.components.command_line.sensor.subprocess.check_output",
+            return_value=b"50\n",
+        ) as check_output:
+            data.update()
+            other.update()
+            assert check_output.call_count == 1
+            data.update()
+            assert check_output.call_count == 2
+
+        assert "50" == data.value
+        assert "50" == other.value
+
+    def test_update_not_shared_between_hass(self):
+        """Test sensors of another hass run the command themselves."""
+        other_hass = get_test_home_assistant()
+        self.addCleanup(other_hass.stop)
+        data = command_line.CommandSensorData(self.hass, "echo 50", 15)
+        other = command_line.CommandSensorData(other_hass, "echo 50", 15)
+        with patch(
+            "homeassistant.components.command_line.sensor.subprocess.check_output",
+            return_value=b"50\n",
+        ) as check_output:
+            data.update()
+            other.update()
+        assert check_output.call_count == 2
+
     def test_bad_command(self):
         """Test bad command."""
         data = command_line.CommandSensorData(self.hass, "asdfasdf", 15)
@@ -1,4 +1,5 @@
 """The tests for the device tracker component."""
+import asyncio
 from datetime import datetime, timedelta
 import json
 import logging
@@ -127,6 +128,38 @@ async def test_reading_yaml_config(hass, yaml_devices):
     assert device.icon == config.icon
 
 
+async def test_update_config_batched(hass, yaml_devices):
+    """Test devices added during a write are written together."""
+    tracker = legacy.DeviceTracker(hass, timedelta(seconds=180), True, {}, [])
+    devices = [
+        legacy.Device(hass, timedelta(seconds=180), True, dev_id, None, dev_id)
+        for dev_id in ("dev1", "dev2", "dev3")
+    ]
+
+    writes = []
+    update_config_batch = legacy.update_config_batch
+
+    def mock_update_config_batch(path, devices):
+        """Record the devices that are written together."""
+        writes.append(devices)
+        update_config_batch(path, devices)
+
+    with patch(
+        "homeassistant.components.device_tracker.legacy.update_config_batch",
+        new=mock_update_config_batch,
+    ):
+        await asyncio.gather(
+            *[
+                tracker.async_update_config(yaml_devices, device.dev_id, device)
+                for device in devices
+            ]
+        )
+
+    assert writes == [devices[:1], devices[1:]]
+    config = await legacy.async_load_config(yaml_devices, hass, timedelta(seconds=180))
+    assert [device.dev_id for device in config] == ["dev1", "dev2", "dev3"]
+
+
 @patch("homeassistant.components.device_tracker.const.LOGGER.warning")
 async def test_duplicate_mac_dev_id(mock_warning, hass):
     """Test adding duplicate MACs or device IDs to DeviceTracker."""
@@ -268,6 +301,35 @@ async def test_update_stale(hass, mock_device_tracker_conf):
     assert STATE_NOT_HOME == hass.states.get("device_tracker.dev1").state
 
 
+async def test_update_stale_seen_again(hass, mock_device_tracker_conf):
+    """Test a device seen again before becoming stale stays home."""
+    tracker = legacy.DeviceTracker(hass, timedelta(seconds=60), True, {}, [])
+    first_seen = datetime(2015, 9, 15, 23, tzinfo=dt_util.UTC)
+
+    for seen in (first_seen, first_seen + timedelta(seconds=50)):
+        with patch(
+            "homeassistant.components.device_tracker.legacy.dt_util.utcnow",
+            return_value=seen,
+        ):
+            await tracker.async_see(dev_id="dev1")
+
+    assert hass.states.get("device_tracker.dev1").state == STATE_HOME
+
+    tracker.async_update_stale(first_seen + timedelta(seconds=70))
+    await hass.async_block_till_done()
+    assert hass.states.get("device_tracker.dev1").state == STATE_HOME
+    assert len(tracker._stale_heap) == 1
+
+    with patch(
+        "homeassistant.components.device_tracker.legacy.dt_util.utcnow",
+        return_value=first_seen + timedelta(seconds=111),
+    ):
+        tracker.async_update_stale(first_seen + timedelta(seconds=111))
+        await hass.async_block_till_done()
+    assert hass.states.get("device_tracker.dev1").state == STATE_NOT_HOME
+    assert not tracker._stale_heap
+
+
 async def test_entity_attributes(hass, mock_device_tracker_conf):
     """Test the entity attributes."""
     devices = mock_device_tracker_conf
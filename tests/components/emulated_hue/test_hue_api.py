@@ -5,7 +5,7 @@ from ipaddress import ip_address
 import json
 from unittest.mock import patch
 
-from aiohttp.hdrs import CONTENT_TYPE
+from aiohttp.hdrs import CONTENT_TYPE, ETAG, IF_NONE_MATCH
 import pytest
 
 from homeassistant import const, setup
@@ -223,6 +223,36 @@ def test_discover_lights(hue_client):
     assert "00:57:77:a1:6a:8e:ef:b3-6c" not in devices  # climate.ecobee
 
 
+async def test_discover_lights_etag(hass_hue, hue_client):
+    """Test unchanged lights are not sent again."""
+    result = await hue_client.get("/api/username/lights")
+    assert result.status == 200
+    etag = result.headers[ETAG]
+
+    result = await hue_client.get("/api/username/lights", headers={IF_NONE_MATCH: etag})
+    assert result.status == 304
+
+    # Changes that don't affect the Hue JSON keep the ETag
+    hass_hue.states.async_set(
+        "light.ceiling_lights",
+        STATE_ON,
+        {**hass_hue.states.get("light.ceiling_lights").attributes, "extra": 1},
+    )
+    await hass_hue.async_block_till_done()
+    result = await hue_client.get("/api/username/lights", headers={IF_NONE_MATCH: etag})
+    assert result.status == 304
+
+    hass_hue.states.async_set("light.ceiling_lights", STATE_OFF)
+    await hass_hue.async_block_till_done()
+    result = await hue_client.get("/api/username/lights", headers={IF_NONE_MATCH: etag})
+    assert result.status == 200
+    assert result.headers[ETAG] != etag
+
+    result_json = await result.json()
+    lights = {val["uniqueid"]: val for val in result_json.values()}
+    assert lights["00:2f:d2:31:ce:c5:55:cc-ee"]["state"][HUE_API_STATE_ON] is False
+
+
 @asyncio.coroutine
 def test_light_without_brightness_supported(hass_hue, hue_client):
     """Test that light without brightness is supported."""
@@ -0,0 +1,213 @@
+"""The tests for the FFmpeg worker pool."""
+import asyncio
+import os
+import stat
+import sys
+import textwrap
+
+import pytest
+
+from homeassistant.components.ffmpeg import pool
+
+FRAME_1 = b"\xff\xd8frame 1\xff\xd9"
+FRAME_2 = b"\xff\xd8frame 2\xff\xd9"
+
+FAKE_FFMPEG = textwrap.dedent(
+    """\
+    import os
+    import sys
+    import time
+
+    with open(sys.argv[sys.argv.index("-i") + 1], "rb") as source:
+        sys.stdout.buffer.write(source.read())
+    sys.stdout.buffer.flush()
+    time.sleep(float(os.environ.get("FAKE_FFMPEG_LINGER", "30")))
+    """
+)
+
+
+@pytest.fixture
+def ffmpeg_bin(tmp_path):
+    """Return an executable that writes the frames of a local file."""
+    script = tmp_path / "ffmpeg"
+    script.write_text(f"#!{sys.executable}\n{FAKE_FFMPEG}")
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    return str(script)
+
+
+@pytest.fixture
+def source(tmp_path):
+    """Return a local file source with two frames."""
+    path = tmp_path / "source.mjpeg"
+    path.write_bytes(b"garbage" + FRAME_1 + FRAME_2)
+    return str(path)
+
+
+@pytest.fixture
+async def worker_pool(hass, ffmpeg_bin):
+    """Return a worker pool that is closed after the test."""
+    worker_pool = pool.FFmpegWorkerPool(hass.loop, ffmpeg_bin)
+    yield worker_pool
+    await worker_pool.async_close()
+
+
+async def wait_for(condition):
+    """Wait until a condition is met."""
+    for _ in range(100):
+        if condition():
+            return
+        await asyncio.sleep(0.05)
+    assert condition()
+
+
+def test_command():
+    """Test the FFmpeg command line."""
+    worker_pool = pool.FFmpegWorkerPool(None, "ffmpeg")
+    assert worker_pool._command("rtsp://camera", "-pred 1") == [
+        "ffmpeg",
+        "-i",
+        "rtsp://camera",
+        "-an",
+        "-c:v",
+        "mjpeg",
+        "-r",
+        "1",
+        "-pred",
+        "1",
+        "-f",
+        "image2pipe",
+        "-",
+    ]
+    assert worker_pool._command("-rtsp_transport tcp -i rtsp://camera", None)[:5] == [
+        "ffmpeg",
+        "-rtsp_transport",
+        "tcp",
+        "-i",
+        "rtsp://camera",
+    ]
+
+
+async def test_get_image_keeps_process(worker_pool, source):
+    """Test snapshots of a source are read from one process."""
+    assert await worker_pool.async_get_image(source) in (FRAME_1, FRAME_2)
+    await wait_for(lambda: worker_pool._workers[(source, None)].frame == FRAME_2)
+    assert await worker_pool.async_get_image(source) == FRAME_2
+
+    assert worker_pool.stats()[source]["running"]
+    assert worker_pool.stats()[source]["restarts"] == 0
+    assert worker_pool._workers[(source, None)].starts == 1
+
+
+async def test_get_image_restarts_process(worker_pool, source, monkeypatch):
+    """Test the process of a source is started again after it exited."""
+    monkeypatch.setenv("FAKE_FFMPEG_LINGER", "0")
+
+    assert await worker_pool.async_get_image(source) in (FRAME_1, FRAME_2)
+    await wait_for(lambda: not worker_pool.stats()[source]["running"])
+
+    assert await worker_pool.async_get_image(source) in (FRAME_1, FRAME_2)
+    assert worker_pool.stats()[source]["restarts"] == 1
+
+
+async def test_get_image_restarts_stalled_process(worker_pool, source, monkeypatch):
+    """Test a process that stopped writing frames is started again."""
+    monkeypatch.setattr(pool, "MAX_FRAME_AGE", 0.2)
+
+    assert await worker_pool.async_get_image(source) in (FRAME_1, FRAME_2)
+    worker = worker_pool._workers[(source, None)]
+    first_received = worker.frame_received
+
+    # The stand-in process writes no frames after the frames of the file
+    await asyncio.sleep(0.3)
+    assert worker.is_running
+    assert worker.is_stalled
+
+    assert await worker_pool.async_get_image(source) in (FRAME_1, FRAME_2)
+    assert worker.frame_received > first_received
+    assert worker_pool.stats()[source]["restarts"] == 1
+
+
+async def test_get_image_timeout(worker_pool, tmp_path):
+    """Test no snapshot is returned if the process writes no frame."""
+    path = tmp_path / "empty.mjpeg"
+    path.write_bytes(b"no frames")
+
+    assert await worker_pool.async_get_image(str(path), timeout=0.1) is None
+
+
+async def test_get_image_restarts_process_without_frame(
+    worker_pool, tmp_path, monkeypatch
+):
+    """Test a process that wrote no frame since its start is started again."""
+    monkeypatch.setattr(pool, "MAX_FRAME_AGE", 0.2)
+    path = tmp_path / "empty.mjpeg"
+    path.write_bytes(b"no frames")
+
+    assert await worker_pool.async_get_image(str(path), timeout=0.1) is None
+    worker = worker_pool._workers[(str(path), None)]
+    assert worker.is_running
+    assert not worker.is_stalled
+
+    await asyncio.sleep(0.3)
+    assert worker.is_stalled
+
+    assert await worker_pool.async_get_image(str(path), timeout=0.1) is None
+    assert worker_pool.stats()[str(path)]["restarts"] == 1
+    assert not worker.is_stalled
+
+
+async def test_get_image_process_exits_without_frame(
+    hass, worker_pool, tmp_path, monkeypatch
+):
+    """Test no snapshot is returned right away if the process exits."""
+    monkeypatch.setenv("FAKE_FFMPEG_LINGER", "0")
+    path = tmp_path / "empty.mjpeg"
+    path.write_bytes(b"no frames")
+
+    start = hass.loop.time()
+    assert await worker_pool.async_get_image(str(path), timeout=10) is None
+    assert hass.loop.time() - start < 5
+    assert not worker_pool.stats()[str(path)]["running"]
+
+
+async def test_get_image_no_binary(hass, source, tmp_path):
+    """Test no snapshot is returned if FFmpeg can not be started."""
+    worker_pool = pool.FFmpegWorkerPool(hass.loop, str(tmp_path / "missing"))
+
+    assert await worker_pool.async_get_image(source) is None
+    assert not worker_pool.stats()[source]["running"]
+
+
+async def test_max_workers(worker_pool, source, tmp_path):
+    """Test the least recently used process is stopped for another source."""
+    other_source = tmp_path / "other.mjpeg"
+    other_source.write_bytes(FRAME_1)
+    worker_pool.max_workers = 1
+
+    assert await worker_pool.async_get_image(source) is not None
+    assert await worker_pool.async_get_image(str(other_source)) == FRAME_1
+
+    stats = worker_pool.stats()
+    assert not stats[source]["running"]
+    assert stats[str(other_source)]["running"]
+
+
+async def test_stop_idle(worker_pool, source, monkeypatch):
+    """Test processes of sources that are not used are stopped."""
+    assert await worker_pool.async_get_image(source) is not None
+
+    await worker_pool.async_stop_idle()
+    assert worker_pool.stats()[source]["running"]
+
+    monkeypatch.setattr(pool, "IDLE_TIMEOUT", -1)
+    await worker_pool.async_stop_idle()
+    assert worker_pool.stats() == {}
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="CPU time is read from /proc"
+)
+def test_read_cpu_time():
+    """Test reading the CPU time of a process."""
+    assert pool.read_cpu_time(os.getpid()) > 0
+    assert pool.read_cpu_time(-1) is None
@@ -179,6 +179,61 @@ class TestFilterSensor(unittest.TestCase):
                 state = self.hass.states.get("sensor.test")
                 assert "18.0" == state.state
 
+    def test_history_loaded_once(self):
+        """Test states in both history windows are only replayed once."""
+        self.init_recorder()
+        config = {
+            "history": {},
+            "sensor": {
+                "platform": "filter",
+                "name": "test",
+                "entity_id": "sensor.test_monitored",
+                "filters": [
+                    {"filter": "throttle", "window_size": 10},
+                    {"filter": "time_throttle", "window_size": "00:05"},
+                ],
+            },
+        }
+        now = dt_util.utcnow()
+        recorded = [
+            (18.0, now - timedelta(minutes=3), ha.Context()),
+            (19.0, now - timedelta(minutes=2), ha.Context()),
+            (18.2, now - timedelta(minutes=1), ha.Context()),
+        ]
+
+        def fake_states(*args, **kwargs):
+            """Return new state objects like the recorder does."""
+            return {
+                "sensor.test_monitored": [
+                    ha.State(
+                        "sensor.test_monitored",
+                        value,
+                        last_updated=updated,
+                        context=context,
+                    )
+                    for value, updated, context in recorded
+                ]
+            }
+
+        with patch(
+            "homeassistant.components.history.state_changes_during_period",
+            side_effect=fake_states,
+        ), patch(
+            "homeassistant.components.history.get_last_state_changes",
+            side_effect=fake_states,
+        ), patch.object(
+            ThrottleFilter,
+            "filter_state",
+            autospec=True,
+            side_effect=ThrottleFilter.filter_state,
+        ) as mock_filter_state:
+            with assert_setup_component(1, "sensor"):
+                assert setup_component(self.hass, "sensor", config)
+            self.hass.block_till_done()
+
+        assert len(mock_filter_state.mock_calls) == 3
+        assert self.hass.states.get("sensor.test").state == "18.0"
+
     def test_outlier(self):
         """Test if outlier filter works."""
         filt = OutlierFilter(window_size=3, precision=2, entity=None, radius=4.0)
@@ -1,8 +1,18 @@
 """The tests for generic camera component."""
 import asyncio
+from datetime import timedelta
 from unittest import mock
 
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+
+
+def patch_later(seconds):
+    """Patch the current time to be the given amount of seconds later."""
+    return mock.patch(
+        "homeassistant.util.dt.utcnow",
+        return_value=dt_util.utcnow() + timedelta(seconds=seconds),
+    )
 
 
 @asyncio.coroutine
@@ -33,7 +43,12 @@ def test_fetching_url(aioclient_mock, hass, hass_client):
     body = yield from resp.text()
     assert body == "hello world"
 
+    # Images are cached for the frame interval
     resp = yield from client.get("/api/camera_proxy/camera.config_test")
+    assert aioclient_mock.call_count == 1
+
+    with patch_later(1):
+        resp = yield from client.get("/api/camera_proxy/camera.config_test")
     assert aioclient_mock.call_count == 2
 
 
@@ -140,7 +155,8 @@ def test_limit_refetch(aioclient_mock, hass, hass_client):
     hass.states.async_set("sensor.temp", "15")
 
     # Url change = fetch new image
-    resp = yield from client.get("/api/camera_proxy/camera.config_test")
+    with patch_later(1):
+        resp = yield from client.get("/api/camera_proxy/camera.config_test")
     assert aioclient_mock.call_count == 2
     assert resp.status == 200
     body = yield from resp.text()
@@ -148,7 +164,8 @@ def test_limit_refetch(aioclient_mock, hass, hass_client):
 
     # Cause a template render error
     hass.states.async_remove("sensor.temp")
-    resp = yield from client.get("/api/camera_proxy/camera.config_test")
+    with patch_later(2):
+        resp = yield from client.get("/api/camera_proxy/camera.config_test")
     assert aioclient_mock.call_count == 2
     assert resp.status == 200
     body = yield from resp.text()
@@ -1,4 +1,5 @@
 """Test Google report state."""
+from datetime import timedelta
 from unittest.mock import patch
 
 from homeassistant.components.google_assistant import error, report_state
@@ -9,6 +10,13 @@ from . import BASIC_CONFIG
 from tests.common import async_fire_time_changed, mock_coro
 
 
+def fire_report_window(hass):
+    """Fire a time change to report the pending states."""
+    async_fire_time_changed(
+        hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+    )
+
+
 async def test_report_state(hass, caplog):
     """Test report state works."""
     hass.states.async_set("light.ceiling", "off")
@@ -38,6 +46,8 @@ async def test_report_state(hass, caplog):
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
         await hass.async_block_till_done()
+        fire_report_window(hass)
+        await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 1
     assert mock_report.mock_calls[0][1][0] == {
@@ -53,6 +63,8 @@ async def test_report_state(hass, caplog):
             "light.kitchen", "on", {"irrelevant": "should_be_ignored"}
         )
         await hass.async_block_till_done()
+        fire_report_window(hass)
+        await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 0
 
@@ -65,6 +77,8 @@ async def test_report_state(hass, caplog):
     ):
         hass.states.async_set("light.kitchen", "off")
         await hass.async_block_till_done()
+        fire_report_window(hass)
+        await hass.async_block_till_done()
 
     assert "Not reporting state for light.kitchen: mock-error"
     assert len(mock_report.mock_calls) == 0
@@ -76,5 +90,50 @@ async def test_report_state(hass, caplog):
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
         await hass.async_block_till_done()
+        fire_report_window(hass)
+        await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 0
+
+
+async def test_report_state_batched(hass):
+    """Test state changes are collected and reported together."""
+    hass.states.async_set("light.ceiling", "off")
+    hass.states.async_set("light.kitchen", "off")
+
+    with patch.object(
+        BASIC_CONFIG, "async_report_state_all", side_effect=mock_coro
+    ) as mock_report, patch.object(report_state, "INITIAL_REPORT_DELAY", 3600):
+        unsub = report_state.async_enable_report_state(hass, BASIC_CONFIG)
+
+        hass.states.async_set("light.ceiling", "on")
+        hass.states.async_set("light.kitchen", "on")
+        hass.states.async_set("light.kitchen", "off")
+        hass.states.async_set("light.kitchen", "on")
+        await hass.async_block_till_done()
+
+        assert len(mock_report.mock_calls) == 0
+
+        fire_report_window(hass)
+        await hass.async_block_till_done()
+
+        assert len(mock_report.mock_calls) == 1
+        assert mock_report.mock_calls[0][1][0] == {
+            "devices": {
+                "states": {
+                    "light.ceiling": {"on": True, "online": True},
+                    "light.kitchen": {"on": True, "online": True},
+                }
+            }
+        }
+
+        # Changes that end in the reported state are not reported
+        hass.states.async_set("light.kitchen", "off")
+        hass.states.async_set("light.kitchen", "on")
+        await hass.async_block_till_done()
+        fire_report_window(hass)
+        await hass.async_block_till_done()
+
+        assert len(mock_report.mock_calls) == 1
+
+    unsub()
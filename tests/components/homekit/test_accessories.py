@@ -11,6 +11,7 @@ from homeassistant.components.homekit.accessories import (
     HomeAccessory,
     HomeBridge,
     HomeDriver,
+    async_get_state_router,
     debounce,
 )
 from homeassistant.components.homekit.const import (
@@ -35,6 +36,7 @@ from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_NOW,
     ATTR_SERVICE,
+    EVENT_STATE_CHANGED,
     EVENT_TIME_CHANGED,
     __version__,
 )
@@ -120,6 +122,50 @@ async def test_home_accessory(hass, hk_driver):
     assert serv.get_characteristic(CHAR_MODEL).value == "Test Model"
 
 
+async def test_accessories_share_state_listener(hass, hk_driver):
+    """Test all accessories share one state changed listener."""
+    entity_ids = ["homekit.accessory1", "homekit.accessory2"]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "off")
+    await hass.async_block_till_done()
+    listeners = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    updates = []
+    for aid, entity_id in enumerate(entity_ids, 2):
+        acc = HomeAccessory(hass, hk_driver, "Home Accessory", entity_id, aid, None)
+        acc.update_state = updates.append
+        await hass.async_add_job(acc.run)
+    await hass.async_block_till_done()
+
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners + 1
+    assert [state.entity_id for state in updates] == entity_ids
+
+    hass.states.async_set("homekit.accessory2", "on")
+    hass.states.async_set("homekit.other", "on")
+    await hass.async_block_till_done()
+
+    assert len(updates) == 3
+    assert updates[-1].entity_id == "homekit.accessory2"
+    assert updates[-1].state == "on"
+
+
+async def test_state_router_remove(hass):
+    """Test actions stop being called once removed."""
+    router = async_get_state_router(hass)
+    calls = []
+    remove = router.async_track("homekit.accessory", lambda *args: calls.append(args))
+
+    hass.states.async_set("homekit.accessory", "on")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    remove()
+    remove()
+    hass.states.async_set("homekit.accessory", "off")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+
 async def test_battery_service(hass, hk_driver, caplog):
     """Test battery service."""
     entity_id = "homekit.accessory"
@@ -0,0 +1,121 @@
+"""Test static file handling."""
+import gzip
+import mimetypes
+from unittest.mock import patch
+
+from aiohttp import web
+import pytest
+
+from homeassistant.components.http import static
+from homeassistant.components.http.static import CachingStaticResource
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    """Return a directory with static files."""
+    (tmp_path / "app.js").write_text("console.log('app');")
+    (tmp_path / "app.js.gz").write_bytes(gzip.compress(b"console.log('app');"))
+    (tmp_path / "app.js.br").write_bytes(b"brotli")
+    (tmp_path / "large.txt").write_text("x" * (static.MAX_MEMORY_FILE_SIZE + 1))
+    (tmp_path / "sub").mkdir()
+    return tmp_path
+
+
+@pytest.fixture
+def mock_static(aiohttp_client, static_dir):
+    """Return a client for a caching static resource."""
+    app = web.Application()
+    app.router.register_resource(CachingStaticResource("/static", str(static_dir)))
+    return aiohttp_client(app, auto_decompress=False)
+
+
+async def test_serving_precompressed(mock_static):
+    """Test the preferred precompressed variant is served."""
+    client = await mock_static
+
+    resp = await client.get("/static/app.js", headers={"Accept-Encoding": "gzip"})
+    assert resp.status == 200
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert resp.headers["Vary"] == "Accept-Encoding"
+    assert resp.headers["Content-Type"] == mimetypes.guess_type("app.js")[0]
+    assert gzip.decompress(await resp.read()) == b"console.log('app');"
+
+    resp = await client.get("/static/app.js", headers={"Accept-Encoding": "gzip, br"},)
+    assert resp.headers["Content-Encoding"] == "br"
+    assert await resp.read() == b"brotli"
+
+    resp = await client.get(
+        "/static/app.js", headers={"Accept-Encoding": "br;q=0, identity"}
+    )
+    assert "Content-Encoding" not in resp.headers
+    assert await resp.text() == "console.log('app');"
+
+
+async def test_not_modified(mock_static):
+    """Test conditional requests are answered with 304."""
+    client = await mock_static
+
+    resp = await client.get("/static/app.js", headers={"Accept-Encoding": "identity"})
+    assert resp.status == 200
+    etag = resp.headers["ETag"]
+    last_modified = resp.headers["Last-Modified"]
+    assert resp.headers["Cache-Control"] == static.CACHE_HEADERS["Cache-Control"]
+
+    resp = await client.get(
+        "/static/app.js",
+        headers={"Accept-Encoding": "identity", "If-None-Match": etag},
+    )
+    assert resp.status == 304
+    assert resp.headers["ETag"] == etag
+
+    # The ETag differs per variant
+    resp = await client.get(
+        "/static/app.js", headers={"Accept-Encoding": "gzip", "If-None-Match": etag}
+    )
+    assert resp.status == 200
+
+    resp = await client.get(
+        "/static/app.js",
+        headers={"Accept-Encoding": "identity", "If-Modified-Since": last_modified},
+    )
+    assert resp.status == 304
+
+
+async def test_index_cached(mock_static, static_dir):
+    """Test files are served from the index until it expires."""
+    client = await mock_static
+
+    resp = await client.get("/static/app.js", headers={"Accept-Encoding": "identity"})
+    assert await resp.text() == "console.log('app');"
+
+    (static_dir / "app.js").write_text("changed")
+    resp = await client.get("/static/app.js", headers={"Accept-Encoding": "identity"})
+    assert await resp.text() == "console.log('app');"
+
+    with patch.object(static, "STAT_CACHE_TIME", 0):
+        resp = await client.get(
+            "/static/app.js", headers={"Accept-Encoding": "identity"}
+        )
+    assert await resp.text() == "changed"
+
+
+async def test_serving_large_file(mock_static):
+    """Test large files are streamed from disk."""
+    client = await mock_static
+
+    resp = await client.get("/static/large.txt")
+    assert resp.status == 200
+    assert "ETag" in resp.headers
+    assert len(await resp.text()) == static.MAX_MEMORY_FILE_SIZE + 1
+
+
+async def test_not_found(mock_static):
+    """Test missing files, directories and paths outside the directory."""
+    client = await mock_static
+
+    for path in ("missing.js", "app.js.gz.gz", "../app.js"):
+        resp = await client.get(f"/static/{path}")
+        assert resp.status == 404
+
+    resp = await client.get("/static/sub")
+    assert resp.status == 403
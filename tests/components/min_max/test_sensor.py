@@ -197,6 +197,43 @@ class TestMinMaxSensor(unittest.TestCase):
         state = self.hass.states.get("sensor.test_max")
         assert STATE_UNKNOWN == state.state
 
+    def test_changing_source_values(self):
+        """Test aggregates follow sources that held the min or max value."""
+        config = {
+            "sensor": {
+                "platform": "min_max",
+                "name": "test_min",
+                "type": "min",
+                "entity_ids": ["sensor.test_1", "sensor.test_2", "sensor.test_3"],
+            }
+        }
+
+        assert setup_component(self.hass, "sensor", config)
+
+        entity_ids = config["sensor"]["entity_ids"]
+
+        for entity_id, value in dict(zip(entity_ids, self.values)).items():
+            self.hass.states.set(entity_id, value)
+            self.hass.block_till_done()
+
+        # The min source rises above the others and the max source drops
+        self.hass.states.set(entity_ids[2], 25)
+        self.hass.states.set(entity_ids[1], 10)
+        self.hass.block_till_done()
+
+        state = self.hass.states.get("sensor.test_min")
+        assert state.state == "10.0"
+        assert state.attributes.get("max_value") == 25
+        assert state.attributes.get("mean") == round((17 + 10 + 25) / 3, 2)
+
+        self.hass.states.set(entity_ids[1], STATE_UNKNOWN)
+        self.hass.block_till_done()
+
+        state = self.hass.states.get("sensor.test_min")
+        assert state.state == "17.0"
+        assert state.attributes.get("max_value") == 25
+        assert state.attributes.get("mean") == 21
+
     def test_different_unit_of_measurement(self):
         """Test for different unit of measurement."""
         config = {
@@ -0,0 +1,99 @@
+"""The tests for the Modbus hub."""
+from unittest import mock
+
+from pymodbus.bit_read_message import ReadCoilsResponse
+from pymodbus.register_read_message import ReadHoldingRegistersResponse
+
+from homeassistant.components.modbus import (
+    READ_COILS,
+    READ_HOLDING_REGISTERS,
+    READ_INPUT_REGISTERS,
+    ModbusHub,
+    plan_read_blocks,
+)
+
+
+def test_plan_read_blocks():
+    """Test ranges are grouped by type and unit into contiguous blocks."""
+    ranges = [
+        (READ_HOLDING_REGISTERS, 1, 0, 2),
+        (READ_HOLDING_REGISTERS, 1, 2, 2),
+        (READ_HOLDING_REGISTERS, 1, 6, 1),
+        (READ_HOLDING_REGISTERS, 2, 4, 1),
+        (READ_INPUT_REGISTERS, 1, 4, 1),
+    ]
+
+    blocks = plan_read_blocks(ranges, 0, 125)
+    assert blocks[ranges[0]] is blocks[ranges[1]]
+    assert (blocks[ranges[0]].address, blocks[ranges[0]].end) == (0, 4)
+    assert len({id(block) for block in blocks.values()}) == 4
+
+    # Small gaps are read along
+    blocks = plan_read_blocks(ranges, 2, 125)
+    assert blocks[ranges[0]] is blocks[ranges[2]]
+    assert (blocks[ranges[0]].address, blocks[ranges[0]].end) == (0, 7)
+
+    # Blocks don't grow beyond the maximum size
+    blocks = plan_read_blocks(ranges, 2, 4)
+    assert blocks[ranges[0]] is blocks[ranges[1]]
+    assert blocks[ranges[0]] is not blocks[ranges[2]]
+
+
+def test_read_registers_in_blocks():
+    """Test announced registers are read once per block and interval."""
+    client = mock.MagicMock()
+    client.read_holding_registers.return_value = ReadHoldingRegistersResponse(
+        [10, 11, 12, 13]
+    )
+    hub = ModbusHub(client, "hub")
+    hub.register_read(READ_HOLDING_REGISTERS, 1, 100, 1)
+    hub.register_read(READ_HOLDING_REGISTERS, 1, 101, 3)
+
+    assert hub.read_holding_registers(1, 100, 1).registers == [10]
+    assert hub.read_holding_registers(1, 101, 3).registers == [11, 12, 13]
+    assert client.read_holding_registers.mock_calls == [mock.call(100, 4, unit=1)]
+
+    # The next interval reads the block again
+    assert hub.read_holding_registers(1, 100, 1).registers == [10]
+    assert len(client.read_holding_registers.mock_calls) == 2
+
+    # Writing makes sure the next read is fresh
+    hub.read_holding_registers(1, 101, 3)
+    hub.write_register(1, 100, 5)
+    hub.read_holding_registers(1, 101, 3)
+    assert len(client.read_holding_registers.mock_calls) == 3
+
+    # Ranges that were not announced are read directly
+    client.read_holding_registers.return_value = ReadHoldingRegistersResponse([7])
+    assert hub.read_holding_registers(1, 200, 1).registers == [7]
+    assert client.read_holding_registers.mock_calls[-1] == mock.call(200, 1, unit=1)
+
+
+def test_read_coils_in_blocks():
+    """Test announced coils are read in blocks."""
+    client = mock.MagicMock()
+    client.read_coils.return_value = ReadCoilsResponse([True, False, True])
+    hub = ModbusHub(client, "hub")
+    for coil in range(3):
+        hub.register_read(READ_COILS, None, coil, 1)
+
+    assert [hub.read_coils(None, coil, 1).bits[0] for coil in range(3)] == [
+        True,
+        False,
+        True,
+    ]
+    assert client.read_coils.mock_calls == [mock.call(0, 3)]
+
+
+def test_read_block_failure():
+    """Test a failed block read is passed on to every entity of the block."""
+    client = mock.MagicMock()
+    error = object()
+    client.read_input_registers.return_value = error
+    hub = ModbusHub(client, "hub")
+    hub.register_read(READ_INPUT_REGISTERS, 1, 0, 1)
+    hub.register_read(READ_INPUT_REGISTERS, 1, 1, 1)
+
+    assert hub.read_input_registers(1, 0, 1) is error
+    assert hub.read_input_registers(1, 1, 1) is error
+    assert len(client.read_input_registers.mock_calls) == 1
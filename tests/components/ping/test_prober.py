@@ -0,0 +1,134 @@
+"""Test the ping prober."""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.ping import async_get_prober, prober
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.setup import async_setup_component
+
+from tests.common import mock_coro
+
+
+@pytest.fixture
+def icmp_prober(hass):
+    """Return the prober, skip if ICMP sockets are not allowed."""
+    ping_prober = async_get_prober(hass)
+    if ping_prober._socket is None:
+        pytest.skip("ICMP sockets are not allowed")
+    return ping_prober
+
+
+def test_echo_request_checksum():
+    """Test the checksum of an echo request verifies."""
+    packet = prober.echo_request(0x1234, 1)
+    assert packet[0] == prober.ICMP_ECHO_REQUEST
+    assert prober.checksum(packet) == 0
+
+
+def test_parse_ping_output():
+    """Test parsing the output of ping."""
+    out = (
+        "--- 127.0.0.1 ping statistics ---\n"
+        "2 packets transmitted, 2 received, 0% packet loss, time 1001ms\n"
+        "rtt min/avg/max/mdev = 0.031/0.043/0.055/0.012 ms\n"
+    )
+    with patch.object(prober.sys, "platform", "linux"):
+        assert prober.parse_ping_output(out) == {
+            "min": 0.031,
+            "avg": 0.043,
+            "max": 0.055,
+            "mdev": 0.012,
+        }
+        assert prober.parse_ping_output("2 packets transmitted, 0 received") is None
+
+
+async def test_ping_localhost(hass, icmp_prober):
+    """Test pinging localhost addresses at the same time."""
+    with patch.object(prober, "PING_INTERVAL", 0):
+        pings = asyncio.gather(
+            icmp_prober.async_ping("127.0.0.1", 2),
+            icmp_prober.async_ping("127.0.0.2", 1),
+        )
+        await asyncio.sleep(0)
+        assert len(icmp_prober._probes) == 2
+        results = await pings
+
+    for result in results:
+        assert result["min"] <= result["avg"] <= result["max"]
+        assert result["mdev"] >= 0
+
+
+async def test_ping_unreachable(hass, icmp_prober):
+    """Test pinging an address that does not reply."""
+    # Ignore the echo replies
+    with patch.object(prober, "PING_TIMEOUT", 0.1), patch.object(
+        prober, "ICMP_ECHO_REPLY", -1
+    ):
+        assert await icmp_prober.async_ping("127.0.0.1", 1) is None
+
+
+async def test_shared_probe(hass, icmp_prober):
+    """Test pings of a host that run at the same time share the result."""
+    with patch.object(
+        icmp_prober, "_async_echo", return_value=mock_coro(1)
+    ) as mock_echo:
+        first = hass.async_create_task(icmp_prober.async_ping("127.0.0.1", 1))
+        second = hass.async_create_task(icmp_prober.async_ping("127.0.0.1", 1))
+        assert await first == await second
+
+    assert mock_echo.call_count == 1
+
+
+async def test_identical_pings_share_probe(hass):
+    """Test identical pings share one probe task until it is done."""
+    ping_prober = prober.PingProber(hass.loop)
+    release = asyncio.Event()
+    probes = []
+
+    async def mock_probe(host, count, stop_on_reply):
+        probes.append((host, count))
+        await release.wait()
+        return {"avg": count}
+
+    with patch.object(ping_prober, "_async_probe", mock_probe):
+        pings = asyncio.gather(
+            ping_prober.async_ping("10.0.0.1", 2),
+            ping_prober.async_ping("10.0.0.1", 2),
+            ping_prober.async_ping("10.0.0.1", 1),
+        )
+        await asyncio.sleep(0)
+        assert set(ping_prober._probes) == {
+            ("10.0.0.1", 2, False),
+            ("10.0.0.1", 1, False),
+        }
+
+        release.set()
+        assert await pings == [{"avg": 2}, {"avg": 2}, {"avg": 1}]
+
+    assert probes == [("10.0.0.1", 2), ("10.0.0.1", 1)]
+    assert ping_prober._probes == {}
+    ping_prober.close()
+
+
+async def test_binary_sensor(hass, icmp_prober):
+    """Test the binary sensor reports the round trip times."""
+    assert await async_setup_component(
+        hass,
+        "binary_sensor",
+        {"binary_sensor": {"platform": "ping", "host": "127.0.0.1", "count": 1}},
+    )
+    await hass.async_block_till_done()
+
+    state = hass.states.get("binary_sensor.ping_binary_sensor")
+    assert state.state == "on"
+    assert state.attributes["round_trip_time_avg"] >= 0
+
+
+async def test_prober_closed_on_stop(hass, icmp_prober):
+    """Test the ICMP socket is closed when Home Assistant stops."""
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+
+    assert icmp_prober._socket is None
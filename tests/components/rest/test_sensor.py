@@ -422,3 +422,82 @@ class TestRestData(unittest.TestCase):
         """Test update when a request exception occurs."""
         self.rest.update()
         assert self.rest.data is None
+
+    def hass_rest_data(self):
+        """Return RestData that shares responses in a test hass."""
+        hass = get_test_home_assistant()
+        self.addCleanup(hass.stop)
+        return (
+            hass,
+            rest.RestData(
+                self.method,
+                self.resource,
+                None,
+                None,
+                None,
+                self.verify_ssl,
+                self.timeout,
+                hass=hass,
+            ),
+        )
+
+    @requests_mock.Mocker()
+    def test_update_shared(self, mock_req):
+        """Test identical requests share their response."""
+        mock_req.get("http://localhost", text="test data")
+        hass, data = self.hass_rest_data()
+        other = rest.RestData(
+            self.method,
+            self.resource,
+            None,
+            None,
+            None,
+            self.verify_ssl,
+            self.timeout,
+            hass=hass,
+        )
+        data.update()
+        other.update()
+        assert "test data" == other.data
+        assert mock_req.call_count == 1
+
+        # A consumer that already got the response fetches it again
+        mock_req.get("http://localhost", text="new data")
+        data.update()
+        assert "new data" == data.data
+        assert mock_req.call_count == 2
+
+        # Requests without hass are not shared
+        self.rest.update()
+        assert mock_req.call_count == 3
+
+    @requests_mock.Mocker()
+    def test_update_no_cookies_kept(self, mock_req):
+        """Test cookies of a response are not sent with the next request."""
+        mock_req.get("http://example.com", text="test data")
+        hass = get_test_home_assistant()
+        self.addCleanup(hass.stop)
+        data = rest.RestData(
+            self.method, "http://example.com", None, None, None, True, hass=hass
+        )
+        data.update()
+        # A cookie that was set by the response
+        data._session.cookies.set("id", "1")
+        data._shared_fetches.clear()
+        data.update()
+
+        assert mock_req.call_count == 2
+        assert "Cookie" not in mock_req.request_history[1].headers
+
+    @requests_mock.Mocker()
+    def test_session_closed_on_stop(self, mock_req):
+        """Test the connection is closed when Home Assistant stops."""
+        mock_req.get("http://localhost", text="test data")
+        hass, data = self.hass_rest_data()
+        data.update()
+        session = data._session
+
+        with patch.object(session, "close") as close:
+            hass.stop()
+        assert close.call_count == 1
+        assert data._session is None
@@ -22,7 +22,7 @@ from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import bind_hass
 from homeassistant.setup import async_setup_component, setup_component
 
-from tests.common import get_test_home_assistant
+from tests.common import async_capture_events, get_test_home_assistant
 
 ENTITY_ID = "script.test"
 
@@ -244,6 +244,77 @@ class TestScriptComponent(unittest.TestCase):
         assert self.hass.services.has_service(script.DOMAIN, "test2")
 
 
+async def test_reload_keeps_unchanged_scripts(hass):
+    """Test reload does not interrupt scripts whose config did not change."""
+    keep = {"sequence": [{"delay": {"seconds": 5}}]}
+    assert await async_setup_component(
+        hass,
+        script.DOMAIN,
+        {script.DOMAIN: {"keep": keep, "change": keep, "remove": keep}},
+    )
+
+    await hass.services.async_call(script.DOMAIN, "keep")
+    await hass.async_block_till_done()
+    assert script.is_on(hass, "script.keep")
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        return_value={
+            script.DOMAIN: {
+                "keep": keep,
+                "change": {"sequence": [{"delay": {"seconds": 10}}]},
+            }
+        },
+    ), patch("homeassistant.config.find_config_file", return_value=""):
+        await hass.services.async_call(script.DOMAIN, SERVICE_RELOAD, blocking=True)
+        await hass.async_block_till_done()
+
+    assert script.is_on(hass, "script.keep")
+    assert hass.states.get("script.change") is not None
+    assert hass.states.get("script.remove") is None
+    assert hass.services.has_service(script.DOMAIN, "change")
+    assert not hass.services.has_service(script.DOMAIN, "remove")
+
+
+async def test_reload_keeps_templated_scripts(hass):
+    """Test reload keeps scripts with templates whose config did not change."""
+    config = {
+        script.DOMAIN: {
+            "templated": {
+                "sequence": [
+                    {"wait_template": "{{ is_state('test.entity', 'on') }}"},
+                    {
+                        "event": "test_event",
+                        "event_data_template": {"value": "{{ 1 + 1 }}"},
+                    },
+                ]
+            }
+        }
+    }
+    assert await async_setup_component(hass, script.DOMAIN, config)
+    component = hass.data["entity_components"][script.DOMAIN]
+    entity = component.get_entity("script.templated")
+
+    events = async_capture_events(hass, "test_event")
+    await hass.services.async_call(script.DOMAIN, "templated")
+    await hass.async_block_till_done()
+    assert script.is_on(hass, "script.templated")
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file", return_value=config
+    ), patch("homeassistant.config.find_config_file", return_value=""):
+        await hass.services.async_call(script.DOMAIN, SERVICE_RELOAD, blocking=True)
+        await hass.async_block_till_done()
+
+    assert component.get_entity("script.templated") is entity
+    assert script.is_on(hass, "script.templated")
+
+    hass.states.async_set("test.entity", "on")
+    await hass.async_block_till_done()
+    assert len(events) == 1
+    assert events[0].data["value"] == "2"
+
+
 async def test_service_descriptions(hass):
     """Test that service descriptions are loaded and reloaded correctly."""
     # Test 1: has "description" but no "fields"
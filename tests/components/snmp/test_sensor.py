@@ -0,0 +1,142 @@
+"""The tests for the SNMP sensor platform."""
+from unittest.mock import Mock, patch
+
+import pytest
+
+from homeassistant.components.snmp import sensor as snmp
+from homeassistant.components.snmp.const import DOMAIN
+from homeassistant.setup import async_setup_component
+
+REQUEST_ARGS = ["engine", "auth", "transport", "context"]
+
+
+class FakeAgent:
+    """SNMP agent that answers GET requests from a dict of values."""
+
+    def __init__(self, values, failing=(), errindication=None):
+        """Initialize the agent."""
+        self.values = values
+        self.failing = failing
+        self.errindication = errindication
+        self.requests = []
+
+    async def get_cmd(self, *args):
+        """Answer a GET request."""
+        oids = args[len(REQUEST_ARGS) :]
+        self.requests.append(oids)
+        if self.errindication:
+            return self.errindication, 0, 0, []
+        restable = [(oid, self.values.get(oid)) for oid in oids]
+        for index, oid in enumerate(oids):
+            if oid in self.failing:
+                # Agents of SNMPv1 fail the whole request
+                errstatus = Mock(prettyPrint=Mock(return_value="noSuchName"))
+                return None, errstatus, index + 1, restable
+        return None, 0, 0, restable
+
+
+@pytest.fixture
+def mock_get_cmd():
+    """Patch the SNMP requests to be answered by a fake agent."""
+
+    def patch_agent(agent):
+        return patch.multiple(
+            snmp,
+            getCmd=agent.get_cmd,
+            ObjectType=lambda identity: identity,
+            ObjectIdentity=lambda oid: oid,
+        )
+
+    return patch_agent
+
+
+async def test_requests_batched(hass, mock_get_cmd):
+    """Test the OIDs of all sensors of an agent are requested together."""
+    oids = [f"1.3.6.1.{index}" for index in range(25)]
+    fake = FakeAgent({oid: index for index, oid in enumerate(oids)})
+    agent = snmp.SnmpAgent(REQUEST_ARGS)
+    sensors = [snmp.SnmpData(agent, oid, False, None) for oid in oids]
+    for oid in oids:
+        agent.add_oid(oid)
+
+    with mock_get_cmd(fake), patch.object(snmp, "monotonic", return_value=100):
+        await sensors[0].async_update()
+        assert [len(oids) for oids in fake.requests] == [10, 10, 5]
+
+        # Within the scan interval the values are handed to the others
+        for data in sensors[1:]:
+            await data.async_update()
+        assert len(fake.requests) == 3
+        assert [data.value for data in sensors] == [str(index) for index in range(25)]
+
+        # A sensor that got the values already requests them again
+        await sensors[0].async_update()
+        assert len(fake.requests) == 6
+
+    with mock_get_cmd(fake), patch.object(
+        snmp, "monotonic", return_value=100 + snmp.SCAN_INTERVAL.total_seconds()
+    ):
+        # Values older than the scan interval are requested again
+        await sensors[1].async_update()
+        assert len(fake.requests) == 9
+
+
+async def test_request_error_status_v1(hass, mock_get_cmd):
+    """Test OIDs are requested one by one if an SNMPv1 request fails."""
+    oids = ["1.3.6.1.1", "1.3.6.1.2", "1.3.6.1.3"]
+    fake = FakeAgent({oids[0]: 1, oids[2]: 3}, failing={oids[1]})
+    agent = snmp.SnmpAgent(REQUEST_ARGS)
+    sensors = [snmp.SnmpData(agent, oid, True, "default") for oid in oids]
+    for oid in oids:
+        agent.add_oid(oid)
+
+    with mock_get_cmd(fake):
+        for data in sensors:
+            await data.async_update()
+
+    assert fake.requests == [tuple(oids)] + [(oid,) for oid in oids]
+    assert [data.value for data in sensors] == ["1", "default", "3"]
+
+
+async def test_request_error_indication(hass, mock_get_cmd, caplog):
+    """Test an error indication is reported to all sensors of the request."""
+    oids = ["1.3.6.1.1", "1.3.6.1.2"]
+    fake = FakeAgent({}, errindication="No SNMP response received before timeout")
+    agent = snmp.SnmpAgent(REQUEST_ARGS)
+    sensors = [
+        snmp.SnmpData(agent, oids[0], False, None),
+        snmp.SnmpData(agent, oids[1], True, "default"),
+    ]
+    for oid in oids:
+        agent.add_oid(oid)
+
+    with mock_get_cmd(fake):
+        for data in sensors:
+            await data.async_update()
+
+    assert len(fake.requests) == 1
+    assert sensors[0].value is None
+    assert "SNMP error: No SNMP response received" in caplog.text
+    assert sensors[1].value == "default"
+
+
+async def test_sensors_share_agent(hass, mock_get_cmd):
+    """Test sensors of the same agent share it."""
+    fake = FakeAgent({"1.3.6.1.1": "first", "1.3.6.1.2": "second"})
+
+    with mock_get_cmd(fake):
+        assert await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": [
+                    {"platform": "snmp", "name": "first", "baseoid": "1.3.6.1.1"},
+                    {"platform": "snmp", "name": "second", "baseoid": "1.3.6.1.2"},
+                ]
+            },
+        )
+        await hass.async_block_till_done()
+
+    assert len(hass.data[DOMAIN]) == 1
+    assert hass.states.get("sensor.first").state == "first"
+    assert hass.states.get("sensor.second").state == "second"
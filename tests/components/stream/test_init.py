@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from homeassistant.components.stream import stop_lookback
 from homeassistant.components.stream.const import (
     ATTR_STREAMS,
     CONF_LOOKBACK,
@@ -17,6 +18,23 @@ from homeassistant.setup import async_setup_component
 from tests.common import mock_coro
 
 
+async def test_stop_lookback(hass):
+    """Test stopping the lookback buffer of a stream."""
+    hass.config.components.add(DOMAIN)
+    stream = MagicMock(keepalive=True)
+    lookback_mock = MagicMock()
+    stream.outputs = {"lookback": lookback_mock}
+    hass.data[DOMAIN] = {ATTR_STREAMS: {"rtsp://my.video": stream}}
+
+    stop_lookback(hass, "rtsp://my.video")
+
+    assert not stream.keepalive
+    assert lookback_mock.cleanup.called
+
+    # Nothing to stop for unknown streams
+    stop_lookback(hass, "rtsp://other.video")
+
+
 async def test_record_service_invalid_file(hass):
     """Test record service call with invalid file."""
     await async_setup_component(hass, "stream", {"stream": {}})
@@ -85,3 +103,31 @@ async def test_record_service_lookback(hass):
         assert stream_mock.called
         stream_mock.return_value.add_provider.assert_called_once_with("recorder")
         assert hls_mock.recv.called
+
+
+async def test_record_service_lookback_buffer(hass):
+    """Test record service call uses the lookback buffer."""
+    await async_setup_component(hass, "stream", {"stream": {}})
+    data = {
+        CONF_STREAM_SOURCE: "rtsp://my.video",
+        CONF_FILENAME: "/my/invalid/path",
+        CONF_LOOKBACK: 20,
+    }
+
+    with patch("homeassistant.components.stream.Stream") as stream_mock, patch.object(
+        hass.config, "is_allowed_path", return_value=True
+    ):
+        # Setup stubs
+        hls_mock = MagicMock()
+        lookback_mock = MagicMock()
+        lookback_mock.recv.return_value = mock_coro()
+        lookback_mock.get_lookback.return_value = ["segment"]
+        stream_mock.return_value.outputs = {"hls": hls_mock, "lookback": lookback_mock}
+
+        # Call Service
+        await hass.services.async_call(DOMAIN, SERVICE_RECORD, data, blocking=True)
+
+        recorder = stream_mock.return_value.add_provider.return_value
+        lookback_mock.get_lookback.assert_called_once_with(20)
+        recorder.prepend.assert_called_once_with(["segment"])
+        assert not hls_mock.recv.called
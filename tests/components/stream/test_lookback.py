@@ -0,0 +1,51 @@
+"""The tests for the stream lookback buffer."""
+from io import BytesIO
+from unittest.mock import MagicMock
+
+from homeassistant.components.stream.core import Segment
+from homeassistant.components.stream.lookback import LookbackOutput
+
+
+def _segment(sequence, size, duration=2):
+    """Return a segment of the given size."""
+    return Segment(sequence, BytesIO(b"\x00" * size), duration)
+
+
+async def test_lookback_keeps_duration(hass):
+    """Test the lookback buffer keeps the configured duration."""
+    stream = MagicMock(hass=hass)
+    lookback = LookbackOutput(stream)
+    lookback.max_duration = 5
+
+    for sequence in range(1, 8):
+        lookback.put(_segment(sequence, 10))
+
+    # Three segments of 2 seconds are needed to cover 5 seconds
+    assert lookback.segments == [5, 6, 7]
+    assert lookback.duration == 6
+    assert lookback.size == 30
+    assert [s.sequence for s in lookback.get_lookback(3)] == [6, 7]
+    assert [s.sequence for s in lookback.get_lookback(60)] == [5, 6, 7]
+    assert lookback.idle
+
+
+async def test_lookback_max_bytes(hass):
+    """Test the lookback buffer is limited in size."""
+    stream = MagicMock(hass=hass)
+    lookback = LookbackOutput(stream)
+    lookback.max_duration = 60
+    lookback.max_bytes = 25
+
+    for sequence in range(1, 8):
+        lookback.put(_segment(sequence, 10))
+
+    assert lookback.segments == [6, 7]
+    assert lookback.size == 20
+
+    # The latest segment is always kept
+    lookback.put(_segment(8, 50))
+    assert lookback.segments == [8]
+
+    lookback.put(None)
+    assert lookback.segments == []
+    stream.remove_provider.assert_called_once_with(lookback)
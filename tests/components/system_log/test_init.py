@@ -114,6 +114,58 @@ async def test_error_posted_as_event(hass):
     assert_log(events[0].data, "", "error message", "ERROR")
 
 
+async def test_repeated_error_events_rate_limited(hass):
+    """Test repeated errors only fire an event once per interval."""
+    await async_setup_component(
+        hass, system_log.DOMAIN, {"system_log": {"max_entries": 2, "fire_event": True}}
+    )
+    events = []
+
+    @callback
+    def event_listener(event):
+        """Listen to events of type system_log_event."""
+        events.append(event)
+
+    hass.bus.async_listen(system_log.EVENT_SYSTEM_LOG, event_listener)
+
+    with patch("time.time", return_value=1000):
+        for _ in range(10):
+            _LOGGER.error("error message")
+        _LOGGER.error("other message")
+    await hass.async_block_till_done()
+
+    assert len(events) == 2
+    assert events[0].data["count"] == 1
+
+    with patch("time.time", return_value=1000 + system_log.EVENT_INTERVAL):
+        _LOGGER.error("error message")
+    # The event is fired thread safe, listeners run one iteration later
+    await hass.async_block_till_done()
+    await hass.async_block_till_done()
+
+    assert len(events) == 3
+    assert events[2].data["count"] == 11
+
+
+async def test_repeated_error_skips_stack(hass, hass_client):
+    """Test the call stack is only inspected for new entries."""
+    await async_setup_component(hass, system_log.DOMAIN, BASIC_CONFIG)
+
+    with patch(
+        "traceback.extract_stack", wraps=system_log.traceback.extract_stack
+    ) as mock_extract_stack:
+        for _ in range(5):
+            _LOGGER.error("error message")
+        for _ in range(5):
+            _generate_and_log_exception("exception message", "log message")
+
+    assert len(mock_extract_stack.mock_calls) == 1
+    log = await get_error_log(hass, hass_client, 2)
+    assert log[0]["count"] == 5
+    assert_log(log[0], "exception message", "log message", "ERROR")
+    assert log[1]["count"] == 5
+
+
 async def test_critical(hass, hass_client):
     """Test that critical are logged and retrieved correctly."""
     await async_setup_component(hass, system_log.DOMAIN, BASIC_CONFIG)
@@ -2,6 +2,8 @@
 from datetime import timedelta
 from unittest.mock import patch
 
+import pytest
+
 from homeassistant import setup
 import homeassistant.util.dt as dt_util
 
@@ -271,6 +273,44 @@ class TestTrendBinarySensor:
         assert state.state == "on"
         assert state.attributes["sample_count"] == 3
 
+    def test_gradient_of_sliding_window(self):
+        """Test the gradient only uses the samples in the window."""
+        assert setup.setup_component(
+            self.hass,
+            "binary_sensor",
+            {
+                "binary_sensor": {
+                    "platform": "trend",
+                    "sensors": {
+                        "test_trend_sensor": {
+                            "entity_id": "sensor.test_state",
+                            "max_samples": 5,
+                            "min_gradient": 1,
+                        }
+                    },
+                }
+            },
+        )
+
+        now = dt_util.utcnow()
+        values = [2 * second for second in range(20)] + [38] * 5
+        for second, val in enumerate(values):
+            with patch(
+                "homeassistant.core.dt_util.utcnow",
+                return_value=now + timedelta(seconds=second),
+            ):
+                self.hass.states.set("sensor.test_state", val, force_update=True)
+                self.hass.block_till_done()
+
+            if second == 19:
+                state = self.hass.states.get("binary_sensor.test_trend_sensor")
+                assert state.state == "on"
+                assert state.attributes["gradient"] == pytest.approx(2)
+
+        state = self.hass.states.get("binary_sensor.test_trend_sensor")
+        assert state.state == "off"
+        assert state.attributes["gradient"] == pytest.approx(0)
+
     def test_non_numeric(self):
         """Test up trend."""
         assert setup.setup_component(
@@ -1,4 +1,6 @@
 """Tests for WebSocket API commands."""
+from unittest.mock import ANY
+
 from async_timeout import timeout
 
 from homeassistant.components.websocket_api import const
@@ -116,7 +118,6 @@ async def test_call_service_error(hass, websocket_client):
     )
 
     msg = await websocket_client.receive_json()
-    print(msg)
     assert msg["id"] == 5
     assert msg["type"] == const.TYPE_RESULT
     assert msg["success"] is False
@@ -133,7 +134,6 @@ async def test_call_service_error(hass, websocket_client):
     )
 
     msg = await websocket_client.receive_json()
-    print(msg)
     assert msg["id"] == 6
     assert msg["type"] == const.TYPE_RESULT
     assert msg["success"] is False
@@ -218,6 +218,21 @@ async def test_get_services(hass, websocket_client):
     assert msg["result"] == hass.services.async_services()
 
 
+async def test_get_services_updated(hass, websocket_client):
+    """Test get_services includes services registered after a previous call."""
+    await websocket_client.send_json({"id": 5, "type": "get_services"})
+    msg = await websocket_client.receive_json()
+    assert "light" not in msg["result"]
+
+    hass.services.async_register("light", "test_service", lambda call: None)
+
+    await websocket_client.send_json({"id": 6, "type": "get_services"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["success"]
+    assert msg["result"]["light"] == {"test_service": {"description": "", "fields": {}}}
+
+
 async def test_get_config(hass, websocket_client):
     """Test get_config command."""
     await websocket_client.send_json({"id": 5, "type": "get_config"})
@@ -313,6 +328,108 @@ async def test_states_filters_visible(hass, hass_admin_user, websocket_client):
     assert msg["result"][0]["entity_id"] == "test.entity"
 
 
+async def test_subscribe_entities(hass, websocket_client):
+    """Test subscribe entities sends a snapshot and then only changes."""
+    hass.states.async_set("light.permitted", "off", {"color": "red"})
+    hass.states.async_set("light.ignored", "off")
+    original_state = hass.states.get("light.permitted")
+
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_entities",
+            "entity_ids": ["light.permitted", "light.later"],
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.permitted": {
+                "s": "off",
+                "a": {"color": "red"},
+                "c": original_state.context.id,
+                "lc": original_state.last_changed.timestamp(),
+            }
+        }
+    }
+
+    hass.states.async_set("light.ignored", "on")
+    hass.states.async_set("light.permitted", "on", {"brightness": 100})
+    state = hass.states.get("light.permitted")
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {
+                    "s": "on",
+                    "a": {"brightness": 100},
+                    "c": state.context.id,
+                    "lc": state.last_changed.timestamp(),
+                },
+                "-": {"a": ["color"]},
+            }
+        }
+    }
+
+    hass.states.async_set("light.permitted", "on", {"brightness": 50})
+    state = hass.states.get("light.permitted")
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {
+                    "a": {"brightness": 50},
+                    "c": state.context.id,
+                    "lu": state.last_updated.timestamp(),
+                }
+            }
+        }
+    }
+
+    hass.states.async_set("light.later", "on")
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["a"]) == ["light.later"]
+
+    hass.states.async_remove("light.permitted")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"r": ["light.permitted"]}
+
+
+async def test_subscribe_entities_filters_visible(
+    hass, hass_admin_user, websocket_client
+):
+    """Test subscribe entities only sends entities that we're allowed to see."""
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"test.entity": True}}})
+    hass.states.async_set("test.entity", "hello")
+    hass.states.async_set("test.not_visible_entity", "invisible")
+
+    await websocket_client.send_json({"id": 5, "type": "subscribe_entities"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["a"]) == ["test.entity"]
+
+    hass.states.async_set("test.not_visible_entity", "changed")
+    hass.states.async_set("test.entity", "changed")
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"test.entity": {"+": {"s": "changed", "c": ANY, "lc": ANY}}}
+    }
+
+
 async def test_get_states_not_allows_nan(hass, websocket_client):
     """Test get_states command not allows NaN floats."""
     hass.states.async_set("greeting.hello", "world", {"hello": float("NaN")})
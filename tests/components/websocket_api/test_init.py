@@ -7,6 +7,8 @@ import pytest
 import voluptuous as vol
 
 from homeassistant.components.websocket_api import const, messages
+from homeassistant.components.websocket_api.auth import TYPE_AUTH_REQUIRED
+from homeassistant.setup import async_setup_component
 
 
 @pytest.fixture
@@ -103,3 +105,49 @@ async def test_invalid_vol(hass, websocket_client):
     assert not msg["success"]
     assert msg["error"]["code"] == const.ERR_INVALID_FORMAT
     assert "expected str for dictionary value" in msg["error"]["message"]
+
+
+async def test_compression_negotiated(hass, aiohttp_client):
+    """Test messages are compressed when the client supports it."""
+    assert await async_setup_component(hass, "websocket_api", {})
+    client = await aiohttp_client(hass.http.app)
+
+    async with client.ws_connect(const.URL, compress=15) as ws:
+        assert ws.compress == 15
+        msg = await ws.receive_json()
+        assert msg["type"] == TYPE_AUTH_REQUIRED
+
+
+async def test_coalesce_messages(hass, websocket_client):
+    """Test queued messages are sent in one frame if the client supports it."""
+    await websocket_client.send_json(
+        {"id": 5, "type": "subscribe_events", "event_type": "test_event"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    for index in range(2):
+        hass.bus.async_fire("test_event", {"index": index})
+
+    for index in range(2):
+        msg = await websocket_client.receive_json()
+        assert msg["event"]["data"]["index"] == index
+
+    await websocket_client.send_json(
+        {
+            "id": 6,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["success"]
+
+    for index in range(3):
+        hass.bus.async_fire("test_event", {"index": index})
+
+    msg = await websocket_client.receive_json()
+    assert isinstance(msg, list)
+    assert [event["id"] for event in msg] == [5, 5, 5]
+    assert [event["event"]["data"]["index"] for event in msg] == [0, 1, 2]
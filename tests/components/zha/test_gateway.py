@@ -0,0 +1,107 @@
+"""Test ZHA Gateway."""
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+
+@pytest.fixture
+def check_availability(zha_gateway):
+    """Return a function that checks availability at a given time."""
+
+    def check(now):
+        with patch(
+            "homeassistant.components.zha.core.gateway.time",
+            Mock(time=Mock(return_value=now)),
+        ):
+            zha_gateway._async_check_availability()
+
+    return check
+
+
+def add_device(zha_gateway, ieee, due, next_due, checked=None):
+    """Add a device that is checked at due and then again at next_due."""
+    device = Mock()
+
+    def async_check_available(now):
+        if checked is not None:
+            checked.append(ieee)
+        return next_due
+
+    device.async_check_available.side_effect = async_check_available
+    zha_gateway.devices[ieee] = device
+    zha_gateway._async_schedule_availability_check(ieee, due)
+    return device
+
+
+async def test_availability_checked_in_due_order(zha_gateway, check_availability):
+    """Test devices are checked in the order they are due."""
+    now = time.time()
+    checked = []
+    add_device(zha_gateway, "c", now - 1, now + 60, checked)
+    add_device(zha_gateway, "a", now - 3, now + 60, checked)
+    add_device(zha_gateway, "b", now - 2, now + 60, checked)
+    add_device(zha_gateway, "d", now + 10, now + 60, checked)
+
+    check_availability(now)
+    assert checked == ["a", "b", "c"]
+
+    check_availability(now + 10)
+    assert checked == ["a", "b", "c", "d"]
+
+
+async def test_availability_due_again_right_away(zha_gateway, check_availability):
+    """Test a device that is due again right away waits for the next sweep."""
+    now = time.time()
+    device = add_device(zha_gateway, "a", now - 1, now)
+
+    check_availability(now)
+    assert device.async_check_available.call_count == 1
+    assert zha_gateway._availability_due["a"] == now
+
+    check_availability(now)
+    assert device.async_check_available.call_count == 2
+
+
+async def test_availability_skips_rescheduled_and_removed(
+    zha_gateway, check_availability
+):
+    """Test rescheduled and removed devices are not checked."""
+    now = time.time()
+    rescheduled = add_device(zha_gateway, "a", now - 2, now + 60)
+    zha_gateway._async_schedule_availability_check("a", now + 30)
+    # Removed devices are only known to the queue
+    zha_gateway._async_schedule_availability_check("b", now - 1)
+    zha_gateway.device_removed(Mock(ieee="b"))
+
+    check_availability(now)
+    assert rescheduled.async_check_available.call_count == 0
+    assert "b" not in zha_gateway._availability_due
+    assert zha_gateway._availability_queue == [(now + 30, 1, "a")]
+
+    check_availability(now + 30)
+    assert rescheduled.async_check_available.call_count == 1
+
+
+async def test_entity_references(zha_gateway):
+    """Test entity references are found and cleaned up."""
+    zha_device = Mock(ieee="ieee1")
+    for entity_id in ("light.one", "light.two"):
+        zha_gateway.register_entity_reference(
+            "ieee1", entity_id, zha_device, {}, {}, Mock()
+        )
+
+    assert zha_gateway.get_entity_reference("light.one").zha_device is zha_device
+    assert zha_gateway.get_entity_reference("light.unknown") is None
+
+    zha_gateway.remove_entity_reference(
+        Mock(entity_id="light.one", zha_device=zha_device)
+    )
+    assert zha_gateway.get_entity_reference("light.one") is None
+    assert [ref.reference_id for ref in zha_gateway.device_registry["ieee1"]] == [
+        "light.two"
+    ]
+
+    zha_gateway.device_removed(Mock(ieee="ieee1"))
+    assert zha_gateway.get_entity_reference("light.two") is None
+    assert "ieee1" not in zha_gateway.device_registry
@@ -4,6 +4,7 @@ import asyncio
 from homeassistant.core import callback
 from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
+    async_dispatcher_send,
     dispatcher_connect,
     dispatcher_send,
 )
@@ -153,3 +154,24 @@ async def test_callback_exception_gets_logged(hass, caplog):
     await hass.async_block_till_done()
 
     assert "Exception in bad_handler when dispatching 'test': ('bad',)" in caplog.text
+
+
+async def test_callback_runs_inline(hass):
+    """Test callbacks are run while the signal is sent."""
+    calls = []
+
+    @callback
+    def handler(data):
+        """Record calls."""
+        calls.append(data)
+        unsub()
+
+    unsub = async_dispatcher_connect(hass, "test", handler)
+    async_dispatcher_send(hass, "test", 3)
+
+    assert calls == [3]
+
+    # The callback disconnected itself
+    async_dispatcher_send(hass, "test", 4)
+
+    assert calls == [3]
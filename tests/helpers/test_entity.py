@@ -8,10 +8,19 @@ from unittest.mock import MagicMock, PropertyMock, patch
 import pytest
 
 from homeassistant.config import DATA_CUSTOMIZE
-from homeassistant.const import ATTR_DEVICE_CLASS, ATTR_HIDDEN, STATE_UNAVAILABLE
+from homeassistant.const import (
+    ATTR_DEVICE_CLASS,
+    ATTR_FRIENDLY_NAME,
+    ATTR_HIDDEN,
+    ATTR_UNIT_OF_MEASUREMENT,
+    STATE_UNAVAILABLE,
+    TEMP_CELSIUS,
+    TEMP_FAHRENHEIT,
+)
 from homeassistant.core import Context
 from homeassistant.helpers import entity, entity_registry
 from homeassistant.helpers.entity_values import EntityValues
+from homeassistant.util.unit_system import IMPERIAL_SYSTEM
 
 from tests.common import get_test_home_assistant, mock_registry
 
@@ -661,3 +670,70 @@ async def test_capability_attrs(hass):
     assert state is not None
     assert state.state == STATE_UNAVAILABLE
     assert state.attributes["always"] == "there"
+
+
+async def test_registry_name_updated(hass):
+    """Test the name of a replaced registry entry is used."""
+    entry = entity_registry.RegistryEntry(
+        entity_id="hello.world", unique_id="test-unique-id", platform="test-platform"
+    )
+    registry = mock_registry(hass, {"hello.world": entry})
+
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent.registry_entry = entry
+    ent.platform = MagicMock(platform_name="test-platform")
+
+    await ent.async_internal_added_to_hass()
+    ent.async_write_ha_state()
+    assert ATTR_FRIENDLY_NAME not in hass.states.get("hello.world").attributes
+
+    registry.async_update_entity("hello.world", name="Hello")
+    await hass.async_block_till_done()
+    assert hass.states.get("hello.world").attributes[ATTR_FRIENDLY_NAME] == "Hello"
+
+
+async def test_customize_reloaded(hass):
+    """Test customize values are looked up again when reloaded."""
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+
+    hass.data[DATA_CUSTOMIZE] = EntityValues({"hello.world": {"hello": "world"}})
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").attributes["hello"] == "world"
+
+    hass.data[DATA_CUSTOMIZE] = EntityValues({"hello.world": {"hello": "you"}})
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").attributes["hello"] == "you"
+
+    del hass.data[DATA_CUSTOMIZE]
+    ent.async_write_ha_state()
+    assert "hello" not in hass.states.get("hello.world").attributes
+
+
+async def test_temperature_conversion_updated(hass):
+    """Test temperatures are converted for the current unit and unit system."""
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+
+    with patch.object(
+        entity.Entity, "state", PropertyMock(return_value="20.0")
+    ), patch.object(
+        entity.Entity, "unit_of_measurement", PropertyMock(return_value=TEMP_CELSIUS)
+    ) as unit:
+        ent.async_write_ha_state()
+        assert hass.states.get("hello.world").state == "20.0"
+
+        hass.config.units = IMPERIAL_SYSTEM
+        ent.async_write_ha_state()
+        assert hass.states.get("hello.world").state == "68.0"
+
+        unit.return_value = TEMP_FAHRENHEIT
+        ent.async_write_ha_state()
+        assert hass.states.get("hello.world").state == "20.0"
+
+    state = hass.states.get("hello.world")
+    assert state.attributes[ATTR_UNIT_OF_MEASUREMENT] == TEMP_FAHRENHEIT
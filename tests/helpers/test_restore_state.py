@@ -164,6 +164,48 @@ async def test_dump_data(hass):
     assert written_states[0]["state"]["state"] == "off"
 
 
+async def test_dump_skipped_when_unchanged(hass):
+    """Test that periodic dumps are skipped if no state changed."""
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b1"
+    await entity.async_internal_added_to_hass()
+    hass.states.async_set("input_boolean.b1", "on")
+
+    data = await RestoreStateData.async_get_instance(hass)
+
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states()
+        assert len(mock_write_data.mock_calls) == 1
+
+        # Nothing changed
+        await data.async_dump_states()
+        assert len(mock_write_data.mock_calls) == 1
+
+        # Forced dumps are always written
+        await data.async_dump_states(force=True)
+        assert len(mock_write_data.mock_calls) == 2
+
+        hass.states.async_set("input_boolean.b1", "off")
+        await data.async_dump_states()
+        assert len(mock_write_data.mock_calls) == 3
+
+    written_states = mock_write_data.mock_calls[2][1][0]
+    assert len(written_states) == 1
+    assert written_states[0]["state"]["state"] == "off"
+
+    # Removing the entity moves it to the last states
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await entity.async_remove()
+        await data.async_dump_states()
+
+    assert mock_write_data.called
+
+
 async def test_dump_error(hass):
     """Test that we cache data."""
     states = [
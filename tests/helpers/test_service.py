@@ -286,6 +286,59 @@ def test_async_get_all_descriptions(hass):
     assert "fields" in descriptions[logger.DOMAIN]["set_level"]
 
 
+async def test_async_get_all_descriptions_cached(hass):
+    """Test descriptions are reused until the services change."""
+    group = hass.components.group
+    assert await async_setup_component(hass, group.DOMAIN, {group.DOMAIN: {}})
+    descriptions = await service.async_get_all_descriptions(hass)
+    assert await service.async_get_all_descriptions(hass) is descriptions
+
+    logger = hass.components.logger
+    assert await async_setup_component(hass, logger.DOMAIN, {logger.DOMAIN: {}})
+    new_descriptions = await service.async_get_all_descriptions(hass)
+    assert new_descriptions is not descriptions
+    assert logger.DOMAIN in new_descriptions
+
+    service.async_set_service_schema(
+        hass, logger.DOMAIN, "set_level", {"description": "Changed"}
+    )
+    descriptions = await service.async_get_all_descriptions(hass)
+    assert descriptions[logger.DOMAIN]["set_level"]["description"] == "Changed"
+
+    hass.services.async_remove(logger.DOMAIN, "set_level")
+    descriptions = await service.async_get_all_descriptions(hass)
+    assert "set_level" not in descriptions[logger.DOMAIN]
+
+
+async def test_async_get_all_descriptions_json_cached(hass):
+    """Test serialized descriptions are reused until the descriptions change."""
+    serializer = Mock(side_effect=lambda descriptions: sorted(descriptions))
+    group = hass.components.group
+    assert await async_setup_component(hass, group.DOMAIN, {group.DOMAIN: {}})
+
+    assert await service.async_get_all_descriptions_json(hass, serializer) == [
+        group.DOMAIN
+    ]
+    assert await service.async_get_all_descriptions_json(hass, serializer) == [
+        group.DOMAIN
+    ]
+    assert len(serializer.mock_calls) == 1
+
+    service.async_set_service_schema(
+        hass, group.DOMAIN, "reload", {"description": "Changed"}
+    )
+    await service.async_get_all_descriptions_json(hass, serializer)
+    assert len(serializer.mock_calls) == 2
+
+    logger = hass.components.logger
+    assert await async_setup_component(hass, logger.DOMAIN, {logger.DOMAIN: {}})
+    assert await service.async_get_all_descriptions_json(hass, serializer) == [
+        group.DOMAIN,
+        logger.DOMAIN,
+    ]
+    assert len(serializer.mock_calls) == 3
+
+
 async def test_call_with_required_features(hass, mock_entities):
     """Test service calls invoked only if entity has required feautres."""
     test_service_mock = Mock(return_value=mock_coro())
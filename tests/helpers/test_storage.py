@@ -94,6 +94,61 @@ async def test_saving_on_stop(hass, hass_storage):
     }
 
 
+async def test_delayed_saves_written_in_one_batch(hass, hass_storage):
+    """Test delayed saves that are due together are written in one job."""
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+    store2 = storage.Store(hass, MOCK_VERSION, "storage-test-2")
+    store.async_delay_save(lambda: MOCK_DATA, 1)
+    store2.async_delay_save(lambda: MOCK_DATA2, 1)
+
+    with patch(
+        "homeassistant.helpers.storage._write_batch", side_effect=storage._write_batch,
+    ) as mock_write_batch:
+        async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
+
+    assert len(mock_write_batch.mock_calls) == 1
+    assert hass_storage[store.key]["data"] == MOCK_DATA
+    assert hass_storage[store2.key]["data"] == MOCK_DATA2
+
+
+async def test_write_error_in_batch(hass, hass_storage, caplog):
+    """Test a failing store does not affect the other stores in a batch."""
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+    store2 = storage.Store(hass, MOCK_VERSION, "storage-test-2")
+
+    with patch.object(
+        store, "_write_data", side_effect=storage.json_util.WriteError("Boom")
+    ):
+        await asyncio.gather(store.async_save(MOCK_DATA), store2.async_save(MOCK_DATA2))
+
+    assert "Error writing config for storage-test: Boom" in caplog.text
+    assert store.key not in hass_storage
+    assert hass_storage[store2.key]["data"] == MOCK_DATA2
+
+
+async def test_executor_error_in_batch(hass, hass_storage):
+    """Test all stores in a batch get the error if the job can not run."""
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+    store2 = storage.Store(hass, MOCK_VERSION, "storage-test-2")
+
+    with patch.object(
+        hass, "async_add_executor_job", side_effect=RuntimeError("Shut down")
+    ):
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                store.async_save(MOCK_DATA),
+                store2.async_save(MOCK_DATA2),
+                return_exceptions=True,
+            ),
+            5,
+        )
+
+    assert [str(result) for result in results] == ["Shut down", "Shut down"]
+    assert store.key not in hass_storage
+    assert store2.key not in hass_storage
+
+
 async def test_loading_while_delay(hass, store, hass_storage):
     """Test we load new data even if not written yet."""
     await store.async_save({"delay": "no"})
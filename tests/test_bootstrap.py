@@ -5,6 +5,8 @@ import logging
 import os
 from unittest.mock import Mock, patch
 
+import pytest
+
 from homeassistant import bootstrap
 import homeassistant.config as config_util
 import homeassistant.util.dt as dt_util
@@ -23,6 +25,13 @@ VERSION_PATH = os.path.join(get_test_config_dir(), config_util.VERSION_FILE)
 _LOGGER = logging.getLogger(__name__)
 
 
+@pytest.fixture(autouse=True)
+def mock_enable_yaml_cache():
+    """Prevent the YAML cache from being enabled for other tests."""
+    with patch("homeassistant.bootstrap.enable_cache") as mock_enable:
+        yield mock_enable
+
+
 # prevent .HA_VERSION file from being written
 @patch("homeassistant.bootstrap.conf_util.process_ha_config_upgrade", Mock())
 @patch(
@@ -32,7 +41,7 @@ _LOGGER = logging.getLogger(__name__)
 @patch("os.path.isfile", Mock(return_value=True))
 @patch("os.access", Mock(return_value=True))
 @patch("homeassistant.bootstrap.async_enable_logging", Mock(return_value=True))
-def test_from_config_file(hass):
+def test_from_config_file(hass, mock_enable_yaml_cache):
     """Test with configuration file."""
     components = set(["browser", "conversation", "script"])
     files = {"config.yaml": "".join("{}:\n".format(comp) for comp in components)}
@@ -41,6 +50,9 @@ def test_from_config_file(hass):
         yield from bootstrap.async_from_config_file("config.yaml", hass)
 
     assert components == hass.config.components
+    mock_enable_yaml_cache.assert_called_once_with(
+        hass.config.path(".storage", config_util.YAML_CACHE_FILE), "config.yaml"
+    )
 
 
 @patch("homeassistant.bootstrap.async_enable_logging", Mock())
@@ -67,6 +67,9 @@ def test_ensure_unique_string():
     """Test ensure_unique_string."""
     assert util.ensure_unique_string("Beer", ["Beer", "Beer_2"]) == "Beer_3"
     assert util.ensure_unique_string("Beer", ["Wine", "Soda"]) == "Beer"
+    assert (
+        util.ensure_unique_string("Beer", {"Beer": 1, "Beer_2": 2}.keys()) == "Beer_3"
+    )
 
 
 def test_ordered_enum():
@@ -4,12 +4,18 @@ import os
 import sys
 from tempfile import mkdtemp
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.util.json import SerializationError, load_json, save_json
+from homeassistant.util import json as json_util
+from homeassistant.util.json import (
+    SerializationError,
+    dumps_minified,
+    load_json,
+    save_json,
+)
 
 # Test data that can be saved as JSON
 TEST_JSON_A = {"a": 1, "B": "two"}
@@ -99,3 +105,40 @@ def test_custom_encoder():
     save_json(fname, Mock(), encoder=MockJSONEncoder)
     data = load_json(fname)
     assert data == "9"
+
+
+def test_save_minified():
+    """Test saving minified JSON and loading it back."""
+    fname = _path_for("test7")
+    save_json(fname, TEST_JSON_A, minify=True)
+    with open(fname) as fh:
+        assert fh.read() == '{"a":1,"B":"two"}'
+    data = load_json(fname)
+    assert data == TEST_JSON_A
+
+
+@pytest.mark.parametrize("orjson", [None, json_util.orjson])
+def test_dumps_minified(orjson):
+    """Test minified serialization with and without orjson."""
+
+    class MockJSONEncoder(JSONEncoder):
+        """Mock JSON encoder."""
+
+        def default(self, o):
+            """Mock JSON encode method."""
+            return "9"
+
+    with patch.object(json_util, "orjson", orjson):
+        assert dumps_minified({"a": [1, "b"], 2: None}) == '{"a":[1,"b"],"2":null}'
+        assert dumps_minified({"a": Mock()}, MockJSONEncoder) == '{"a":"9"}'
+
+        with pytest.raises(TypeError):
+            dumps_minified(TEST_BAD_OBJECT)
+
+
+def test_save_custom_dumps():
+    """Test saving with a custom serializer."""
+    fname = _path_for("test8")
+    save_json(fname, TEST_JSON_A, dumps=lambda data, encoder: '"custom"')
+    data = load_json(fname)
+    assert data == "custom"
@@ -0,0 +1,37 @@
+"""Test Home Assistant shared fetch utility functions."""
+from unittest.mock import Mock, patch
+
+from homeassistant.util import shared_fetch
+
+
+def test_result_shared_once_per_consumer():
+    """Test every consumer gets a fetched result once."""
+    fetches = shared_fetch.SharedFetches()
+    fetch = Mock(side_effect=[1, 2])
+
+    assert fetches.get("key", "a", fetch) == 1
+    assert fetches.get("key", "b", fetch) == 1
+    assert fetch.call_count == 1
+
+    assert fetches.get("key", "a", fetch) == 2
+    assert fetch.call_count == 2
+
+
+def test_result_not_shared_between_keys():
+    """Test results of different resources are not shared."""
+    fetches = shared_fetch.SharedFetches()
+
+    assert fetches.get("one", "a", lambda: 1) == 1
+    assert fetches.get("two", "b", lambda: 2) == 2
+
+
+def test_result_expires():
+    """Test an old result is fetched again."""
+    fetches = shared_fetch.SharedFetches(max_age=10)
+    fetch = Mock(side_effect=[1, 2])
+
+    with patch.object(shared_fetch, "monotonic", return_value=100):
+        assert fetches.get("key", "a", fetch) == 1
+
+    with patch.object(shared_fetch, "monotonic", return_value=110):
+        assert fetches.get("key", "b", fetch) == 2
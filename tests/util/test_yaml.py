@@ -1,5 +1,6 @@
 """Test Home Assistant yaml loader."""
 import io
+import json
 import logging
 import os
 import unittest
@@ -461,3 +462,169 @@ def test_duplicate_key(caplog):
     with patch_yaml_files(files):
         load_yaml_config_file(YAML_CONFIG_FILE)
     assert "contains duplicate key" in caplog.text
+
+
+def test_line_numbers_with_c_loader(tmp_path):
+    """Test the fast loader keeps track of file and line numbers."""
+    conf = tmp_path / "configuration.yaml"
+    conf.write_text("first: 1\nsecond:\n  - item\n")
+
+    with patch.object(
+        yaml_loader, "SafeLineLoader", side_effect=AssertionError
+    ), patch.object(yaml_loader.yaml, "load", wraps=yaml_loader.yaml.load) as load:
+        data = yaml.load_yaml(str(conf))
+
+    assert load.call_args[1]["Loader"] is yaml_loader.FastSafeLoader
+    assert data["second"] == ["item"]
+    assert data["second"].__config_file__ == str(conf)
+    assert data["second"].__line__ == 2
+
+
+def test_error_with_c_loader(tmp_path, caplog):
+    """Test errors of the fast loader contain the faulty line."""
+    conf = tmp_path / "configuration.yaml"
+    conf.write_text("key: value\nbroken: item: value\n")
+
+    with pytest.raises(HomeAssistantError):
+        yaml.load_yaml(str(conf))
+
+    assert 'configuration.yaml", line 2' in caplog.text
+
+
+@pytest.fixture
+def yaml_cache(tmp_path):
+    """Enable the YAML cache for configuration.yaml in tmp_path."""
+    cache_path = str(tmp_path / ".storage" / "yaml_cache")
+    yaml.enable_cache(cache_path, str(tmp_path / YAML_CONFIG_FILE))
+    yield cache_path
+    yaml.enable_cache(None)
+
+
+def test_cache(tmp_path, yaml_cache):
+    """Test unchanged files are loaded from the cache."""
+    conf = tmp_path / YAML_CONFIG_FILE
+    conf.write_text("key: value\ninclude: !include included.yaml\n")
+    included = tmp_path / "included.yaml"
+    included.write_text("- item\n- 1\n- true\n")
+
+    assert yaml.load_yaml(str(conf)) == {"key": "value", "include": ["item", 1, True]}
+    yaml.save_cache()
+
+    # Loaded from disk after a restart
+    yaml.enable_cache(None)
+    yaml.enable_cache(yaml_cache, str(conf))
+    with patch.object(yaml_loader.yaml, "load") as load:
+        data = yaml.load_yaml(str(conf))
+    assert len(load.mock_calls) == 0
+    assert data == {"key": "value", "include": ["item", 1, True]}
+    assert data.__config_file__ == str(conf)
+    assert data["include"].__config_file__ == str(conf)
+    assert data["include"].__line__ == 1
+    assert isinstance(data["include"], yaml_loader.NodeListClass)
+
+    # Included file changed
+    included.write_text("- item\n- other\n")
+    with patch.object(yaml_loader.yaml, "load", wraps=yaml_loader.yaml.load) as load:
+        data = yaml.load_yaml(str(conf))
+    assert len(load.mock_calls) == 2
+    assert data == {"key": "value", "include": ["item", "other"]}
+
+
+def test_cache_dependencies(tmp_path, yaml_cache):
+    """Test cached files are parsed again if their dependencies change."""
+    conf = tmp_path / YAML_CONFIG_FILE
+    conf.write_text(
+        "password: !secret password\n"
+        "user: !env_var CACHE_USER\n"
+        "dir: !include_dir_list items\n"
+    )
+    (tmp_path / "secrets.yaml").write_text("password: pwd1\n")
+    items = tmp_path / "items"
+    items.mkdir()
+    (items / "one.yaml").write_text("1\n")
+
+    with patch.dict(os.environ, {"CACHE_USER": "paulus"}):
+        assert yaml.load_yaml(str(conf)) == {
+            "password": "pwd1",
+            "user": "paulus",
+            "dir": [1],
+        }
+
+        (items / "two.yaml").write_text("2\n")
+        assert yaml.load_yaml(str(conf))["dir"] == [1, 2]
+
+        (tmp_path / "secrets.yaml").write_text("password: secret2\n")
+        yaml.clear_secret_cache()
+        assert yaml.load_yaml(str(conf))["password"] == "secret2"
+
+    with patch.dict(os.environ, {"CACHE_USER": "balloob"}):
+        assert yaml.load_yaml(str(conf))["user"] == "balloob"
+
+
+def test_cache_does_not_store_secrets(tmp_path, yaml_cache):
+    """Test files with resolved secrets are only cached in memory."""
+    conf = tmp_path / YAML_CONFIG_FILE
+    conf.write_text("http: !include http.yaml\nname: !include name.yaml\n")
+    (tmp_path / "http.yaml").write_text("api_password: !secret http_pw\n")
+    (tmp_path / "name.yaml").write_text("Home\n")
+    (tmp_path / "secrets.yaml").write_text("http_pw: pwhttp\n")
+
+    assert yaml.load_yaml(str(conf))["http"] == {"api_password": "pwhttp"}
+    with patch.object(yaml_loader.yaml, "load") as load:
+        assert yaml.load_yaml(str(conf))["http"] == {"api_password": "pwhttp"}
+    assert len(load.mock_calls) == 0
+    yaml.save_cache()
+
+    with open(yaml_cache) as cache_file:
+        content = cache_file.read()
+    assert "pwhttp" not in content
+    assert set(json.loads(content)["files"]) == {str(tmp_path / "name.yaml")}
+
+    # Files with secrets are parsed again after a restart, name.yaml is not
+    yaml.enable_cache(None)
+    yaml.enable_cache(yaml_cache, str(conf))
+    with patch.object(yaml_loader.yaml, "load", wraps=yaml_loader.yaml.load) as load:
+        assert yaml.load_yaml(str(conf))["http"] == {"api_password": "pwhttp"}
+    assert len(load.mock_calls) == 2
+
+
+def test_cache_only_configuration(tmp_path, yaml_cache):
+    """Test files outside of the configuration are not cached."""
+    known_devices = tmp_path / "known_devices.yaml"
+    known_devices.write_text("device:\n  name: Phone\n")
+
+    assert yaml.load_yaml(str(known_devices)) == {"device": {"name": "Phone"}}
+    with patch.object(yaml_loader.yaml, "load", wraps=yaml_loader.yaml.load) as load:
+        assert yaml.load_yaml(str(known_devices)) == {"device": {"name": "Phone"}}
+    assert len(load.mock_calls) == 1
+
+    yaml.save_cache()
+    assert not os.path.exists(yaml_cache)
+
+
+def test_cache_invalid_file(tmp_path, yaml_cache):
+    """Test an invalid cache file is ignored."""
+    conf = tmp_path / YAML_CONFIG_FILE
+    conf.write_text("key: value\n")
+    os.makedirs(os.path.dirname(yaml_cache))
+    with open(yaml_cache, "w") as cache_file:
+        cache_file.write("not json")
+
+    assert yaml.load_yaml(str(conf)) == {"key": "value"}
+    yaml.save_cache()
+
+    with open(yaml_cache) as cache_file:
+        assert str(conf) in json.loads(cache_file.read())["files"]
+
+
+def test_cache_skips_missing_files():
+    """Test files that are not on disk are not cached."""
+    yaml.enable_cache(os.path.join(get_test_config_dir(), "yaml_cache"), "config.yaml")
+    try:
+        with patch_yaml_files({"config.yaml": "key: value"}):
+            assert yaml.load_yaml("config.yaml") == {"key": "value"}
+        yaml.save_cache()
+    finally:
+        yaml.enable_cache(None)
+
+    assert not os.path.exists(os.path.join(get_test_config_dir(), "yaml_cache"))